@@ -0,0 +1,328 @@
+"""
+Benchmark suite for the InfoBIM IFC capabilities and renderers.
+
+Synthetic models are generated (and kept in the work directory) for each
+requested size, then every case runs in a fresh interpreter so wall time
+and peak RSS are not polluted by earlier cases. Each case also gets an empty
+cache directory and bypasses the result cache, so a run never reads what an
+earlier one stored. Everything runs offline.
+
+    python -m benchmarks.run --sizes 1000,10000 --output results.json
+    python -m benchmarks.run --sizes 1000,10000 --baseline results.json
+
+With --baseline, cases slower than the baseline by more than --tolerance
+are reported as regressions and the exit code is 1. A case that builds a
+derived model index (material, spatial) more than once is always reported
+and fails the run; after warm_model (list_elements_warm) none may be built.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
+
+
+CASES = [
+    "open",
+    "list_elements",
+    "list_elements_storey",
+    "list_elements_warm",
+    "list_buildings",
+    "list_property_sets",
+    "inspect_element",
+    "render_json",
+    "render_json_legacy",
+    "render_json_compact",
+    "render_ndjson",
+    "render_rich",
+    "discovery",
+    "discovery_legacy",
+]
+SIZE_ALIASES = {"1k": 1000, "10k": 10000, "100k": 100000, "1m": 1000000}
+
+# Derived indexes a case may build on its one model: material and spatial
+MAX_INDEX_BUILDS = 2
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _context(**parameters: Any) -> Any:
+    from infobim.run.worker.context import WorkerContext
+
+    context = WorkerContext([])
+    # Measure the computation, not a read of the persistent result cache
+    parameters.setdefault("no_cache", True)
+    for name, value in parameters.items():
+        context.add_parameter(name, {"value": value})
+    return context
+
+
+def _run_capability(capability_class: Any, **parameters: Any) -> Dict[str, Any]:
+    return capability_class().execute(_context(**parameters))
+
+
+def run_discovery_case(case: str) -> Dict[str, Any]:
+    """
+    Times loading the capability and action catalog in a fresh interpreter, imports included.
+    'discovery' reads the static manifest; 'discovery_legacy' imports every plugin module
+    along with the libraries they used to import at load.
+    """
+    start = time.perf_counter()
+    if case == "discovery":
+        from infobim.module.ifc.plugin.manifest import load_manifest
+
+        manifest = load_manifest()
+    else:
+        import rich.console
+        import ifcopenshell
+        import ifcopenshell.util.element
+        from infobim.module.ifc.plugin.manifest import build_manifest
+
+        manifest = build_manifest()
+    wall = time.perf_counter() - start
+
+    items = len(manifest["capabilities"]) + len(manifest["actions"])
+    return {
+        "case": case,
+        "wall_s": wall,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "items": items,
+        "items_per_s": items / wall if wall > 0 else None,
+    }
+
+
+def run_case(case: str, ifc_path: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs one case in this process and returns its measurements.
+    The model is parsed first (outside the timed section) except for the 'open' case.
+    """
+    if case.startswith("discovery"):
+        # Must run before anything below imports the plugin modules
+        return run_discovery_case(case)
+
+    from infobim.module.ifc.util.model import get_model_registry, open_model
+    from infobim.module.ifc.plugin.capability import (
+        InspectIfcElementCapability, ListIfcBuildingsCapability,
+        ListIfcElementsCapability, ListIfcPropertySetsCapability,
+    )
+
+    global_ids = metadata.get("sample_global_ids") or []
+    items = metadata.get("element_count", 0)
+
+    if case == "list_elements_warm":
+        from infobim.module.ifc.util.warm import warm_model
+
+        warm_model(ifc_path)
+    elif case != "open":
+        open_model(ifc_path)
+
+    operation: Callable[[], Any]
+    if case == "open":
+        operation = lambda: open_model(ifc_path)
+    elif case == "list_elements":
+        operation = lambda: _run_capability(ListIfcElementsCapability, ifc_path=ifc_path)
+    elif case in ("list_elements_storey", "list_elements_warm"):
+        # Material and Storey columns, filtered on a storey: both derived indexes
+        operation = lambda: _run_capability(
+            ListIfcElementsCapability, ifc_path=ifc_path,
+            columns="GlobalId,Name,Material,Storey", where="Storey=Level 00",
+        )
+    elif case == "list_buildings":
+        operation = lambda: _run_capability(ListIfcBuildingsCapability, ifc_path=ifc_path)
+    elif case == "list_property_sets":
+        items = len(global_ids)
+        operation = lambda: [_run_capability(ListIfcPropertySetsCapability, ifc_path=ifc_path, global_id=g) for g in global_ids]
+    elif case == "inspect_element":
+        items = len(global_ids)
+        operation = lambda: [_run_capability(InspectIfcElementCapability, ifc_path=ifc_path, global_id=g) for g in global_ids]
+    elif case.startswith("render_"):
+        from rich.console import Console
+        from infobim.module.ifc.adapter.renderer.file_list import IfcElementsListRenderer
+        from infobim.module.ifc.adapter.renderer.output import set_output_options
+
+        result = _run_capability(ListIfcElementsCapability, ifc_path=ifc_path)
+        output_format = "rich" if case == "render_rich" else "json"
+        style = {"render_json_compact": "compact", "render_ndjson": "ndjson"}.get(case, "pretty")
+        set_output_options(style=style)
+
+        def operation():
+            sink = io.StringIO()
+            stdout = sys.stdout
+            sys.stdout = sink
+            try:
+                if case == "render_json_legacy":
+                    # The single pretty-printed string renderers used to build
+                    print(json.dumps(result, indent=2, default=str))
+                else:
+                    IfcElementsListRenderer().render(Console(file=sink, width=200), result, output_format)
+            finally:
+                sys.stdout = stdout
+            return sink.tell()
+    else:
+        raise ValueError(f"Unknown benchmark case: {case}")
+
+    index_builds = get_model_registry().stats()["index_builds"]
+    start = time.perf_counter()
+    output = operation()
+    wall = time.perf_counter() - start
+
+    measurement = {
+        "case": case,
+        "wall_s": wall,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "items": items,
+        "items_per_s": items / wall if wall > 0 else None,
+    }
+    if case.startswith("render_"):
+        measurement["output_bytes"] = output
+    # Indexes are built once per model, never per element
+    measurement["index_builds"] = get_model_registry().stats()["index_builds"] - index_builds
+    return measurement
+
+
+def ensure_model(size: int, workdir: str) -> str:
+    """
+    Returns the path of the synthetic model of the given size, generating it once.
+    """
+    os.makedirs(workdir, exist_ok=True)
+    path = os.path.join(workdir, f"synthetic_{size}.ifc")
+    if not os.path.exists(path) or not os.path.exists(path + ".json"):
+        from benchmarks.synthetic import write_model
+        print(f"Generating {size} element model at {path} ...", file=sys.stderr)
+        write_model(size, path)
+    return path
+
+
+def run_isolated(case: str, ifc_path: str) -> Dict[str, Any]:
+    """
+    Runs a case in a fresh interpreter, with an empty cache directory, and returns
+    its measurements.
+    """
+    from infobim.module.ifc.util.cache import CACHE_DIR_ENV
+
+    cmd = [sys.executable, "-m", "benchmarks.run", "--case", case, "--ifc-path", ifc_path]
+    cache_dir = tempfile.mkdtemp(prefix="infobim-benchmark-")
+    try:
+        env = dict(os.environ, **{CACHE_DIR_ENV: cache_dir})
+        completed = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    if completed.returncode != 0:
+        return {"case": case, "error": completed.stderr.strip().splitlines()[-1:] or ["failed"]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Returns one entry per case present in both runs, flagging wall time regressions.
+    """
+    previous = {(r["size"], r["case"]): r for r in baseline.get("results", []) if "wall_s" in r}
+    report = []
+    for r in results["results"]:
+        before = previous.get((r["size"], r["case"]))
+        if before is None or "wall_s" not in r:
+            continue
+        ratio = r["wall_s"] / before["wall_s"] if before["wall_s"] > 0 else None
+        report.append({
+            "size": r["size"],
+            "case": r["case"],
+            "baseline_s": before["wall_s"],
+            "current_s": r["wall_s"],
+            "ratio": ratio,
+            "regression": ratio is not None and ratio > 1.0 + tolerance,
+        })
+    return report
+
+
+def parse_sizes(value: str) -> List[int]:
+    sizes = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if item:
+            sizes.append(SIZE_ALIASES.get(item) or int(item))
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark InfoBIM IFC capabilities on synthetic models.")
+    parser.add_argument("--sizes", default="1k,10k", help="Comma separated element counts (1k, 10k, 100k, 1m or integers).")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma separated cases to run.")
+    parser.add_argument("--workdir", default=os.path.join("data", "benchmark"), help="Where synthetic models are kept.")
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare against a previous results file.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before flagging a regression.")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--ifc-path", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # Child mode: run a single case and print its measurements
+    if args.case:
+        with open(args.ifc_path + ".json", "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        print(json.dumps(run_case(args.case, args.ifc_path, metadata)))
+        return 0
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": [],
+    }
+
+    for size in parse_sizes(args.sizes):
+        ifc_path = ensure_model(size, args.workdir)
+        for case in cases:
+            measurement = run_isolated(case, ifc_path)
+            measurement["size"] = size
+            results["results"].append(measurement)
+            if "error" in measurement:
+                print(f"{size:>8} {case:<20} ERROR {measurement['error']}", file=sys.stderr)
+            else:
+                rate = measurement["items_per_s"]
+                print(
+                    f"{size:>8} {case:<20} {measurement['wall_s']:>9.3f} s "
+                    f"{measurement['peak_rss_bytes'] / 1048576:>9.1f} MB "
+                    f"{(f'{rate:,.0f} items/s' if rate else ''):>18}",
+                    file=sys.stderr,
+                )
+
+    exit_code = 0
+    for r in results["results"]:
+        max_builds = 0 if r["case"] == "list_elements_warm" else MAX_INDEX_BUILDS
+        if r.get("index_builds", 0) > max_builds:
+            exit_code = 1
+            print(f"INDEX REBUILDS {r['size']} {r['case']}: {r['index_builds']} index builds", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        results["comparison"] = compare(results, baseline, args.tolerance)
+        for entry in results["comparison"]:
+            if entry["regression"]:
+                exit_code = 1
+                print(f"REGRESSION {entry['size']} {entry['case']}: {entry['ratio']:.2f}x baseline", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
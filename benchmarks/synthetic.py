@@ -0,0 +1,172 @@
+"""
+Synthetic IFC4 model generator for the InfoBIM benchmarks.
+
+Elements are built with the same construction code as
+CreateExtrudedElementAction (placement, extruded body, instance), and the
+model is completed with a spatial structure, type objects, property sets
+and material associations so every capability has real work to do.
+
+    python -m benchmarks.synthetic --elements 10000 --output /tmp/bench_10k.ifc
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from typing import Any, Dict, List
+
+import ifcopenshell
+from infobim.module.ifc.plugin.action.create_extruded_element import CreateExtrudedElementAction
+
+
+# (occurrence class, type class, property set, layered material)
+ELEMENT_KINDS = [
+    ("IfcWall", "IfcWallType", "Pset_WallCommon", True),
+    ("IfcSlab", "IfcSlabType", "Pset_SlabCommon", True),
+    ("IfcColumn", "IfcColumnType", "Pset_ColumnCommon", False),
+    ("IfcBeam", "IfcBeamType", "Pset_BeamCommon", False),
+    ("IfcDoor", "IfcDoorType", "Pset_DoorCommon", False),
+    ("IfcWindow", "IfcWindowType", "Pset_WindowCommon", False),
+]
+TYPES_PER_KIND = 4
+ELEMENTS_PER_STOREY = 2500
+MAX_STOREYS = 40
+
+
+def _label(ifc_file, value: str):
+    return ifc_file.createIfcLabel(value)
+
+
+def _property(ifc_file, name: str, value) -> Any:
+    return ifc_file.createIfcPropertySingleValue(name, None, value, None)
+
+
+def generate_model(element_count: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    Builds a synthetic IFC4 model with `element_count` building elements.
+    Returns {"model": ifcopenshell.file, "sample_global_ids": [...], ...}.
+    """
+    rng = random.Random(seed)
+    action = CreateExtrudedElementAction()
+    guid = action._create_guid
+    f = ifcopenshell.file(schema="IFC4")
+
+    # --- Project, units and representation context ---
+    origin = f.createIfcAxis2Placement3D(f.createIfcCartesianPoint((0.0, 0.0, 0.0)))
+    context = f.createIfcGeometricRepresentationContext(None, "Model", 3, 1.0e-5, origin, None)
+    units = f.createIfcUnitAssignment([f.createIfcSIUnit(None, "LENGTHUNIT", None, "METRE")])
+    project = f.createIfcProject(guid(), None, "Benchmark Project", None, None, None, None, [context], units)
+
+    # --- Spatial structure ---
+    site = f.createIfcSite(guid(), None, "Site", None, None, f.createIfcLocalPlacement(None, origin))
+    building = f.createIfcBuilding(guid(), None, "Building", None, None, f.createIfcLocalPlacement(site.ObjectPlacement, origin))
+    storey_count = max(1, min(MAX_STOREYS, element_count // ELEMENTS_PER_STOREY))
+    storeys = []
+    for i in range(storey_count):
+        storey = f.createIfcBuildingStorey(
+            guid(), None, f"Level {i:02d}", None, None,
+            f.createIfcLocalPlacement(building.ObjectPlacement, origin), None, None, "ELEMENT", float(i) * 3.0,
+        )
+        storeys.append(storey)
+    f.createIfcRelAggregates(guid(), None, None, None, project, [site])
+    f.createIfcRelAggregates(guid(), None, None, None, site, [building])
+    f.createIfcRelAggregates(guid(), None, None, None, building, storeys)
+
+    # --- Materials and type objects ---
+    materials = [f.createIfcMaterial(name) for name in ["Concrete", "Steel", "Timber", "Brick", "Glass", "Gypsum"]]
+    types: List[List[Any]] = []
+    for occurrence_class, type_class, pset_name, layered in ELEMENT_KINDS:
+        kind_types = []
+        for t in range(TYPES_PER_KIND):
+            type_pset = f.createIfcPropertySet(guid(), None, pset_name, None, [
+                _property(f, "Reference", f.createIfcIdentifier(f"{type_class[3:-4]}-{t}")),
+                _property(f, "FireRating", _label(f, rng.choice(["EI30", "EI60", "EI90", "EI120"]))),
+            ])
+            element_type = f.create_entity(
+                type_class, GlobalId=guid(), Name=f"{type_class[3:-4]} Type {t}",
+                HasPropertySets=[type_pset], PredefinedType="NOTDEFINED",
+            )
+            if layered:
+                layers = [f.createIfcMaterialLayer(rng.choice(materials), 0.1 + 0.05 * l, None) for l in range(3)]
+                material = f.createIfcMaterialLayerSet(layers, f"{type_class[3:-4]} Layers {t}", None)
+            else:
+                material = rng.choice(materials)
+            f.createIfcRelAssociatesMaterial(guid(), None, None, None, [element_type], material)
+            kind_types.append(element_type)
+        types.append(kind_types)
+
+    # --- Elements ---
+    by_storey: Dict[int, List[Any]] = {}
+    by_type: Dict[int, List[Any]] = {}
+    direct_material: List[Any] = []
+    sample_global_ids = []
+    for i in range(element_count):
+        kind = i % len(ELEMENT_KINDS)
+        occurrence_class, _, pset_name, _ = ELEMENT_KINDS[kind]
+        element = action.create_element(
+            f, context, f"{occurrence_class[3:]} {i:07d}",
+            rng.uniform(0, 500), rng.uniform(0, 500),
+            rng.uniform(0.1, 3.0), rng.uniform(0.1, 1.0), rng.uniform(0.5, 8.0),
+            occurrence_class,
+        )
+
+        pset = f.createIfcPropertySet(guid(), None, pset_name, None, [
+            _property(f, "IsExternal", f.createIfcBoolean(rng.random() < 0.3)),
+            _property(f, "LoadBearing", f.createIfcBoolean(rng.random() < 0.5)),
+            _property(f, "Status", _label(f, rng.choice(["New", "Existing", "Demolish"]))),
+        ])
+        f.createIfcRelDefinesByProperties(guid(), None, None, None, [element], pset)
+
+        element_type = types[kind][rng.randrange(TYPES_PER_KIND)]
+        by_type.setdefault(element_type.id(), [element_type]).append(element)
+        by_storey.setdefault(i % storey_count, []).append(element)
+        if i % 10 == 0:
+            direct_material.append(element)
+        if len(sample_global_ids) < 32 and rng.random() < 0.01 + 32.0 / max(element_count, 1):
+            sample_global_ids.append(element.GlobalId)
+
+    for members in by_type.values():
+        f.createIfcRelDefinesByType(guid(), None, None, None, members[1:], members[0])
+    for storey_idx, members in by_storey.items():
+        action.add_to_structure(f, storeys[storey_idx], members)
+    if direct_material:
+        f.createIfcRelAssociatesMaterial(guid(), None, None, None, direct_material, materials[0])
+
+    return {
+        "model": f,
+        "element_count": element_count,
+        "storey_count": storey_count,
+        "sample_global_ids": sample_global_ids,
+    }
+
+
+def write_model(element_count: int, output_path: str, seed: int = 42) -> Dict[str, Any]:
+    """
+    Generates a model and writes it along with a '<output>.json' metadata file.
+    """
+    generated = generate_model(element_count, seed)
+    generated["model"].write(output_path)
+
+    metadata = {k: v for k, v in generated.items() if k != "model"}
+    metadata["seed"] = seed
+    metadata["size"] = os.path.getsize(output_path)
+    with open(output_path + ".json", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic IFC4 benchmark model.")
+    parser.add_argument("--elements", type=int, required=True, help="Number of building elements.")
+    parser.add_argument("--output", required=True, help="Path of the IFC file to write.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    metadata = write_model(args.elements, args.output, args.seed)
+    print(json.dumps(metadata, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,145 @@
 import sys
+import json
 import subprocess
 import os
-import importlib.resources
+
+
+def serve(args):
+    """
+    Starts the resident worker that answers forwarded `run` requests,
+    optionally watching a directory for new IFC files.
+    """
+    from infobim.run.worker.server import serve as serve_worker
+
+    socket_path = None
+    if "--socket" in args:
+        idx = args.index("--socket")
+        if idx + 1 >= len(args):
+            print("Error: Missing value for --socket.", file=sys.stderr)
+            sys.exit(1)
+        socket_path = args[idx + 1]
+
+    # --watch [DIR]: pre-warm new or changed models (default: data/incoming)
+    watch_directory = None
+    if "--watch" in args:
+        from infobim.run.worker.watch import DEFAULT_WATCH_DIRECTORY
+        idx = args.index("--watch")
+        if idx + 1 < len(args) and not args[idx + 1].startswith("--"):
+            watch_directory = args[idx + 1]
+        else:
+            watch_directory = DEFAULT_WATCH_DIRECTORY
+
+    watch_interval = None
+    if "--watch-interval" in args:
+        idx = args.index("--watch-interval")
+        try:
+            watch_interval = float(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --watch-interval needs a number of seconds.", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        serve_worker(socket_path, watch_directory, watch_interval)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def batch(args):
+    """
+    Runs several capabilities concurrently over shared models. Reads a JSON array of
+    argument lists (e.g. [["--id", "...", "--ifc-path", "model.ifc"], ...]) from FILE
+    or stdin and prints one JSON record per request, in order.
+    """
+    try:
+        if args and args[0] != "-":
+            with open(args[0], "r", encoding="utf-8") as f:
+                requests = json.load(f)
+        else:
+            requests = json.load(sys.stdin)
+        requests = [[str(a) for a in request] for request in requests]
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Error: Invalid batch request: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    # Served by the resident worker when one is listening, otherwise in this process
+    from infobim.run.worker.client import forward_batch
+    code = forward_batch(requests)
+    if code is None:
+        from infobim.run.worker.server import CapabilityWorker
+        code = CapabilityWorker().handle_batch(requests, sys.stdout)
+    sys.exit(code)
+
+
+def discover(args):
+    """
+    Answers `run --json` (the capability and action catalog) and `run --help` from
+    the static plugin manifest, without importing any plugin module. Returns the
+    exit code, or None for other commands.
+    """
+    if len(args) != 2 or args[0] != "run" or args[1] not in ("--json", "--help", "-h"):
+        return None
+
+    from infobim.module.ifc.plugin.manifest import load_manifest
+
+    manifest = load_manifest()
+    if args[1] == "--json":
+        catalog = {
+            "capabilities": [entry["metadata"] for entry in manifest["capabilities"]],
+            "actions": [entry["metadata"] for entry in manifest["actions"]],
+        }
+        print(json.dumps(catalog, indent=2, ensure_ascii=False))
+        return 0
+
+    print("Usage: infobim run [OPTIONS]")
+    print("")
+    print("Options:")
+    print("  --id <ID>          Run specific capability by ID")
+    print("  --json             Print the capability catalog as JSON")
+    print("  --export json|rich Output format of the capability result")
+    print("  --no-cache         Recompute the result instead of reading the result cache")
+    print("  --help, -h         Show this help message")
+    print("")
+    print("Capabilities:")
+    for entry in manifest["capabilities"]:
+        metadata = entry["metadata"]
+        print(f"  {metadata['id']}")
+        print(f"      {metadata.get('name') or metadata.get('description') or ''}")
+    print("")
+    return 0
 
 
 def main():
+    args = sys.argv[1:]
+
+    if args and args[0] == "serve":
+        serve(args[1:])
+        return
+
+    if args and args[0] == "batch":
+        batch(args[1:])
+        return
+
+    code = discover(args)
+    if code is not None:
+        sys.exit(code)
+
+    # Forward capability runs to the resident worker when one is listening
+    from infobim.run.worker.client import forward
+    code = forward(args)
+    if code is not None:
+        sys.exit(code)
+
+    # Results already in the persistent cache are printed without starting the full CLI
+    if args and args[0] == "run" and "--no-cache" not in args:
+        from infobim.run.worker.server import CapabilityWorker
+        code = CapabilityWorker().handle_cached(args)
+        if code is not None:
+            sys.exit(code)
+
     # Try to find the infobim.sh script within the installed package
+    # (importlib.resources is imported here: it is slow to load and discovery does not need it)
+    import importlib.resources
     try:
         # Use importlib.resources to find the file
         # For python >= 3.9
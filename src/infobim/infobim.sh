@@ -27,6 +27,8 @@ if [[ "$1" == "--help" || "$1" == "-h" || -z "$1" ]]; then
     echo -e "  ${CYAN}setup${RESET}     ${GRAY}Create infobim config file with engine (venv|colab)${RESET}"
     echo -e "  ${CYAN}run${RESET}       ${GRAY}Run a capability via infobim run${RESET}"
     echo -e "  ${CYAN}plan${RESET}      ${GRAY}Plan capability execution${RESET}"
+    echo -e "  ${CYAN}serve${RESET}     ${GRAY}Start a resident worker that keeps capabilities and models warm (--watch DIR pre-warms new models)${RESET}"
+    echo -e "  ${CYAN}batch${RESET}     ${GRAY}Run several capabilities concurrently from a JSON list of argument lists (FILE or stdin)${RESET}"
     echo ""
     exit 0
 fi
@@ -0,0 +1,56 @@
+
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+def format_point(point: Any) -> str:
+    return "(" + ", ".join(f"{v:.3f}" for v in point) + ")"
+
+
+class IfcBoundingBoxListRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        rows = result.get("org.infobim.domain.ifc.bbox.list.content", [])
+        index = result.get("org.infobim.domain.ifc.bbox.index", {})
+
+        if index.get("built"):
+            console.print(f"[dim]Computed {index.get('boxes', 0)} bounding boxes (cached for later queries).[/dim]")
+
+        if not rows:
+            console.print("[yellow]No elements found.[/yellow]")
+            return
+
+        with_distance = "Distance" in rows[0]
+        columns = [
+            TableViewAdapter.col("#", kind="index"),
+            TableViewAdapter.col("GlobalId", style="green"),
+            TableViewAdapter.col("Class", style="magenta"),
+            TableViewAdapter.col("Min", kind="secondary"),
+            TableViewAdapter.col("Max", kind="secondary"),
+        ]
+        if with_distance:
+            columns.append(TableViewAdapter.col("Distance", justify="right"))
+
+        table = TableViewAdapter.create_table(
+            title=f"IFC Bounding Boxes ({len(rows)})",
+            columns=columns,
+        )
+        for idx, row in enumerate(rows, start=1):
+            values = [str(idx), row["GlobalId"], row["Class"], format_point(row["Min"]), format_point(row["Max"])]
+            if with_distance:
+                values.append(f"{row['Distance']:.3f}")
+            table.add_row(*values)
+
+        console.print(table)
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.bbox.list.content")
@@ -1,18 +1,23 @@
 
-import json
 from typing import Any, Dict, List
 from rich.console import Console
 from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+from infobim.module.ifc.adapter.renderer.sources import export_sources_rich
 
 
 class IfcBuildingListRenderer:
     def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
-        if format == "json":
-            self.export_json(console, result)
-        else:
-            self.export_rich(console, result)
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
 
     def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        export_sources_rich(console, result)
+
         buildings = result.get("org.infobim.domain.ifc.building.list.content", [])
         count = result.get("org.infobim.domain.ifc.building.list.count", 0)
         
@@ -26,8 +31,12 @@ class IfcBuildingListRenderer:
             building_name = building.get("Name", "Unknown Building")
             storeys = building.get("Storeys", [])
             
+            title = f"Building: {building_name} ({building.get('GlobalId', '')})"
+            if building.get("SourceFile"):
+                title += f" - {building['SourceFile']}"
+
             table = TableViewAdapter.create_table(
-                title=f"Building: {building_name} ({building.get('GlobalId', '')})",
+                title=title,
                 columns=[
                     TableViewAdapter.col("Name", kind="primary"),
                     TableViewAdapter.col("Elevation (m)", kind="secondary", justify="right"),
@@ -50,4 +59,4 @@ class IfcBuildingListRenderer:
             console.print("") # Add spacing between tables
 
     def export_json(self, console: Console, result: Dict[str, Any]) -> None:
-        print(json.dumps(result, indent=2, default=str))
+        write_result(result, "org.infobim.domain.ifc.building.list.content")
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+class IfcClassHistogramRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        classes = result.get("org.infobim.domain.ifc.class.histogram.content", [])
+        total = result.get("org.infobim.domain.ifc.class.histogram.total", 0)
+
+        if not classes:
+            console.print("[yellow]No entities found.[/yellow]")
+            return
+
+        table = TableViewAdapter.create_table(
+            title=f"IFC Classes ({len(classes)} classes, {total} entities)",
+            columns=[
+                TableViewAdapter.col("Class", kind="primary"),
+                TableViewAdapter.col("Count", style="green", justify="right"),
+                TableViewAdapter.col("Share", kind="secondary", justify="right"),
+            ],
+        )
+        for row in classes:
+            count = row.get("Count", 0)
+            share = f"{100.0 * count / total:.1f}%" if total else "-"
+            table.add_row(str(row.get("Class", "-")), str(count), share)
+
+        console.print(table)
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.class.histogram.content")
@@ -0,0 +1,46 @@
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.util.trace import DIAGNOSTICS_KEY, get_current_tracer, set_current_tracer
+
+
+@contextmanager
+def render_span(console: Console, result: Dict[str, Any], format: str) -> Iterator[None]:
+    """
+    Times rendering in the tracer left by the capability, then closes the trace:
+    rewrites the Chrome trace file and, for rich output, prints the timings.
+    JSON output is serialized inside the span, so its diagnostics end before
+    "render"; the trace file has it.
+    """
+    tracer = get_current_tracer()
+    if tracer is None or tracer.active:
+        yield
+        return
+
+    try:
+        with tracer.span("render", format=format):
+            yield
+    finally:
+        set_current_tracer(None)
+        if tracer.trace_file:
+            tracer.write_chrome_trace()
+
+    if format != "json" and result.get(DIAGNOSTICS_KEY):
+        export_diagnostics_rich(console, result[DIAGNOSTICS_KEY])
+
+
+def export_diagnostics_rich(console: Console, diagnostics: Dict[str, Any]) -> None:
+    table = TableViewAdapter.create_table(
+        title=f"Diagnostics ({diagnostics.get('total_ms', 0):.1f} ms)",
+        columns=[
+            TableViewAdapter.col("Phase", kind="primary"),
+            TableViewAdapter.col("ms", justify="right"),
+            TableViewAdapter.col("Details", kind="secondary"),
+        ],
+    )
+    for span in diagnostics.get("spans", []):
+        details = ", ".join(f"{k}={v}" for k, v in span.items() if k not in ("name", "ms", "depth"))
+        table.add_row("  " * span.get("depth", 0) + str(span.get("name")), f"{span.get('ms', 0):.1f}", details)
+    console.print(table)
@@ -0,0 +1,15 @@
+
+from typing import Any, Dict
+from rich.console import Console
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+class InspectElementRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                write_result(result)
+                return
+            console.print("[yellow]Inspect Element Capability not yet implemented.[/yellow]")
+            console.print(result)
@@ -1,18 +1,42 @@
 
-import json
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 from rich.console import Console
 from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+from infobim.module.ifc.adapter.renderer.sources import export_sources_rich
+from infobim.module.ifc.adapter.renderer.paging import is_interactive, page_through
+from infobim.module.ifc.util.paging import DEFAULT_PAGE_SIZE
+
+
+# Beyond this many rows, the plain rich table shows the first page only
+MAX_RICH_ROWS = 5000
 
 
 class IfcElementsListRenderer:
     def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
-        if format == "json":
-            self.export_json(console, result)
-        else:
-            self.export_rich(console, result)
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
 
     def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        export_sources_rich(console, result)
+
+        export = result.get("org.infobim.domain.ifc.element.export")
+        if export is not None:
+            console.print(
+                f"[green]Exported {export['rows']} elements ({len(export['columns'])} columns) "
+                f"as {export['format']} to {export['path']}[/green]"
+            )
+            return
+
+        summary = result.get("org.infobim.domain.ifc.element.summary.content")
+        if summary is not None:
+            self.export_summary_rich(console, result)
+            return
+
         # Check for generic list keys
         elements = result.get("org.infobim.domain.ifc.element.list.content")
         count = result.get("org.infobim.domain.ifc.element.list.count")
@@ -21,6 +45,11 @@ class IfcElementsListRenderer:
         if elements is None:
             elements = result.get("org.infobim.domain.ifc.element.list_by_type.content", [])
             count = result.get("org.infobim.domain.ifc.element.list_by_type.count", 0)
+
+        # Streamed rows must be materialized to lay out a table
+        if not isinstance(elements, (list, tuple)):
+            elements = list(elements)
+            count = len(elements)
             
         if not elements:
             console.print("[yellow]No elements found.[/yellow]")
@@ -34,6 +63,40 @@ class IfcElementsListRenderer:
         other_keys = [k for k in first_element.keys() if k not in priority_keys]
         columns_keys = priority_keys + other_keys
 
+        window = result.get("org.infobim.domain.ifc.element.list.page")
+        if window and window.get("pager"):
+            # Every row is in the result; lay out one page at a time
+            page_size = window["page_size"]
+            pages = max(1, (len(elements) + page_size - 1) // page_size)
+
+            def render_page(page: int) -> None:
+                start = (page - 1) * page_size
+                title = f"IFC Elements ({count}) - page {page}/{pages}"
+                console.print(self._build_table(title, columns_keys, elements[start:start + page_size], start))
+
+            if is_interactive(console):
+                page_through(console, pages, render_page, window["page"])
+            else:
+                render_page(window["page"])
+            return
+
+        if window:
+            title = f"IFC Elements ({count}) - page {window['page']}/{window['pages']}"
+            console.print(self._build_table(title, columns_keys, elements, window["start"]))
+            return
+
+        if len(elements) > MAX_RICH_ROWS:
+            # Laying out a huge table hangs the terminal; show the first page only
+            console.print(self._build_table(f"IFC Elements ({count})", columns_keys, elements[:DEFAULT_PAGE_SIZE], 0))
+            console.print(
+                f"[dim]Showing {DEFAULT_PAGE_SIZE} of {len(elements)} elements. "
+                f"Use --page/--page-size, --pager or --summary to browse, or --export json for every row.[/dim]"
+            )
+            return
+
+        console.print(self._build_table(f"IFC Elements ({count})", columns_keys, elements, 0))
+
+    def _build_table(self, title: str, columns_keys: List[str], rows: Sequence[Dict[str, Any]], offset: int) -> Any:
         columns = [TableViewAdapter.col("#", kind="index")]
         for key in columns_keys:
              if key == "Name":
@@ -48,17 +111,40 @@ class IfcElementsListRenderer:
                  columns.append(TableViewAdapter.col(key, kind="secondary"))
 
         table = TableViewAdapter.create_table(
-            title=f"IFC Elements ({count})",
+            title=title,
             columns=columns,
         )
         
-        for idx, element in enumerate(elements, start=1):
+        for idx, element in enumerate(rows, start=offset + 1):
             row = [str(idx)]
             for key in columns_keys:
                 row.append(str(element.get(key, "")))
             table.add_row(*row)
 
+        return table
+
+    def export_summary_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        summary = result.get("org.infobim.domain.ifc.element.summary.content") or []
+        group_by = result.get("org.infobim.domain.ifc.element.summary.group_by") or []
+        count = result.get("org.infobim.domain.ifc.element.list.count")
+
+        if not summary:
+            console.print("[yellow]No elements found.[/yellow]")
+            return
+
+        columns = [TableViewAdapter.col(key, kind="primary" if i == 0 else "secondary") for i, key in enumerate(group_by)]
+        columns.append(TableViewAdapter.col("Count", justify="right"))
+        table = TableViewAdapter.create_table(
+            title=f"IFC Elements ({count}) by {', '.join(group_by)}",
+            columns=columns,
+        )
+        for row in summary:
+            table.add_row(*[str(row.get(key, "")) for key in group_by], str(row["Count"]))
+
         console.print(table)
 
     def export_json(self, console: Console, result: Dict[str, Any]) -> None:
-        print(json.dumps(result, indent=2, default=str))
+        if "org.infobim.domain.ifc.element.summary.content" in result:
+            write_result(result, "org.infobim.domain.ifc.element.summary.content")
+            return
+        write_result(result, "org.infobim.domain.ifc.element.list.content")
@@ -0,0 +1,69 @@
+
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+def format_size(size: int) -> str:
+    value = float(size)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return str(size)
+
+
+class IfcFileScanRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        files = result.get("org.infobim.domain.ifc.file.list.content", [])
+        count = result.get("org.infobim.domain.ifc.file.list.count", 0)
+        duplicates = result.get("org.infobim.domain.ifc.file.list.duplicates", 0)
+
+        if not files:
+            console.print("[yellow]No IFC files found.[/yellow]")
+            return
+
+        table = TableViewAdapter.create_table(
+            title=f"IFC Files ({count})",
+            columns=[
+                TableViewAdapter.col("#", kind="index"),
+                TableViewAdapter.col("Name", kind="primary"),
+                TableViewAdapter.col("Schema", style="magenta"),
+                TableViewAdapter.col("Application", kind="secondary"),
+                TableViewAdapter.col("TimeStamp", kind="secondary"),
+                TableViewAdapter.col("Size", justify="right"),
+                TableViewAdapter.col("Copies", justify="right"),
+                TableViewAdapter.col("Hash", style="dim"),
+            ],
+        )
+
+        for idx, record in enumerate(files, start=1):
+            name = record.get("Name", "")
+            if record.get("Error"):
+                name = f"{name} [red](header error)[/red]"
+            table.add_row(
+                str(idx),
+                name,
+                str(record.get("Schema") or "-"),
+                str(record.get("Application") or "-"),
+                str(record.get("TimeStamp") or "-"),
+                format_size(record.get("Size") or 0),
+                str(len(record.get("Copies", []))),
+                str(record.get("Hash") or "")[:12],
+            )
+
+        console.print(table)
+        if duplicates:
+            console.print(f"[yellow]{duplicates} duplicate copies merged.[/yellow]")
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.file.list.content")
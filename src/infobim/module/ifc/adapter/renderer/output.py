@@ -0,0 +1,147 @@
+
+import os
+import sys
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import PurePath
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO
+
+
+# Shared JSON output layer of the renderers.
+# Styles: "pretty" (indented, the default), "compact" (one line, no spaces)
+# and "ndjson" (one row per line). Output goes to stdout or to --output-file,
+# and is written incrementally instead of being built as one string.
+
+JSON_STYLES = ("pretty", "compact", "ndjson")
+STYLE_ENV = "INFOBIM_JSON_STYLE"
+COMPACT_SEPARATORS = (",", ":")
+
+_options: ContextVar[Optional[Dict[str, Any]]] = ContextVar("infobim_output_options", default=None)
+
+
+def set_output_options(style: Optional[str] = None, path: Optional[str] = None) -> None:
+    """
+    Sets the JSON style and/or output file for the current run (used by the CLI strategies).
+    """
+    if style is not None and style not in JSON_STYLES:
+        raise ValueError(f"Invalid JSON style: {style}. Use one of: {', '.join(JSON_STYLES)}.")
+    options = dict(_options.get() or {})
+    if style is not None:
+        options["style"] = style
+    if path is not None:
+        options["path"] = path
+    _options.set(options)
+
+
+def get_output_options() -> Dict[str, Any]:
+    options = _options.get() or {}
+    style = options.get("style") or os.environ.get(STYLE_ENV) or "pretty"
+    return {"style": style if style in JSON_STYLES else "pretty", "path": options.get("path")}
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Encodes the non-JSON types found in results: IFC entities as "#<id> <class>",
+    iterators and sets as lists, paths and bytes as text; anything else through str().
+    """
+    if hasattr(obj, "is_a") and hasattr(obj, "id"):
+        return f"#{obj.id()} {obj.is_a()}"
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    if isinstance(obj, Iterator):
+        return list(obj)
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    return str(obj)
+
+
+_compact_encoder = json.JSONEncoder(default=encode_default, separators=COMPACT_SEPARATORS)
+
+
+@contextmanager
+def open_output(out: Optional[TextIO] = None) -> Iterator[TextIO]:
+    """
+    Yields the stream to write to: `out`, the --output-file, or stdout.
+    """
+    if out is not None:
+        yield out
+        return
+    path = get_output_options()["path"]
+    if not path:
+        yield sys.stdout
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        yield f
+
+
+def write_ndjson(rows: Iterable[Any], out: Optional[TextIO] = None) -> int:
+    """
+    Writes one compact JSON object per line, flushing as rows are produced.
+    Returns the number of rows written.
+    """
+    count = 0
+    with open_output(out) as out:
+        encode = _compact_encoder.encode
+        for row in rows:
+            out.write(encode(row))
+            out.write("\n")
+            out.flush()
+            count += 1
+    return count
+
+
+def _write_compact(value: Any, out: TextIO) -> None:
+    # Top-level keys and list items are encoded one at a time with the C encoder,
+    # so large results are never held as a single string
+    encode = _compact_encoder.encode
+    if isinstance(value, dict):
+        out.write("{")
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                out.write(",")
+            out.write(encode(str(key)))
+            out.write(":")
+            _write_compact(item, out)
+        out.write("}")
+    elif isinstance(value, (list, tuple)) or isinstance(value, Iterator):
+        out.write("[")
+        for i, item in enumerate(value):
+            if i:
+                out.write(",")
+            out.write(encode(item))
+        out.write("]")
+    else:
+        out.write(encode(value))
+
+
+def write_json(value: Any, out: Optional[TextIO] = None, style: Optional[str] = None) -> None:
+    """
+    Writes a value as JSON in the given (or configured) style, incrementally.
+    """
+    style = style or get_output_options()["style"]
+    with open_output(out) as out:
+        if style == "pretty":
+            encoder = json.JSONEncoder(default=encode_default, indent=2)
+            for chunk in encoder.iterencode(value):
+                out.write(chunk)
+        else:
+            _write_compact(value, out)
+        out.write("\n")
+        out.flush()
+
+
+def write_result(result: Dict[str, Any], content_key: Optional[str] = None, out: Optional[TextIO] = None) -> None:
+    """
+    Writes a capability result. Streamed content (an iterator under `content_key`)
+    and the ndjson style write the content rows one per line; otherwise the
+    whole result is written in the configured style.
+    """
+    style = get_output_options()["style"]
+    content = result.get(content_key) if content_key else None
+    if content is not None and (style == "ndjson" or not isinstance(content, (list, tuple))):
+        write_ndjson(content, out)
+        return
+    write_json(result, out, "compact" if style == "ndjson" else style)
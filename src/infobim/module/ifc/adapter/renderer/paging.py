@@ -0,0 +1,38 @@
+
+import sys
+from typing import Callable
+from rich.console import Console
+
+
+def is_interactive(console: Console) -> bool:
+    """
+    True when pages can be prompted for: the console is a terminal and stdin is a tty.
+    """
+    return console.is_terminal and sys.stdin is not None and sys.stdin.isatty()
+
+
+def page_through(console: Console, pages: int, render_page: Callable[[int], None], page: int = 1) -> None:
+    """
+    Interactive pager: renders one page at a time, so only the visible rows are laid out.
+    Keys: Enter/n next, p previous, a page number to jump, q to quit.
+    """
+    page = max(1, min(page, pages))
+    while True:
+        console.clear()
+        render_page(page)
+        if pages == 1:
+            return
+        try:
+            answer = console.input(f"[dim]Page {page}/{pages} - [n]ext, [p]rev, <number>, [q]uit:[/dim] ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if answer in ("q", "quit"):
+            return
+        if answer in ("", "n") and page < pages:
+            page += 1
+        elif answer == "p" and page > 1:
+            page -= 1
+        elif answer.isdigit():
+            page = max(1, min(int(answer), pages))
+        elif answer in ("", "n"):
+            return
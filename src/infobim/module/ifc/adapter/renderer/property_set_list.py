@@ -1,16 +1,18 @@
 
-import json
 from typing import Any, Dict, List
 from rich.console import Console
 from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
 
 
 class IfcPropertySetListRenderer:
     def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
-        if format == "json":
-            self.export_json(console, result)
-        else:
-            self.export_rich(console, result)
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
 
     def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
         psets = result.get("org.infobim.domain.ifc.pset.list.content", [])
@@ -46,4 +48,4 @@ class IfcPropertySetListRenderer:
             console.print("") # Add spacing between tables
 
     def export_json(self, console: Console, result: Dict[str, Any]) -> None:
-        print(json.dumps(result, indent=2, default=str))
+        write_result(result, "org.infobim.domain.ifc.pset.list.content")
@@ -0,0 +1,71 @@
+
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+from infobim.module.ifc.adapter.renderer.sources import export_sources_rich
+from infobim.module.ifc.util.federation import SOURCE_COLUMN
+
+
+class IfcPropertyTableRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        export_sources_rich(console, result)
+
+        export = result.get("org.infobim.domain.ifc.pset.table.export")
+        if export is not None:
+            console.print(
+                f"[green]Exported {export['rows']} elements ({len(export['columns'])} columns) "
+                f"as {export['format']} to {export['path']}[/green]"
+            )
+            return
+
+        rows = result.get("org.infobim.domain.ifc.pset.table.content", [])
+        property_columns = result.get("org.infobim.domain.ifc.pset.table.columns", [])
+
+        # Streamed rows must be materialized to lay out a table
+        if not isinstance(rows, (list, tuple)):
+            rows = list(rows)
+
+        if not rows:
+            console.print("[yellow]No elements found.[/yellow]")
+            return
+
+        columns = [
+            TableViewAdapter.col("#", kind="index"),
+            TableViewAdapter.col("GlobalId", style="green"),
+            TableViewAdapter.col("Name", kind="primary"),
+            TableViewAdapter.col("Class", style="magenta"),
+        ]
+        # Tables merged from several files name the file of each row
+        federated = SOURCE_COLUMN in rows[0]
+        if federated:
+            columns.append(TableViewAdapter.col(SOURCE_COLUMN, style="dim"))
+        for key in property_columns:
+            columns.append(TableViewAdapter.col(key, kind="secondary"))
+
+        table = TableViewAdapter.create_table(
+            title=f"IFC Property Table ({len(rows)})",
+            columns=columns,
+        )
+
+        for idx, row in enumerate(rows, start=1):
+            values = [str(idx), str(row.get("GlobalId", "")), str(row.get("Name") or "-"), str(row.get("Class", ""))]
+            if federated:
+                values.append(str(row.get(SOURCE_COLUMN, "")))
+            for key in property_columns:
+                value = row.get(key)
+                values.append("-" if value is None else str(value))
+            table.add_row(*values)
+
+        console.print(table)
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.pset.table.content")
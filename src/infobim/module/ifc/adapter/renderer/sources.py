@@ -0,0 +1,17 @@
+
+from typing import Any, Dict
+from rich.console import Console
+from infobim.module.ifc.util.federation import SOURCES_KEY
+
+
+def export_sources_rich(console: Console, result: Dict[str, Any]) -> None:
+    """
+    Prints the files of a directory or glob run that could not be read.
+    """
+    sources = result.get(SOURCES_KEY)
+    if not sources:
+        return
+    failed = [source for source in sources if source.get("Error")]
+    console.print(f"[dim]{len(sources) - len(failed)} of {len(sources)} files read.[/dim]")
+    for source in failed:
+        console.print(f"[red]{source['Path']}: {source['Error']}[/red]")
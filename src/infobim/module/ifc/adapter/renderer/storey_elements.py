@@ -0,0 +1,51 @@
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+class IfcStoreyElementsRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        storeys = result.get("org.infobim.domain.ifc.storey.element.list.content", [])
+        count = result.get("org.infobim.domain.ifc.storey.element.list.count", 0)
+
+        if not storeys:
+            console.print("[yellow]No storeys found.[/yellow]")
+            return
+
+        console.print(f"[green]Elements found: {count}[/green]")
+
+        for entry in storeys:
+            storey = entry.get("Storey", {})
+            table = TableViewAdapter.create_table(
+                title=f"Storey: {storey.get('Name', '-')} ({storey.get('Building', '-')}, {storey.get('Elevation', '-')} m) - {entry.get('Count', 0)} elements",
+                columns=[
+                    TableViewAdapter.col("#", kind="index"),
+                    TableViewAdapter.col("GlobalId", style="green"),
+                    TableViewAdapter.col("Name", kind="primary"),
+                    TableViewAdapter.col("Class", style="magenta"),
+                    TableViewAdapter.col("Container", kind="secondary"),
+                ],
+            )
+            for idx, element in enumerate(entry.get("Elements", []), start=1):
+                table.add_row(
+                    str(idx),
+                    str(element.get("GlobalId", "")),
+                    str(element.get("Name", "")),
+                    str(element.get("Class", "")),
+                    str(element.get("Container", "")),
+                )
+
+            console.print(table)
+            console.print("") # Add spacing between tables
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.storey.element.list.content")
@@ -0,0 +1,58 @@
+from typing import Any, Dict
+from rich.console import Console
+from ontobdc.core.adapter import TableViewAdapter
+from infobim.module.ifc.adapter.renderer.diagnostics import render_span
+from infobim.module.ifc.adapter.renderer.output import write_result
+
+
+# Wider histograms fold the remaining classes into an "Other" column
+MAX_CLASS_COLUMNS = 12
+
+
+class IfcStoreyHistogramRenderer:
+    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
+        with render_span(console, result, format):
+            if format == "json":
+                self.export_json(console, result)
+            else:
+                self.export_rich(console, result)
+
+    def export_rich(self, console: Console, result: Dict[str, Any]) -> None:
+        storeys = result.get("org.infobim.domain.ifc.storey.histogram.content", [])
+        classes = result.get("org.infobim.domain.ifc.storey.histogram.classes", [])
+
+        if not storeys:
+            console.print("[yellow]No storeys found.[/yellow]")
+            return
+
+        shown = classes[:MAX_CLASS_COLUMNS]
+        other = len(classes) > len(shown)
+
+        columns = [
+            TableViewAdapter.col("Building", kind="secondary"),
+            TableViewAdapter.col("Storey", kind="primary"),
+            TableViewAdapter.col("Elevation (m)", kind="secondary", justify="right"),
+        ]
+        for class_name in shown:
+            columns.append(TableViewAdapter.col(class_name, justify="right"))
+        if other:
+            columns.append(TableViewAdapter.col("Other", justify="right"))
+        columns.append(TableViewAdapter.col("Total", style="green", justify="right"))
+
+        table = TableViewAdapter.create_table(
+            title=f"IFC Elements per Storey ({len(storeys)} storeys)",
+            columns=columns,
+        )
+        for storey in storeys:
+            counts = storey.get("Classes", {})
+            row = [str(storey.get("Building", "-")), str(storey.get("Name", "-")), str(storey.get("Elevation", "-"))]
+            row.extend(str(counts.get(class_name, 0)) for class_name in shown)
+            if other:
+                row.append(str(sum(n for c, n in counts.items() if c not in shown)))
+            row.append(str(storey.get("Total", 0)))
+            table.add_row(*row)
+
+        console.print(table)
+
+    def export_json(self, console: Console, result: Dict[str, Any]) -> None:
+        write_result(result, "org.infobim.domain.ifc.storey.histogram.content")
@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import os
+import csv
+import json
 import uuid
-import ifcopenshell
-import ifcopenshell.api
 from ontobdc.run.core.action import Action, ActionMetadata
+from infobim.module.ifc.util.compressed import compress_file, is_compressed, resolve_ifc_path
+from infobim.module.ifc.util.step_writer import write_incremental
 # from infobim.module.ifc.adapter.strategy.cli_extruded_element import CreateExtrudedElementCliStrategy
 
 
@@ -35,33 +37,33 @@ class CreateExtrudedElementAction(Action):
                 },
                 "name": {
                     "type": "string",
-                    "required": True,
-                    "description": "Name of the element to create.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) Name of the element to create.",
                 },
                 "x": {
                     "type": "number",
-                    "required": True,
-                    "description": "X coordinate position.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) X coordinate position.",
                 },
                 "y": {
                     "type": "number",
-                    "required": True,
-                    "description": "Y coordinate position.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) Y coordinate position.",
                 },
                 "depth": {
                     "type": "number",
-                    "required": True,
-                    "description": "Depth (thickness) of the extrusion.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) Depth (thickness) of the extrusion.",
                 },
                 "width": {
                     "type": "number",
-                    "required": True,
-                    "description": "Width of the element.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) Width of the element.",
                 },
                 "length": {
                     "type": "number",
-                    "required": True,
-                    "description": "Length of the element.",
+                    "required": False,
+                    "description": "(Required unless batch_path/elements is given) Length of the element.",
                 },
                 "ifc_class_name": {
                     "type": "string",
@@ -69,6 +71,22 @@ class CreateExtrudedElementAction(Action):
                     "default": "IfcBuildingElementProxy",
                     "description": "IFC Class of the element (e.g. IfcBuildingElementProxy, IfcSlab).",
                 },
+                "batch_path": {
+                    "type": "string",
+                    "required": False,
+                    "description": "JSON (list of objects) or CSV (header row) file of element specs with name, x, y, depth, width, length and optional ifc_class_name and container (GlobalId of a spatial element). All elements are created in one transaction.",
+                },
+                "elements": {
+                    "type": "array",
+                    "required": False,
+                    "description": "Element specs given inline, same fields as batch_path.",
+                },
+                "incremental": {
+                    "type": "boolean",
+                    "required": False,
+                    "default": False,
+                    "description": "Append the new entities to a copy of the input instead of rewriting the whole model. Save time follows the size of the change, not of the model.",
+                },
             },
         },
         output_schema={
@@ -82,6 +100,14 @@ class CreateExtrudedElementAction(Action):
                     "type": "string",
                     "description": "Path to the saved IFC file",
                 },
+                "infobim.module.ifc.element.created.global_ids": {
+                    "type": "array",
+                    "description": "GlobalIds of the created elements, in input order (batch mode)",
+                },
+                "infobim.module.ifc.element.created.count": {
+                    "type": "integer",
+                    "description": "Number of created elements (batch mode)",
+                },
             },
         },
         raises=[
@@ -103,40 +129,12 @@ class CreateExtrudedElementAction(Action):
 
     def _create_guid(self):
         """Generates a compressed GUID (Global Unique Identifier) required by IFC."""
-        return ifcopenshell.guid.compress(uuid.uuid1().hex)
+        import ifcopenshell.guid
 
-    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        ifc_path = inputs.get("ifc-path")
-        output_path = inputs.get("output_path") or ifc_path
-        name = inputs.get("name")
-        x = float(inputs.get("x"))
-        y = float(inputs.get("y"))
-        depth = float(inputs.get("depth"))
-        width = float(inputs.get("width"))
-        length = float(inputs.get("length"))
-        ifc_class_name = inputs.get("ifc_class_name", "IfcBuildingElementProxy")
-
-        if not os.path.exists(ifc_path):
-            raise FileNotFoundError(f"Input file {ifc_path} not found.")
-
-        try:
-            ifc_file = ifcopenshell.open(ifc_path)
-        except Exception as e:
-            raise RuntimeError(f"Error opening file: {e}")
-
-        # --- 1. Create Placement (Location and Orientation) ---
-        pt = ifc_file.createIfcCartesianPoint((float(x), float(y), 0.0))
-        axis = ifc_file.createIfcDirection((0.0, 0.0, 1.0))
-        ref = ifc_file.createIfcDirection((1.0, 0.0, 0.0))
-        axis2placement = ifc_file.createIfcAxis2Placement3D(pt, axis, ref)
-        local_placement = ifc_file.createIfcLocalPlacement(None, axis2placement)
-
-        # --- 2. Create Geometry (Body Representation) ---
-        profile = ifc_file.createIfcRectangleProfileDef("AREA", None, None, float(width), float(length))
-        extrusion_dir = ifc_file.createIfcDirection((0.0, 0.0, -1.0))
-        solid_pos = ifc_file.createIfcAxis2Placement3D(ifc_file.createIfcCartesianPoint((0.0, 0.0, 0.0)))
-        solid = ifc_file.createIfcExtrudedAreaSolid(profile, solid_pos, extrusion_dir, float(depth))
+        return ifcopenshell.guid.compress(uuid.uuid1().hex)
 
+    def find_representation_context(self, ifc_file) -> Any:
+        """Returns the 'Model' geometric representation context, or the first one available."""
         context = None
         for ctx in ifc_file.by_type("IfcGeometricRepresentationContext"):
             if ctx.ContextType == "Model":
@@ -147,6 +145,60 @@ class CreateExtrudedElementAction(Action):
                 context = ifc_file.by_type("IfcGeometricRepresentationContext")[0]
             else:
                  raise RuntimeError("No IfcGeometricRepresentationContext found in file.")
+        return context
+
+    def find_spatial_structure(self, ifc_file) -> Optional[Any]:
+        """Returns the first storey, else the first site, else the project."""
+        structure = None
+        storeys = ifc_file.by_type("IfcBuildingStorey")
+        if storeys:
+            structure = storeys[0]
+        else:
+            sites = ifc_file.by_type("IfcSite")
+            if sites:
+                structure = sites[0]
+            else:
+                projs = ifc_file.by_type("IfcProject")
+                if projs:
+                    structure = projs[0]
+        return structure
+
+    def create_element(self, ifc_file, context, name: str, x: float, y: float, depth: float, width: float, length: float,
+                       ifc_class_name: str = "IfcBuildingElementProxy", shared: Optional[Dict[Any, Any]] = None) -> Any:
+        """
+        Creates the placement, the extruded body and the element instance.
+
+        When a `shared` dict is given (batch mode), geometry entities that do not
+        depend on the element (directions, the solid position, profiles of the same
+        size) are created once and reused across calls.
+        """
+        if shared is None:
+            shared = {}
+
+        def get_shared(key, create):
+            entity = shared.get(key)
+            if entity is None:
+                entity = shared[key] = create()
+            return entity
+
+        # --- 1. Create Placement (Location and Orientation) ---
+        pt = ifc_file.createIfcCartesianPoint((float(x), float(y), 0.0))
+        axis = get_shared("axis", lambda: ifc_file.createIfcDirection((0.0, 0.0, 1.0)))
+        ref = get_shared("ref", lambda: ifc_file.createIfcDirection((1.0, 0.0, 0.0)))
+        axis2placement = ifc_file.createIfcAxis2Placement3D(pt, axis, ref)
+        local_placement = ifc_file.createIfcLocalPlacement(None, axis2placement)
+
+        # --- 2. Create Geometry (Body Representation) ---
+        profile = get_shared(
+            ("profile", float(width), float(length)),
+            lambda: ifc_file.createIfcRectangleProfileDef("AREA", None, None, float(width), float(length)),
+        )
+        extrusion_dir = get_shared("extrusion_dir", lambda: ifc_file.createIfcDirection((0.0, 0.0, -1.0)))
+        solid_pos = get_shared(
+            "solid_pos",
+            lambda: ifc_file.createIfcAxis2Placement3D(ifc_file.createIfcCartesianPoint((0.0, 0.0, 0.0))),
+        )
+        solid = ifc_file.createIfcExtrudedAreaSolid(profile, solid_pos, extrusion_dir, float(depth))
 
         rep = ifc_file.createIfcShapeRepresentation(context, "Body", "SweptSolid", [solid])
         product_def_shape = ifc_file.createIfcProductDefinitionShape(None, None, [rep])
@@ -166,33 +218,182 @@ class CreateExtrudedElementAction(Action):
         if not hasattr(element, "Representation"):
              raise RuntimeError(f"Class '{ifc_class_name}' does not support geometry (no Representation attribute).")
 
-        # --- 4. Add to Spatial Structure ---
-        structure = None
-        storeys = ifc_file.by_type("IfcBuildingStorey")
-        if storeys:
-            structure = storeys[0]
+        return element
+
+    def add_to_structure(self, ifc_file, structure, elements, containers: Optional[Dict[int, Any]] = None) -> None:
+        """
+        Adds elements to the spatial containment of the structure, creating the relationship if needed.
+        `containers` maps structure step ids to their relationship (see get_containers) and
+        avoids a scan of every IfcRelContainedInSpatialStructure per call.
+        """
+        if containers is None:
+            containers = self.get_containers(ifc_file)
+        rel = containers.get(structure.id())
+
+        if rel:
+            rel.RelatedElements = list(rel.RelatedElements) + list(elements)
         else:
-            sites = ifc_file.by_type("IfcSite")
-            if sites:
-                structure = sites[0]
-            else:
-                projs = ifc_file.by_type("IfcProject")
-                if projs:
-                    structure = projs[0]
+            containers[structure.id()] = ifc_file.createIfcRelContainedInSpatialStructure(
+                self._create_guid(), None, "Building Storey Container", None, list(elements), structure
+            )
+
+    def get_containers(self, ifc_file) -> Dict[int, Any]:
+        """Maps the step id of each spatial structure to its IfcRelContainedInSpatialStructure."""
+        containers: Dict[int, Any] = {}
+        for rel in ifc_file.by_type("IfcRelContainedInSpatialStructure"):
+            if rel.RelatingStructure is not None:
+                containers.setdefault(rel.RelatingStructure.id(), rel)
+        return containers
+
+    def load_element_specs(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Reads element specs from a JSON file (a list, or {"elements": [...]}) or a CSV file with a header row.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Batch file {path} not found.")
+
+        if path.lower().endswith(".csv"):
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                return [{k.strip(): v for k, v in row.items() if k and v not in (None, "")} for row in csv.DictReader(f)]
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("elements", [])
+        if not isinstance(data, list):
+            raise ValueError(f"Batch file {path} must hold a list of element specs.")
+        return data
+
+    def _get_specs(self, inputs: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        specs = inputs.get("elements")
+        if isinstance(specs, str):
+            specs = json.loads(specs)
+        batch_path = inputs.get("batch_path")
+        if batch_path:
+            specs = list(specs or []) + self.load_element_specs(batch_path)
+        return specs
+
+    def create_elements(self, ifc_file, specs: List[Dict[str, Any]],
+                        default_class_name: str = "IfcBuildingElementProxy") -> List[Any]:
+        """
+        Creates many elements in one pass: the representation context, the default
+        structure and the containment relationships are resolved once, shared
+        geometry is reused, and each container gets its new members in one update.
+        """
+        context = self.find_representation_context(ifc_file)
+        default_structure = self.find_spatial_structure(ifc_file)
+        shared: Dict[Any, Any] = {}
+        structures: Dict[str, Any] = {}
+        members: Dict[int, List[Any]] = {}
+        by_id: Dict[int, Any] = {}
+
+        elements = []
+        for i, spec in enumerate(specs):
+            try:
+                values = [float(spec[k]) for k in ("x", "y", "depth", "width", "length")]
+            except KeyError as e:
+                raise ValueError(f"Element spec {i} is missing {e}.")
+            element = self.create_element(
+                ifc_file, context, spec.get("name") or f"Element {i}", *values,
+                ifc_class_name=spec.get("ifc_class_name") or default_class_name, shared=shared,
+            )
+            elements.append(element)
 
+            structure = default_structure
+            container = spec.get("container")
+            if container:
+                structure = structures.get(container)
+                if structure is None:
+                    try:
+                        structure = structures[container] = ifc_file.by_guid(container)
+                    except RuntimeError:
+                        raise ValueError(f"Container {container} of element spec {i} not found.")
+            if structure:
+                by_id[structure.id()] = structure
+                members.setdefault(structure.id(), []).append(element)
+
+        containers = self.get_containers(ifc_file)
+        for structure_id, structure_members in members.items():
+            self.add_to_structure(ifc_file, by_id[structure_id], structure_members, containers)
+
+        return elements
+
+    def write_model(self, ifc_file, output_path: str) -> None:
+        """
+        Writes the model, compressed when the output is a .ifczip or .ifc.gz path.
+        """
+        if not is_compressed(output_path):
+            ifc_file.write(output_path)
+            return
+
+        step_path = f"{output_path}.{os.getpid()}.ifc"
+        try:
+            ifc_file.write(step_path)
+            compress_file(step_path, output_path)
+        finally:
+            if os.path.exists(step_path):
+                os.remove(step_path)
+
+    def save_model(self, ifc_file, source_path: str, output_path: str, base_id: int, elements: List[Any],
+                   incremental: bool = False) -> None:
+        """
+        Writes the model. In incremental mode only the entities created after `base_id`
+        and the containment relationships the elements were added to are written,
+        patched into a copy of the source file.
+        """
+        if incremental and not is_compressed(output_path):
+            modified = {rel for element in elements for rel in getattr(element, "ContainedInStructure", None) or ()}
+            try:
+                write_incremental(ifc_file, source_path, output_path, base_id, modified)
+                return
+            except ValueError:
+                # Not a STEP file that can be patched (e.g. no closing ENDSEC): write it whole
+                pass
+        self.write_model(ifc_file, output_path)
+
+    def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        ifc_path = inputs.get("ifc-path")
+        output_path = inputs.get("output_path") or ifc_path
+        ifc_class_name = inputs.get("ifc_class_name", "IfcBuildingElementProxy")
+        specs = self._get_specs(inputs)
+        incremental = str(inputs.get("incremental", False)).lower() in ("1", "true", "yes")
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"Input file {ifc_path} not found.")
+
+        import ifcopenshell
+
+        source_path = resolve_ifc_path(ifc_path)
+        try:
+            ifc_file = ifcopenshell.open(source_path)
+        except Exception as e:
+            raise RuntimeError(f"Error opening file: {e}")
+        base_id = ifc_file.get_max_id()
+
+        if specs is not None:
+            elements = self.create_elements(ifc_file, specs, ifc_class_name)
+            self.save_model(ifc_file, source_path, output_path, base_id, elements, incremental)
+            return {
+                "infobim.module.ifc.element.created.global_ids": [e.GlobalId for e in elements],
+                "infobim.module.ifc.element.created.count": len(elements),
+                "infobim.module.ifc.file.path": output_path
+            }
+
+        name = inputs.get("name")
+        x = float(inputs.get("x"))
+        y = float(inputs.get("y"))
+        depth = float(inputs.get("depth"))
+        width = float(inputs.get("width"))
+        length = float(inputs.get("length"))
+
+        context = self.find_representation_context(ifc_file)
+        element = self.create_element(ifc_file, context, name, x, y, depth, width, length, ifc_class_name)
+
+        structure = self.find_spatial_structure(ifc_file)
         if structure:
-            rel = None
-            for r in ifc_file.by_type("IfcRelContainedInSpatialStructure"):
-                if r.RelatingStructure == structure:
-                    rel = r
-                    break
-            
-            if rel:
-                rel.RelatedElements = list(rel.RelatedElements) + [element]
-            else:
-                ifc_file.createIfcRelContainedInSpatialStructure(self._create_guid(), None, "Building Storey Container", None, [element], structure)
+            self.add_to_structure(ifc_file, structure, [element])
 
-        ifc_file.write(output_path)
+        self.save_model(ifc_file, source_path, output_path, base_id, [element], incremental)
 
         return {
             "infobim.module.ifc.element.created.global_id": element.GlobalId,
@@ -1,11 +1,30 @@
-from .list_elements import ListIfcElementsCapability
-from .list_property_sets import ListIfcPropertySetsCapability
-from .list_buildings import ListIfcBuildingsCapability
-from .inspect_element import InspectIfcElementCapability
-
-__all__ = [
-    "ListIfcElementsCapability",
-    "ListIfcPropertySetsCapability",
-    "ListIfcBuildingsCapability",
-    "InspectIfcElementCapability",
-]
+from importlib import import_module
+
+# Capability class -> module, imported on first attribute access
+_MODULES = {
+    "ListIfcElementsCapability": "list_elements",
+    "ListIfcPropertySetsCapability": "list_property_sets",
+    "ListIfcBuildingsCapability": "list_buildings",
+    "InspectIfcElementCapability": "inspect_element",
+    "PivotIfcPropertySetsCapability": "pivot_property_sets",
+    "ScanIfcFilesCapability": "scan_files",
+    "ListIfcStoreyElementsCapability": "list_storey_elements",
+    "CountIfcStoreyElementsCapability": "count_storey_elements",
+    "CountIfcClassesCapability": "count_classes",
+    "QueryIfcBoundingBoxesCapability": "query_bounding_boxes",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
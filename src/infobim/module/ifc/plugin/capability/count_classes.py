@@ -0,0 +1,105 @@
+import os
+from typing import Any, Dict, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.util.parameter import split_list_value
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.step_scan import scan_step
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+class CountIfcClassesCapability(Capability):
+    """
+    Capability to count the entities of every IFC class in a file, without loading the model.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.count_classes",
+        version="0.1.0",
+        name="Count IFC Classes",
+        description="Counts the entities of every IFC class with a streaming scan of the file, so it works on files larger than memory.",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "class", "count", "histogram", "statistics"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "ifc_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.path",
+                    "required": True,
+                    "description": "Path to the IFC file.",
+                },
+                "ifc_class": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.class",
+                    "required": False,
+                    "description": "Comma separated IFC Classes (e.g. IfcElement). Only they and their subtypes are counted.",
+                },
+                "memory_budget": {
+                    "type": "number",
+                    "uri": "org.infobim.domain.ifc.input.scan.memory_budget",
+                    "required": False,
+                    "description": "Memory budget of the scan in MB. Defaults to $INFOBIM_SCAN_MEMORY_MB or 512.",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.class.histogram.content": {
+                    "type": "array",
+                    "description": "One entry per class, most frequent first: Class, Count",
+                },
+                "org.infobim.domain.ifc.class.histogram.count": {
+                    "type": "integer",
+                    "description": "Number of classes",
+                },
+                "org.infobim.domain.ifc.class.histogram.total": {
+                    "type": "integer",
+                    "description": "Number of counted entities",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.file_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "IFC file not found",
+            },
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.class_histogram import IfcClassHistogramRenderer
+
+        return IfcClassHistogramRenderer()
+
+    @cache_result
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "count_classes") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        ifc_path = context.get_parameter_value("ifc_path")
+        classes = split_list_value(context.get_parameter_value("ifc_class"))
+        memory_budget = context.get_parameter_value("memory_budget")
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"File {ifc_path} not found.")
+
+        # Only the class counts are kept, whatever the size of the file
+        with span("scan") as attrs:
+            scan = scan_step(ifc_path, memory_budget=memory_budget)
+            attrs["chunks"] = len(scan.chunks)
+
+        with span("count") as attrs:
+            counts = scan.get_class_counts(classes)
+            attrs["classes"] = len(counts)
+
+        return {
+            "org.infobim.domain.ifc.class.histogram.content": [
+                {"Class": class_name, "Count": count} for class_name, count in counts.items()
+            ],
+            "org.infobim.domain.ifc.class.histogram.count": len(counts),
+            "org.infobim.domain.ifc.class.histogram.total": sum(counts.values()),
+        }
@@ -0,0 +1,123 @@
+import os
+from typing import Any, Dict, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.plugin.capability.list_storey_elements import select_storeys
+from infobim.module.ifc.util.element import get_spatial_index, get_storey_properties
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.parameter import split_list_value
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+class CountIfcStoreyElementsCapability(Capability):
+    """
+    Capability to count the elements of each building storey per IFC class.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.count_storey_elements",
+        version="0.1.1",
+        name="Count IFC Storey Elements",
+        description="Counts the elements contained in each building storey, per IFC class (e.g. doors per storey).",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "storey", "spatial", "count", "histogram"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "ifc_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.path",
+                    "required": True,
+                    "description": "Path to the IFC file.",
+                },
+                "storey": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.storey",
+                    "required": False,
+                    "description": "Comma separated storey names or GlobalIds. Defaults to every storey.",
+                },
+                "ifc_class": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.class",
+                    "required": False,
+                    "description": "Only count elements of this IFC Class (e.g. IfcDoor).",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.storey.histogram.content": {
+                    "type": "array",
+                    "description": "One entry per storey: storey properties, Classes ({class: count}) and Total",
+                },
+                "org.infobim.domain.ifc.storey.histogram.classes": {
+                    "type": "array",
+                    "description": "Every counted class, most frequent first",
+                },
+                "org.infobim.domain.ifc.storey.histogram.count": {
+                    "type": "integer",
+                    "description": "Number of storeys",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.file_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "IFC file not found",
+            },
+            {
+                "code": "org.infobim.domain.ifc.exception.storey_not_found",
+                "python_type": "ValueError",
+                "description": "Storey not found",
+            },
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.storey_histogram import IfcStoreyHistogramRenderer
+
+        return IfcStoreyHistogramRenderer()
+
+    @cache_result
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "count_storey_elements") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        ifc_path = context.get_parameter_value("ifc_path")
+        storey_names = split_list_value(context.get_parameter_value("storey"))
+        ifc_class = context.get_parameter_value("ifc_class")
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"File {ifc_path} not found.")
+
+        try:
+            with span("open"):
+                ifc_file = open_model(ifc_path)
+        except Exception as e:
+            raise RuntimeError(f"Error opening file: {e}")
+
+        with span("index"):
+            index = get_spatial_index(ifc_file)
+
+        with span("count") as attrs:
+            content = []
+            totals: Dict[str, int] = {}
+            for storey in select_storeys(index, storey_names):
+                classes = index.get_class_histogram(storey.id(), ifc_class)
+                for class_name, count in classes.items():
+                    totals[class_name] = totals.get(class_name, 0) + count
+                row = get_storey_properties(storey, ifc_file)
+                row["Classes"] = classes
+                row["Total"] = sum(classes.values())
+                content.append(row)
+            attrs["storeys"] = len(content)
+
+        return {
+            "org.infobim.domain.ifc.storey.histogram.content": content,
+            "org.infobim.domain.ifc.storey.histogram.classes": sorted(totals, key=lambda c: (-totals[c], c)),
+            "org.infobim.domain.ifc.storey.histogram.count": len(content),
+        }
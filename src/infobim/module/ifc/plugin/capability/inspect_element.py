@@ -1,17 +1,13 @@
 
-import ifcopenshell
-from rich.console import Console
 from typing import Any, Dict, Optional
 from ontobdc.run.core.port.contex import CliContextPort
 from infobim.module.ifc.util.element import get_all_attributes
-from ontobdc.run.core.capability import Capability, CapabilityMetadata, CapabilityExecutor
+from infobim.module.ifc.util.executor import ConcurrentCapabilityExecutor
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.step_index import open_element_model
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
 from infobim.module.ifc.plugin.capability.list_property_sets import ListIfcPropertySetsCapability
-
-
-class InspectElementRenderer:
-    def render(self, console: Console, result: Dict[str, Any], format: str = "rich") -> None:
-        console.print("[yellow]Inspect Element Capability not yet implemented.[/yellow]")
-        console.print(result)
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
 
 
 class InspectIfcElementCapability(Capability):
@@ -41,6 +37,13 @@ class InspectIfcElementCapability(Capability):
                     "required": True,
                     "description": "GlobalId (22 chars).",
                 },
+                "use_index": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.step_index",
+                    "required": False,
+                    "default": False,
+                    "description": "Load only the element and its relationships through a cached sidecar index.",
+                },
             },
         },
         output_schema={
@@ -67,18 +70,32 @@ class InspectIfcElementCapability(Capability):
     )
 
     def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.element_detail import InspectElementRenderer
+
         return InspectElementRenderer()
 
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "inspect_element") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
         ifc_path = context.get_parameter_value("ifc_path")
         global_id = context.get_parameter_value("global_id")
+        use_index = bool(context.get_parameter_value("use_index"))
 
         try:
-            # Load the IFC file
-            model = ifcopenshell.open(ifc_path)
+            # Load the IFC file, or only the element's neighbourhood through the sidecar index
+            with span("open", use_index=use_index):
+                if use_index:
+                    model = open_element_model(ifc_path, global_id)
+                    if model is None:
+                        raise ValueError(f"Element with GlobalId {global_id} not found.")
+                else:
+                    model = open_model(ifc_path)
 
             # Find the element by GlobalId
-            element = model.by_guid(global_id)
+            with span("query"):
+                element = model.by_guid(global_id)
             if not element:
                 raise ValueError(f"Element with GlobalId {global_id} not found.")
 
@@ -90,15 +107,24 @@ class InspectIfcElementCapability(Capability):
         except ValueError as e:
             raise ValueError(f"Error finding element: {e}")
 
-        # Reuse context for nested capability execution since parameters match
-        executor = CapabilityExecutor()
-        all_property_sets: Dict[str, Any] = {}
-        for pset in executor.execute(ListIfcPropertySetsCapability(), context)['org.infobim.domain.ifc.pset.list.content']:
-            all_property_sets[pset['name']] = pset
-            all_property_sets[pset['name']]['propertySet'] = {
-                'Name': pset['name'],
-            }
-            del(all_property_sets[pset['name']]['name'])
+        # Reuse context for nested capability execution since parameters match;
+        # property sets are read on another thread while the attributes are
+        # extracted here, both from the same parsed model
+        with ConcurrentCapabilityExecutor(max_workers=1) as executor:
+            property_sets = executor.submit(ListIfcPropertySetsCapability(), context)
+
+            with span("extract") as attrs:
+                attributes = get_all_attributes(element)
+                info = element.get_info()
+                attrs["classes"] = len(attributes)
+
+            all_property_sets: Dict[str, Any] = {}
+            for pset in property_sets.result()['org.infobim.domain.ifc.pset.list.content']:
+                all_property_sets[pset['name']] = pset
+                all_property_sets[pset['name']]['propertySet'] = {
+                    'Name': pset['name'],
+                }
+                del(all_property_sets[pset['name']]['name'])
 
         # Placeholder implementation
         return {
@@ -106,14 +132,14 @@ class InspectIfcElementCapability(Capability):
                 "schema": model.schema,
                 "type": "ifc_path",
                 "value": ifc_path,
-                "info": element.get_info(),
+                "info": info,
             },
             "org.infobim.domain.ifc.element.inspect.global_id": global_id,
             "org.infobim.domain.ifc.element.inspect.class": ifc_class,
             "org.infobim.domain.ifc.element.inspect.title": "Skeleton implementation",
             "org.infobim.domain.ifc.element.inspect.description": "Detailed element information",
             "org.infobim.domain.ifc.element.inspect.content": {
-                "attribute": get_all_attributes(element),
+                "attribute": attributes,
                 "property": all_property_sets,
             }
         }
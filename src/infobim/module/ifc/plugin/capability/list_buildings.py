@@ -1,12 +1,18 @@
 
 import os
-import ifcopenshell
-import ifcopenshell.util.element
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from ontobdc.run.core.port.contex import CliContextPort
 from ontobdc.run.core.capability import Capability, CapabilityMetadata
-from infobim.module.ifc.adapter.renderer.building_list import IfcBuildingListRenderer
-from infobim.module.ifc.util.element import get_basic_properties
+from infobim.module.ifc.util.federation import attach_sources, get_federated_paths, get_sources, merge_rows, run_per_file
+from infobim.module.ifc.util.element import get_basic_properties, get_spatial_index
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.step_scan import open_scanned_model
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+# Entities a low-memory scan keeps: the spatial tree down to the storeys
+SPATIAL_CLASSES = ("IfcProject", "IfcSite", "IfcBuilding", "IfcBuildingStorey", "IfcRelAggregates")
 
 
 class ListIfcBuildingsCapability(Capability):
@@ -28,7 +34,20 @@ class ListIfcBuildingsCapability(Capability):
                     "type": "string",
                     "uri": "org.infobim.domain.ifc.input.path",
                     "required": True,
-                    "description": "Path to the IFC file.",
+                    "description": "Path to the IFC file, or a directory or glob pattern: every file is read in its own process and the buildings are merged with a SourceFile field.",
+                },
+                "low_memory": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.scan.low_memory",
+                    "required": False,
+                    "default": False,
+                    "description": "Stream the file and load only the spatial structure, for files larger than memory.",
+                },
+                "memory_budget": {
+                    "type": "number",
+                    "uri": "org.infobim.domain.ifc.input.scan.memory_budget",
+                    "required": False,
+                    "description": "Memory budget of the low-memory scan in MB. Defaults to $INFOBIM_SCAN_MEMORY_MB or 512.",
                 },
             },
         },
@@ -43,6 +62,10 @@ class ListIfcBuildingsCapability(Capability):
                     "type": "integer",
                     "description": "Number of Buildings found",
                 },
+                "org.infobim.domain.ifc.source.list.content": {
+                    "type": "array",
+                    "description": "Files of a directory or glob ifc_path: Path, Count and Error per file",
+                },
             },
         },
         raises=[
@@ -55,37 +78,87 @@ class ListIfcBuildingsCapability(Capability):
     )
 
     def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.building_list import IfcBuildingListRenderer
+
         return IfcBuildingListRenderer()
 
+    @cache_result
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "list_buildings") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
         ifc_path = context.get_parameter_value("ifc_path")
+        low_memory = bool(context.get_parameter_value("low_memory"))
+
+        paths = get_federated_paths(ifc_path)
+        if paths is not None:
+            return self._execute_federated(context, paths)
 
         if not os.path.exists(ifc_path):
             raise FileNotFoundError(f"File {ifc_path} not found.")
 
         try:
-            ifc_file = ifcopenshell.open(ifc_path)
+            # Load the IFC file, or only its spatial structure with a streaming scan
+            with span("open", low_memory=low_memory):
+                if low_memory:
+                    ifc_file = open_scanned_model(
+                        ifc_path, SPATIAL_CLASSES, context.get_parameter_value("memory_budget")
+                    )
+                else:
+                    ifc_file = open_model(ifc_path)
         except Exception as e:
             raise RuntimeError(f"Error opening file: {e}")
         
-        buildings = ifc_file.by_type("IfcBuilding")
+        with span("query") as attrs:
+            buildings = ifc_file.by_type("IfcBuilding")
+            attrs["buildings"] = len(buildings)
+
+        with span("extract") as attrs:
+            result_data = self._extract_buildings(buildings, ifc_file)
+            attrs["storeys"] = sum(len(b["Storeys"]) for b in result_data)
+
+        # Sort buildings by Name
+        with span("sort"):
+            result_data.sort(key=lambda x: x.get("Name", ""))
+
+        return {
+            "org.infobim.domain.ifc.building.list.content": result_data,
+            "org.infobim.domain.ifc.building.list.count": len(result_data),
+        }
+
+    def _execute_federated(self, context: CliContextPort, paths: List[str]) -> Dict[str, Any]:
+        """
+        Lists the buildings of every file in its own process, each tagged with its SourceFile.
+        """
+        with span("federate", files=len(paths)) as attrs:
+            outcomes = run_per_file(type(self), context, paths)
+            sources = get_sources(outcomes, "org.infobim.domain.ifc.building.list.count")
+            attrs["failed"] = sum(1 for source in sources if source["Error"])
+
+        result_data = merge_rows(outcomes, "org.infobim.domain.ifc.building.list.content")
+        with span("sort"):
+            result_data.sort(key=lambda x: x.get("Name", ""))
+
+        return attach_sources({
+            "org.infobim.domain.ifc.building.list.content": result_data,
+            "org.infobim.domain.ifc.building.list.count": len(result_data),
+        }, sources)
+
+    def _extract_buildings(self, buildings, ifc_file) -> List[Dict[str, Any]]:
         result_data = []
-        
+        index = get_spatial_index(ifc_file) if buildings else None
+
         for building in buildings:
             building_data = get_basic_properties(building)
             
-            # Find storeys related to this building
-            # IfcBuilding -> IfcRelAggregates -> IfcBuildingStorey
+            # Storeys come from the spatial index (IfcRelAggregates read once per model)
             storeys = []
-            if hasattr(building, "IsDecomposedBy"):
-                for rel in building.IsDecomposedBy:
-                     if rel.is_a("IfcRelAggregates"):
-                         for obj in rel.RelatedObjects:
-                             if obj.is_a("IfcBuildingStorey"):
-                                 storey_data = get_basic_properties(obj)
-                                 # Add elevation if available
-                                 storey_data["Elevation"] = obj.Elevation if hasattr(obj, "Elevation") else "N/A"
-                                 storeys.append(storey_data)
+            for obj in index.get_children(building.id(), "IfcBuildingStorey"):
+                storey_data = get_basic_properties(obj)
+                # Add elevation if available
+                storey_data["Elevation"] = obj.Elevation if obj.Elevation is not None else "N/A"
+                storeys.append(storey_data)
             
             # Sort storeys by Elevation descending (highest first)
             try:
@@ -105,10 +178,4 @@ class ListIfcBuildingsCapability(Capability):
             building_data["Storeys"] = storeys
             result_data.append(building_data)
 
-        # Sort buildings by Name
-        result_data.sort(key=lambda x: x.get("Name", ""))
-
-        return {
-            "org.infobim.domain.ifc.building.list.content": result_data,
-            "org.infobim.domain.ifc.building.list.count": len(result_data),
-        }
+        return result_data
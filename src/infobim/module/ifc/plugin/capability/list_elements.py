@@ -1,11 +1,19 @@
 
-import ifcopenshell
-import ifcopenshell.util.element
-from typing import Any, Dict, Optional
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from ontobdc.run.core.port.contex import CliContextPort
 from ontobdc.run.core.capability import Capability, CapabilityMetadata
-from infobim.module.ifc.adapter.renderer.file_list import IfcElementsListRenderer
-from infobim.module.ifc.util.element import get_basic_properties, get_element_text_value_or_default, get_material_name
+from infobim.module.ifc.util.columnar import write_columns
+from infobim.module.ifc.util.federation import SOURCE_COLUMN, attach_sources, get_federated_paths, get_sources, merge_rows, run_per_file
+from infobim.module.ifc.util.element import get_basic_properties, get_element_text_value_or_default, get_material_name, get_spatial_index
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.paging import get_page_window
+from infobim.module.ifc.util.parameter import split_list_value
+from infobim.module.ifc.util.property import PropertySetTable
+from infobim.module.ifc.util.query import ElementFieldReader, get_property_selection, parse_order_by, parse_predicates
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
 
 
 class ListIfcElementsCapability(Capability):
@@ -15,7 +23,7 @@ class ListIfcElementsCapability(Capability):
     """
     METADATA = CapabilityMetadata(
         id="org.infobim.domain.ifc.capability.list_elements",
-        version="0.1.0",
+        version="0.1.1",
         name="List IFC Elements",
         description="Lists all elements of a specific IFC class from an IFC file.",
         author=["Elias M. P. Junior"],
@@ -28,7 +36,7 @@ class ListIfcElementsCapability(Capability):
                     "type": "string",
                     "uri": "org.infobim.domain.ifc.input.path",
                     "required": True,
-                    "description": "Path to the IFC file.",
+                    "description": "Path to the IFC file, or a directory or glob pattern: every file is listed in its own process and the rows are merged with a SourceFile column.",
                 },
                 "ifc_class": {
                     "type": "string",
@@ -37,6 +45,102 @@ class ListIfcElementsCapability(Capability):
                     "default": "IfcProduct",
                     "description": "IFC Class to list (e.g. IfcWall, IfcWindow).",
                 },
+                "stream": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.output.stream",
+                    "required": False,
+                    "default": False,
+                    "description": "Yield rows as they are computed (written as NDJSON) instead of a sorted list.",
+                },
+                "order_by": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.order_by",
+                    "required": False,
+                    "description": "Column used to sort rows (prefix with - for descending). Defaults to Name, or model order when streaming.",
+                },
+                "storey": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.storey",
+                    "required": False,
+                    "description": "Comma separated storey names or GlobalIds; only elements contained in them (or their spaces) are listed.",
+                },
+                "where": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.query.where",
+                    "required": False,
+                    "description": "Predicates separated by ';' on attributes, Class, Material, Storey or <Pset>.<Property>: =, !=, ~ (contains), >, >=, <, <=, or a bare field (has a value). E.g. 'Pset_WallCommon.IsExternal=true;Name~core'.",
+                },
+                "columns": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.query.columns",
+                    "required": False,
+                    "description": "Comma separated columns to return; only these are computed (Material is resolved only when listed).",
+                },
+                "offset": {
+                    "type": "integer",
+                    "uri": "org.infobim.domain.ifc.input.query.offset",
+                    "required": False,
+                    "default": 0,
+                    "description": "Number of matching rows to skip.",
+                },
+                "limit": {
+                    "type": "integer",
+                    "uri": "org.infobim.domain.ifc.input.query.limit",
+                    "required": False,
+                    "description": "Maximum number of rows to return; ordered queries keep a bounded heap instead of sorting everything.",
+                },
+                "pset_names": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.pset.name",
+                    "required": False,
+                    "description": "Comma separated Property Set names whose values are added as <Pset>.<Property> columns.",
+                },
+                "property_names": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.property.name",
+                    "required": False,
+                    "description": "Comma separated property names to add as columns (limits pset_names when both are given).",
+                },
+                "export_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.output.export_path",
+                    "required": False,
+                    "description": "Write the rows as typed columns to this file (.npz, .parquet, .arrow/.feather, or a directory of .npy files).",
+                },
+                "page": {
+                    "type": "integer",
+                    "uri": "org.infobim.domain.ifc.input.output.page",
+                    "required": False,
+                    "description": "1-based page of rows to return (see page_size).",
+                },
+                "page_size": {
+                    "type": "integer",
+                    "uri": "org.infobim.domain.ifc.input.output.page_size",
+                    "required": False,
+                    "default": 100,
+                    "description": "Rows per page when paging.",
+                },
+                "pager": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.output.pager",
+                    "required": False,
+                    "default": False,
+                    "description": "Browse the rows page by page in the terminal.",
+                },
+                "summary": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.output.summary",
+                    "required": False,
+                    "default": False,
+                    "description": "Return element counts grouped by group_by instead of rows.",
+                },
+                "group_by": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.output.group_by",
+                    "required": False,
+                    "default": "Class",
+                    "description": "Comma separated columns to group the summary by (Class, PredefinedType, Material, ...).",
+                },
             },
         },
         output_schema={
@@ -44,11 +148,35 @@ class ListIfcElementsCapability(Capability):
             "properties": {
                 "org.infobim.domain.ifc.element.list.content": {
                     "type": "array",
-                    "description": "List of element properties (dict)",
+                    "description": "List of element properties (dict), or an iterator of rows when streaming",
                 },
                 "org.infobim.domain.ifc.element.list.count": {
                     "type": "integer",
-                    "description": "Number of elements found",
+                    "description": "Number of elements found (null when streaming)",
+                },
+                "org.infobim.domain.ifc.element.list.total": {
+                    "type": "integer",
+                    "description": "Number of matching elements before offset/limit (when filtering or limiting)",
+                },
+                "org.infobim.domain.ifc.element.export": {
+                    "type": "object",
+                    "description": "Columnar export written instead of content: path, format, rows, columns",
+                },
+                "org.infobim.domain.ifc.element.list.page": {
+                    "type": "object",
+                    "description": "Page window of the content when paging: page, page_size, pages, start, end, pager",
+                },
+                "org.infobim.domain.ifc.element.summary.content": {
+                    "type": "array",
+                    "description": "Summary rows (group columns and Count), largest groups first",
+                },
+                "org.infobim.domain.ifc.element.summary.group_by": {
+                    "type": "array",
+                    "description": "Columns the summary is grouped by",
+                },
+                "org.infobim.domain.ifc.source.list.content": {
+                    "type": "array",
+                    "description": "Files of a directory or glob ifc_path: Path, Count and Error per file",
                 },
             },
         },
@@ -67,42 +195,291 @@ class ListIfcElementsCapability(Capability):
     )
 
     def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.file_list import IfcElementsListRenderer
+
         return IfcElementsListRenderer()
 
+    @cache_result
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "list_elements") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
         ifc_path = context.get_parameter_value("ifc_path")
         # Ensure we prioritize user input over default, handling both hyphen and underscore keys
         ifc_class = context.get_parameter_value("ifc_class") or "IfcProduct"
 
+        paths = get_federated_paths(ifc_path)
+        if paths is not None:
+            return self._execute_federated(context, paths)
+
         try:
-            # Open the IFC file using IfcOpenShell
-            ifc_file = ifcopenshell.open(ifc_path)
+            # Open the IFC file through the shared model registry
+            with span("open"):
+                ifc_file = open_model(ifc_path)
         except Exception as e:
             raise RuntimeError(f"Error opening file: {e}")
         
         try:
             # 'by_type' returns all instances of the specified class (and subclasses).
-            elements = ifc_file.by_type(ifc_class)
+            with span("query", ifc_class=ifc_class) as attrs:
+                elements = ifc_file.by_type(ifc_class)
+                attrs["elements"] = len(elements)
         except:
             raise ValueError(f"Invalid IFC Class: {ifc_class}")
         
-        data = []
+        storey_names = split_list_value(context.get_parameter_value("storey"))
+        if storey_names:
+            # Only the storeys' contents are visited, not every element of the class
+            with span("storey", storey=",".join(storey_names)) as attrs:
+                index = get_spatial_index(ifc_file)
+                storeys = index.find_storeys(storey_names)
+                if not storeys:
+                    raise ValueError(f"Storey not found: {', '.join(storey_names)}")
+                elements = [el for s in storeys for el in index.get_elements(s.id(), ifc_class)]
+                attrs["elements"] = len(elements)
+
+        where = parse_predicates(context.get_parameter_value("where"))
+        columns = split_list_value(context.get_parameter_value("columns")) or None
+        summary = bool(context.get_parameter_value("summary"))
+        group_by = split_list_value(context.get_parameter_value("group_by")) or ["Class"]
+        export_path = context.get_parameter_value("export_path")
+        stream = bool(context.get_parameter_value("stream")) and not export_path and not summary
+        order_by, descending = parse_order_by(context.get_parameter_value("order_by") or (None if stream else "Name"))
+        offset = self._get_int(context, "offset") or 0
+        limit = self._get_int(context, "limit")
+
+        # Property sets are only read when asked for or referenced by a field
+        fields = [p.field for p in where] + (columns or []) + (group_by if summary else []) + ([order_by] if order_by else [])
+        pset_names, property_names = get_property_selection(
+            fields,
+            split_list_value(context.get_parameter_value("pset_names")),
+            split_list_value(context.get_parameter_value("property_names")),
+        )
+        table = None
+        if pset_names or property_names:
+            with span("properties") as attrs:
+                table = PropertySetTable(ifc_file, ifc_class, pset_names, property_names)
+                attrs["columns"] = len(table.columns)
+        reader = ElementFieldReader(table, ifc_file)
+
+        selected: Iterable[Any] = elements
+        if where:
+            selected = reader.filter(elements, where)
+
+        if summary:
+            with span("summary", group_by=",".join(group_by)) as attrs:
+                selected = list(selected)
+                summary_rows = self._summarize(selected, group_by, reader)
+                attrs["groups"] = len(summary_rows)
+            return {
+                "org.infobim.domain.ifc.element.summary.content": summary_rows,
+                "org.infobim.domain.ifc.element.summary.group_by": group_by,
+                "org.infobim.domain.ifc.element.list.count": len(selected),
+            }
+
+        if stream and not order_by:
+            # Rows are produced lazily; the renderer writes them as they come
+            if offset or limit is not None:
+                selected = islice(selected, offset, None if limit is None else offset + limit)
+            return {
+                "org.infobim.domain.ifc.element.list.content": self._iter_rows(selected, table, columns, reader),
+                "org.infobim.domain.ifc.element.list.count": None,
+            }
+
+        total = None
+        if where:
+            with span("filter", predicates=len(where)) as attrs:
+                selected = list(selected)
+                total = attrs["elements"] = len(selected)
+
+        if order_by or offset or limit is not None:
+            with span("sort", order_by=order_by or "", limit=limit) as attrs:
+                selected = reader.select(selected, order_by, descending, offset, limit)
+                attrs["elements"] = len(selected)
+
+        with span("extract") as attrs:
+            data = list(self._iter_rows(selected, table, columns, reader))
+            attrs["rows"] = len(data)
+
+        if total is None and (limit is not None or offset):
+            total = len(elements)
+        return self._finish(context, data, stream, export_path, total)
+
+    def _finish(
+        self,
+        context: CliContextPort,
+        data: List[Dict[str, Any]],
+        stream: bool,
+        export_path: Optional[str],
+        total: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the result from the final rows: streamed, exported, paged or whole.
+        `total` is the number of matches before offset/limit, when they apply.
+        """
+        if stream:
+            return {
+                "org.infobim.domain.ifc.element.list.content": iter(data),
+                "org.infobim.domain.ifc.element.list.count": None,
+            }
+
+        if export_path:
+            with span("export", path=export_path) as attrs:
+                export = write_columns(export_path, data)
+                attrs["columns"] = len(export["columns"])
+            return {
+                "org.infobim.domain.ifc.element.export": export,
+                "org.infobim.domain.ifc.element.list.count": len(data),
+            }
+
+        page = context.get_parameter_value("page")
+        page_size = context.get_parameter_value("page_size")
+        pager = bool(context.get_parameter_value("pager"))
+        if page or page_size or pager:
+            window = get_page_window(len(data), page, page_size)
+            window["pager"] = pager
+            # The pager browses every row; otherwise only the requested page is returned
+            content = data if pager else data[window["start"]:window["end"]]
+            return {
+                "org.infobim.domain.ifc.element.list.content": content,
+                "org.infobim.domain.ifc.element.list.count": len(data),
+                "org.infobim.domain.ifc.element.list.page": window,
+            }
+
+        result = {
+            "org.infobim.domain.ifc.element.list.content": data,
+            "org.infobim.domain.ifc.element.list.count": len(data),
+        }
+        if total is not None:
+            result["org.infobim.domain.ifc.element.list.total"] = total
+        return result
+
+    def _execute_federated(self, context: CliContextPort, paths: List[str]) -> Dict[str, Any]:
+        """
+        Lists every file in its own process and merges the rows, tagged with their SourceFile.
+        Filters, projection and top-k run per file; ordering, offset and limit are applied
+        again to the merged rows.
+        """
+        summary = bool(context.get_parameter_value("summary"))
+        group_by = split_list_value(context.get_parameter_value("group_by")) or ["Class"]
+        export_path = context.get_parameter_value("export_path")
+        stream = bool(context.get_parameter_value("stream")) and not export_path and not summary
+        order_by, descending = parse_order_by(context.get_parameter_value("order_by") or (None if stream else "Name"))
+        offset = self._get_int(context, "offset") or 0
+        limit = self._get_int(context, "limit")
+        columns = split_list_value(context.get_parameter_value("columns")) or None
+
+        overrides: Dict[str, Any] = {"offset": None}
+        if summary:
+            overrides.update(order_by=None, limit=None)
+        else:
+            # Each file keeps its own first offset + limit rows
+            overrides["limit"] = None if limit is None else offset + limit
+            if columns and order_by and order_by not in columns:
+                # The merged rows are ordered by this column, dropped afterwards
+                overrides["columns"] = ",".join(columns + [order_by])
+
+        with span("federate", files=len(paths)) as attrs:
+            outcomes = run_per_file(type(self), context, paths, overrides)
+            sources = get_sources(outcomes, "org.infobim.domain.ifc.element.list.count")
+            attrs["failed"] = sum(1 for source in sources if source["Error"])
+
+        if summary:
+            with span("summary", group_by=",".join(group_by)) as attrs:
+                counts: Counter = Counter()
+                for outcome in outcomes:
+                    if outcome["Error"]:
+                        continue
+                    for row in outcome["Result"]["org.infobim.domain.ifc.element.summary.content"]:
+                        counts[tuple(row.get(key) for key in group_by)] += row["Count"]
+                summary_rows = [
+                    dict(zip(group_by, group), Count=count)
+                    for group, count in sorted(counts.items(), key=lambda item: (-item[1], [str(v) for v in item[0]]))
+                ]
+                attrs["groups"] = len(summary_rows)
+            return attach_sources({
+                "org.infobim.domain.ifc.element.summary.content": summary_rows,
+                "org.infobim.domain.ifc.element.summary.group_by": group_by,
+                "org.infobim.domain.ifc.element.list.count": sum(source["Count"] or 0 for source in sources),
+            }, sources)
+
+        with span("merge") as attrs:
+            data = merge_rows(outcomes, "org.infobim.domain.ifc.element.list.content")
+            attrs["rows"] = len(data)
+
+        total = None
+        if limit is not None or offset or context.get_parameter_value("where"):
+            total = sum(
+                outcome["Result"].get("org.infobim.domain.ifc.element.list.total", outcome["Result"]["org.infobim.domain.ifc.element.list.count"])
+                for outcome in outcomes if not outcome["Error"]
+            )
+
+        if order_by or offset or limit is not None:
+            with span("sort", order_by=order_by or "", limit=limit) as attrs:
+                if order_by:
+                    # Stable: ties keep file order, then model order
+                    data.sort(key=lambda row: str(row.get(order_by)), reverse=descending)
+                data = data[offset:None if limit is None else offset + limit]
+                attrs["elements"] = len(data)
+
+        if "columns" in overrides:
+            data = [{SOURCE_COLUMN: row[SOURCE_COLUMN], **{column: row.get(column) for column in columns}} for row in data]
+
+        return attach_sources(self._finish(context, data, stream, export_path, total), sources)
+
+    def _get_int(self, context: CliContextPort, name: str) -> Optional[int]:
+        value = context.get_parameter_value(name)
+        if value in (None, ""):
+            return None
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {name}: {value}")
+        if number < 0:
+            raise ValueError(f"Invalid {name}: {value}")
+        return number
+
+    def _iter_rows(
+        self,
+        elements: Iterable[Any],
+        table: Optional[PropertySetTable] = None,
+        columns: Optional[List[str]] = None,
+        reader: Optional[ElementFieldReader] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        if columns:
+            # Projection: only the requested columns are computed
+            reader = reader or ElementFieldReader(table)
+            for el in elements:
+                yield {column: reader.format(el, column) for column in columns}
+            return
+
+        property_columns = table.columns if table is not None else []
+        model = reader.model if reader is not None else None
         for el in elements:
             # 1. Basic Props
             row = get_basic_properties(el)
 
             # 2. Material
-            row["Material"] = get_material_name(el)
+            row["Material"] = get_material_name(el, model)
 
             # 3. Class specific info (e.g. PredefinedType)
             row["PredefinedType"] = get_element_text_value_or_default("PredefinedType", el)
 
-            data.append(row)
+            # 4. Selected property values
+            if property_columns:
+                values = table.get_row(el)
+                for column in property_columns:
+                    row[column] = values.get(column)
 
-        # Sort by Name
-        data.sort(key=lambda x: x.get("Name", ""))
+            yield row
 
-        return {
-            "org.infobim.domain.ifc.element.list.content": data,
-            "org.infobim.domain.ifc.element.list.count": len(data),
-        }
+    def _summarize(self, elements: Iterable[Any], group_by: List[str], reader: ElementFieldReader) -> List[Dict[str, Any]]:
+        """
+        Counts elements per group; only the grouped columns are computed.
+        """
+        counts = Counter(tuple(reader.format(el, key) for key in group_by) for el in elements)
+        return [
+            dict(zip(group_by, group), Count=count)
+            for group, count in sorted(counts.items(), key=lambda item: (-item[1], [str(v) for v in item[0]]))
+        ]
@@ -1,11 +1,12 @@
 
 import os
-import ifcopenshell
-import ifcopenshell.util.element
 from typing import Any, Dict, Optional
 from ontobdc.run.core.port.contex import CliContextPort
 from ontobdc.run.core.capability import Capability, CapabilityMetadata
-from infobim.module.ifc.adapter.renderer.property_set_list import IfcPropertySetListRenderer
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.step_index import open_element_model
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
 
 
 class ListIfcPropertySetsCapability(Capability):
@@ -35,6 +36,13 @@ class ListIfcPropertySetsCapability(Capability):
                     "required": True,
                     "description": "GlobalId (22 chars) or StepId (integer) of the element.",
                 },
+                "use_index": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.step_index",
+                    "required": False,
+                    "default": False,
+                    "description": "Load only the element and its relationships through a cached sidecar index.",
+                },
             },
         },
         output_schema={
@@ -65,44 +73,48 @@ class ListIfcPropertySetsCapability(Capability):
     )
 
     def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.property_set_list import IfcPropertySetListRenderer
+
         return IfcPropertySetListRenderer()
 
+    @cache_result
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "list_property_sets") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
         ifc_path = context.get_parameter_value("ifc_path")
         global_id = context.get_parameter_value("global_id")
+        use_index = bool(context.get_parameter_value("use_index"))
 
         if not os.path.exists(ifc_path):
             raise FileNotFoundError(f"File {ifc_path} not found.")
 
         try:
-            ifc_file = ifcopenshell.open(ifc_path)
+            with span("open", use_index=use_index):
+                if use_index:
+                    ifc_file = open_element_model(ifc_path, global_id)
+                else:
+                    ifc_file = open_model(ifc_path)
         except Exception as e:
             raise RuntimeError(f"Error opening file: {e}")
-        
-        element = None
-        # Try to find element by GlobalId (22 chars) or StepId
-        if len(str(global_id)) == 22:
-            try:
-                element = ifc_file.by_guid(global_id)
-            except:
-                pass
-        
-        if not element and str(global_id).isdigit():
-            try:
-                element = ifc_file.by_id(int(global_id))
-            except:
-                pass
-                
-        if not element:
-             # Fallback: try to iterate if not found by direct lookup (rare but possible if ID format is weird)
-             pass
+
+        if ifc_file is None:
+            raise ValueError(f"Element with ID '{global_id}' not found in {ifc_path}.")
+
+        with span("query"):
+            element = self._find_element(ifc_file, global_id)
 
         if not element:
             raise ValueError(f"Element with ID '{global_id}' not found in {ifc_path}.")
 
         # Get Property Sets using ifcopenshell utility
         # This returns a dict: { "Pset_Name": { "PropName": Value, ... }, ... }
-        psets_dict = ifcopenshell.util.element.get_psets(element)
+        import ifcopenshell.util.element
+
+        with span("extract") as attrs:
+            psets_dict = ifcopenshell.util.element.get_psets(element)
+            attrs["psets"] = len(psets_dict)
         
         result_data = []
         
@@ -148,4 +160,21 @@ class ListIfcPropertySetsCapability(Capability):
             "org.infobim.domain.ifc.pset.list.count": len(result_data),
         }
 
+    def _find_element(self, ifc_file, global_id: Any) -> Optional[Any]:
+        element = None
+        # Try to find element by GlobalId (22 chars) or StepId
+        if len(str(global_id)) == 22:
+            try:
+                element = ifc_file.by_guid(global_id)
+            except:
+                pass
+        
+        if not element and str(global_id).isdigit():
+            try:
+                element = ifc_file.by_id(int(global_id))
+            except:
+                pass
+
+        return element
+
 # ifcopenshell.entity_instance
@@ -0,0 +1,137 @@
+import os
+from typing import Any, Dict, List, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.util.element import get_element_text_value_or_default, get_spatial_index, get_storey_properties
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.parameter import split_list_value
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+def select_storeys(index, storey_names: List[str]) -> List[Any]:
+    """
+    Returns the storeys matching the names (all storeys when none are given).
+    """
+    if not storey_names:
+        return index.get_storeys()
+    storeys = index.find_storeys(storey_names)
+    if not storeys:
+        raise ValueError(f"Storey not found: {', '.join(storey_names)}")
+    return storeys
+
+
+class ListIfcStoreyElementsCapability(Capability):
+    """
+    Capability to list the elements contained in building storeys.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.list_storey_elements",
+        version="0.1.1",
+        name="List IFC Storey Elements",
+        description="Lists the elements contained in each building storey (including its spaces).",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "storey", "spatial", "elements", "list"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "ifc_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.path",
+                    "required": True,
+                    "description": "Path to the IFC file.",
+                },
+                "storey": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.storey",
+                    "required": False,
+                    "description": "Comma separated storey names or GlobalIds. Defaults to every storey.",
+                },
+                "ifc_class": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.class",
+                    "required": False,
+                    "description": "Only list elements of this IFC Class (e.g. IfcDoor).",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.storey.element.list.content": {
+                    "type": "array",
+                    "description": "One entry per storey: Storey (properties), Elements (GlobalId, Name, Class, Container) and Count",
+                },
+                "org.infobim.domain.ifc.storey.element.list.count": {
+                    "type": "integer",
+                    "description": "Number of elements over all listed storeys",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.file_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "IFC file not found",
+            },
+            {
+                "code": "org.infobim.domain.ifc.exception.storey_not_found",
+                "python_type": "ValueError",
+                "description": "Storey not found",
+            },
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.storey_elements import IfcStoreyElementsRenderer
+
+        return IfcStoreyElementsRenderer()
+
+    @cache_result
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "list_storey_elements") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        ifc_path = context.get_parameter_value("ifc_path")
+        storey_names = split_list_value(context.get_parameter_value("storey"))
+        ifc_class = context.get_parameter_value("ifc_class")
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"File {ifc_path} not found.")
+
+        try:
+            with span("open"):
+                ifc_file = open_model(ifc_path)
+        except Exception as e:
+            raise RuntimeError(f"Error opening file: {e}")
+
+        with span("index"):
+            index = get_spatial_index(ifc_file)
+
+        with span("extract") as attrs:
+            content = []
+            for storey in select_storeys(index, storey_names):
+                elements = []
+                for el in index.get_elements(storey.id(), ifc_class):
+                    container = index.get_container(el)
+                    elements.append({
+                        "GlobalId": el.GlobalId,
+                        "Name": get_element_text_value_or_default("Name", el),
+                        "Class": el.is_a(),
+                        "Container": get_element_text_value_or_default("Name", container) if container is not None else "-",
+                    })
+                elements.sort(key=lambda x: (x["Class"], x["Name"]))
+                content.append({
+                    "Storey": get_storey_properties(storey, ifc_file),
+                    "Elements": elements,
+                    "Count": len(elements),
+                })
+            attrs["storeys"] = len(content)
+            attrs["elements"] = sum(s["Count"] for s in content)
+
+        return {
+            "org.infobim.domain.ifc.storey.element.list.content": content,
+            "org.infobim.domain.ifc.storey.element.list.count": sum(s["Count"] for s in content),
+        }
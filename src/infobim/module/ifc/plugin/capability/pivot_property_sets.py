@@ -0,0 +1,223 @@
+
+import os
+from typing import Any, Dict, Iterable, List, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.util.columnar import write_columns
+from infobim.module.ifc.util.federation import SOURCE_COLUMN, attach_sources, get_federated_paths, get_sources, merge_rows, run_per_file
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.parameter import split_list_value
+from infobim.module.ifc.util.property import PropertySetTable
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+class PivotIfcPropertySetsCapability(Capability):
+    """
+    Capability to extract property values of all elements of a class as a wide table.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.pivot_property_sets",
+        version="0.1.0",
+        name="Pivot IFC Property Sets",
+        description="Extracts property values of all elements of a class as one row per element and one column per property.",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "properties", "pset", "table"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "ifc_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.path",
+                    "required": True,
+                    "description": "Path to the IFC file, or a directory or glob pattern: every file is read in its own process and the rows are merged with a SourceFile column.",
+                },
+                "ifc_class": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.class",
+                    "required": False,
+                    "default": "IfcProduct",
+                    "description": "IFC Class of the elements (e.g. IfcWall, IfcDoor).",
+                },
+                "pset_names": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.pset.name",
+                    "required": False,
+                    "description": "Comma separated Property Set names to include (e.g. Pset_WallCommon).",
+                },
+                "property_names": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.property.name",
+                    "required": False,
+                    "description": "Comma separated property names to include (e.g. FireRating,IsExternal).",
+                },
+                "stream": {
+                    "type": "boolean",
+                    "uri": "org.infobim.domain.ifc.input.output.stream",
+                    "required": False,
+                    "default": False,
+                    "description": "Yield rows as they are computed (written as NDJSON) instead of a sorted list.",
+                },
+                "export_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.output.export_path",
+                    "required": False,
+                    "description": "Write the table as typed columns to this file (.npz, .parquet, .arrow/.feather, or a directory of .npy files).",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.pset.table.columns": {
+                    "type": "array",
+                    "description": "Property columns, named <Pset>.<Property>",
+                },
+                "org.infobim.domain.ifc.pset.table.content": {
+                    "type": "array",
+                    "description": "One row (dict) per element, or an iterator of rows when streaming",
+                },
+                "org.infobim.domain.ifc.pset.table.count": {
+                    "type": "integer",
+                    "description": "Number of elements (null when streaming)",
+                },
+                "org.infobim.domain.ifc.pset.table.export": {
+                    "type": "object",
+                    "description": "Columnar export written instead of content: path, format, rows, columns",
+                },
+                "org.infobim.domain.ifc.source.list.content": {
+                    "type": "array",
+                    "description": "Files of a directory or glob ifc_path: Path, Count and Error per file",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.file_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "IFC file not found",
+            },
+            {
+                "code": "org.infobim.domain.ifc.exception.invalid_class",
+                "python_type": "ValueError",
+                "description": "Invalid IFC Class",
+            }
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.property_table import IfcPropertyTableRenderer
+
+        return IfcPropertyTableRenderer()
+
+    @cache_result
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "pivot_property_sets") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        ifc_path = context.get_parameter_value("ifc_path")
+        ifc_class = context.get_parameter_value("ifc_class") or "IfcProduct"
+        pset_names = split_list_value(context.get_parameter_value("pset_names"))
+        property_names = split_list_value(context.get_parameter_value("property_names"))
+        export_path = context.get_parameter_value("export_path")
+        stream = bool(context.get_parameter_value("stream")) and not export_path
+
+        paths = get_federated_paths(ifc_path)
+        if paths is not None:
+            return self._execute_federated(context, paths, stream, export_path)
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"File {ifc_path} not found.")
+
+        try:
+            with span("open"):
+                ifc_file = open_model(ifc_path)
+        except Exception as e:
+            raise RuntimeError(f"Error opening file: {e}")
+
+        try:
+            with span("index", ifc_class=ifc_class) as attrs:
+                table = PropertySetTable(ifc_file, ifc_class, pset_names, property_names)
+                attrs["elements"] = len(table.elements)
+                attrs["columns"] = len(table.columns)
+        except RuntimeError:
+            raise ValueError(f"Invalid IFC Class: {ifc_class}")
+
+        rows: Iterable[Dict[str, Any]] = table.iter_rows()
+        if stream:
+            return {
+                "org.infobim.domain.ifc.pset.table.columns": table.columns,
+                "org.infobim.domain.ifc.pset.table.content": rows,
+                "org.infobim.domain.ifc.pset.table.count": None,
+            }
+
+        with span("extract") as attrs:
+            data = list(rows)
+            attrs["rows"] = len(data)
+
+        with span("sort"):
+            data.sort(key=lambda x: str(x.get("Name") or ""))
+
+        if export_path:
+            with span("export", path=export_path) as attrs:
+                export = write_columns(export_path, data, ["GlobalId", "Name", "Class"] + table.columns)
+                attrs["columns"] = len(export["columns"])
+            return {
+                "org.infobim.domain.ifc.pset.table.columns": table.columns,
+                "org.infobim.domain.ifc.pset.table.export": export,
+                "org.infobim.domain.ifc.pset.table.count": len(data),
+            }
+
+        return {
+            "org.infobim.domain.ifc.pset.table.columns": table.columns,
+            "org.infobim.domain.ifc.pset.table.content": data,
+            "org.infobim.domain.ifc.pset.table.count": len(data),
+        }
+
+    def _execute_federated(self, context: CliContextPort, paths: List[str], stream: bool, export_path: Optional[str]) -> Dict[str, Any]:
+        """
+        Pivots every file in its own process and merges the tables, tagged with their SourceFile.
+        The property columns are the union of the files' columns, in first-seen order.
+        """
+        with span("federate", files=len(paths)) as attrs:
+            outcomes = run_per_file(type(self), context, paths)
+            sources = get_sources(outcomes, "org.infobim.domain.ifc.pset.table.count")
+            attrs["failed"] = sum(1 for source in sources if source["Error"])
+
+        columns: Dict[str, None] = {}
+        for outcome in outcomes:
+            if not outcome["Error"]:
+                columns.update(dict.fromkeys(outcome["Result"]["org.infobim.domain.ifc.pset.table.columns"]))
+        columns_list = list(columns)
+
+        with span("merge") as attrs:
+            data = merge_rows(outcomes, "org.infobim.domain.ifc.pset.table.content")
+            attrs["rows"] = len(data)
+
+        with span("sort"):
+            data.sort(key=lambda x: str(x.get("Name") or ""))
+
+        if stream:
+            return attach_sources({
+                "org.infobim.domain.ifc.pset.table.columns": columns_list,
+                "org.infobim.domain.ifc.pset.table.content": iter(data),
+                "org.infobim.domain.ifc.pset.table.count": None,
+            }, sources)
+
+        if export_path:
+            with span("export", path=export_path) as attrs:
+                export = write_columns(export_path, data, [SOURCE_COLUMN, "GlobalId", "Name", "Class"] + columns_list)
+                attrs["columns"] = len(export["columns"])
+            return attach_sources({
+                "org.infobim.domain.ifc.pset.table.columns": columns_list,
+                "org.infobim.domain.ifc.pset.table.export": export,
+                "org.infobim.domain.ifc.pset.table.count": len(data),
+            }, sources)
+
+        return attach_sources({
+            "org.infobim.domain.ifc.pset.table.columns": columns_list,
+            "org.infobim.domain.ifc.pset.table.content": data,
+            "org.infobim.domain.ifc.pset.table.count": len(data),
+        }, sources)
@@ -0,0 +1,202 @@
+import os
+from typing import Any, Dict, List, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.util.bbox import get_bounding_box_index
+from infobim.module.ifc.util.result_cache import cache_result
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+DEFAULT_NEAREST = 10
+
+
+def parse_coordinates(name: str, value: str, count: int) -> List[float]:
+    """
+    Parses "x,y,z" style CLI values into floats.
+    """
+    parts = [p.strip() for p in str(value).split(",") if p.strip()]
+    try:
+        numbers = [float(p) for p in parts]
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value}")
+    if len(numbers) != count:
+        raise ValueError(f"Invalid {name}: {value} (expected {count} comma separated numbers)")
+    return numbers
+
+
+class QueryIfcBoundingBoxesCapability(Capability):
+    """
+    Capability to query elements by their world-space bounding boxes.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.query_bounding_boxes",
+        version="0.1.0",
+        name="Query IFC Bounding Boxes",
+        description="Finds elements inside a region or nearest to a point/element, using cached bounding boxes and an R-tree.",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "geometry", "bbox", "spatial", "query"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "ifc_path": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.path",
+                    "required": True,
+                    "description": "Path to the IFC file.",
+                },
+                "region": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.bbox.region",
+                    "required": False,
+                    "description": "Box xmin,ymin,zmin,xmax,ymax,zmax; returns the elements whose boxes intersect it.",
+                },
+                "near": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.bbox.near",
+                    "required": False,
+                    "description": "Point x,y,z or element GlobalId; returns the nearest elements.",
+                },
+                "distance": {
+                    "type": "number",
+                    "uri": "org.infobim.domain.ifc.input.bbox.distance",
+                    "required": False,
+                    "description": "Maximum box-to-box distance for --near (model units).",
+                },
+                "ifc_class": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.class",
+                    "required": False,
+                    "description": "Only return elements of this IFC Class (subclasses included).",
+                },
+                "limit": {
+                    "type": "integer",
+                    "uri": "org.infobim.domain.ifc.input.query.limit",
+                    "required": False,
+                    "description": f"Maximum number of elements to return (default {DEFAULT_NEAREST} for --near).",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.bbox.list.content": {
+                    "type": "array",
+                    "description": "GlobalId, Class, Min, Max and (for --near) Distance of each element",
+                },
+                "org.infobim.domain.ifc.bbox.list.count": {
+                    "type": "integer",
+                    "description": "Number of elements returned",
+                },
+                "org.infobim.domain.ifc.bbox.index": {
+                    "type": "object",
+                    "description": "Boxes in the index, whether it was built by this run and the model extent",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.file_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "IFC file not found",
+            },
+            {
+                "code": "org.infobim.domain.ifc.exception.invalid_query",
+                "python_type": "ValueError",
+                "description": "Invalid region, point or element",
+            },
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.bbox_list import IfcBoundingBoxListRenderer
+
+        return IfcBoundingBoxListRenderer()
+
+    @cache_result
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "query_bounding_boxes") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        ifc_path = context.get_parameter_value("ifc_path")
+        region = context.get_parameter_value("region")
+        near = context.get_parameter_value("near")
+        distance = context.get_parameter_value("distance")
+        ifc_class = context.get_parameter_value("ifc_class")
+        limit = context.get_parameter_value("limit")
+
+        if not os.path.exists(ifc_path):
+            raise FileNotFoundError(f"File {ifc_path} not found.")
+        if region and near:
+            raise ValueError("Use either --region or --near, not both.")
+
+        try:
+            limit = int(limit) if limit not in (None, "") else None
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid limit: {limit}")
+        try:
+            distance = float(distance) if distance not in (None, "") else None
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid distance: {distance}")
+
+        box = parse_coordinates("region", region, 6) if region else None
+        if box is not None and (box[0] > box[3] or box[1] > box[4] or box[2] > box[5]):
+            raise ValueError(f"Invalid region: {region} (min must not exceed max)")
+
+        # Tessellation only happens when the file has no cached boxes yet
+        with span("index") as attrs:
+            index, built = get_bounding_box_index(ifc_path)
+            attrs["boxes"] = len(index)
+            attrs["built"] = built
+
+        with span("query") as attrs:
+            distances: Optional[List[float]] = None
+            if near:
+                exclude = None
+                if "," in near:
+                    point = parse_coordinates("near", near, 3)
+                    origin = point + point
+                else:
+                    exclude = index.find(near.strip())
+                    if exclude is None:
+                        raise ValueError(f"No bounding box for element {near} (not found or without geometry).")
+                    origin = list(index.boxes[exclude])
+                found = index.query_nearest(origin, limit or DEFAULT_NEAREST, distance, ifc_class, exclude)
+                hits = [i for _, i in found]
+                distances = [d for d, _ in found]
+            else:
+                if box is None:
+                    hits = list(range(len(index)))
+                    mask = index.get_class_mask(ifc_class)
+                    if mask is not None:
+                        hits = [i for i in hits if mask[i]]
+                else:
+                    hits = [int(i) for i in index.query_region(box, ifc_class)]
+                if limit is not None:
+                    hits = hits[:limit]
+            attrs["hits"] = len(hits)
+
+        content = []
+        for n, i in enumerate(hits):
+            bounds = [round(float(v), 6) for v in index.boxes[i]]
+            row = {
+                "GlobalId": str(index.global_ids[i]),
+                "Class": str(index.classes[i]),
+                "Min": bounds[:3],
+                "Max": bounds[3:],
+            }
+            if distances is not None:
+                row["Distance"] = round(distances[n], 6)
+            content.append(row)
+
+        extent = None
+        if len(index):
+            extent = [round(float(v), 6) for v in index.boxes[:, :3].min(axis=0)] + \
+                     [round(float(v), 6) for v in index.boxes[:, 3:].max(axis=0)]
+
+        return {
+            "org.infobim.domain.ifc.bbox.list.content": content,
+            "org.infobim.domain.ifc.bbox.list.count": len(content),
+            "org.infobim.domain.ifc.bbox.index": {"boxes": len(index), "built": built, "extent": extent},
+        }
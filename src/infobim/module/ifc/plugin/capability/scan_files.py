@@ -0,0 +1,84 @@
+
+import os
+from typing import Any, Dict, Optional
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityMetadata
+from infobim.module.ifc.util.scan import scan_directory
+from infobim.module.ifc.util.trace import attach_diagnostics, span, trace_capability
+
+
+class ScanIfcFilesCapability(Capability):
+    """
+    Capability to catalogue the IFC files of a directory from their STEP headers.
+    """
+    METADATA = CapabilityMetadata(
+        id="org.infobim.domain.ifc.capability.scan_files",
+        version="0.1.0",
+        name="Scan IFC Files",
+        description="Lists IFC files of a directory with schema, authoring application, timestamp, size and content hash.",
+        author=["Elias M. P. Junior"],
+        tags=["ifc", "bim", "file", "scan"],
+        supported_languages=["en", "pt_BR"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "uri": "org.infobim.domain.ifc.input.directory",
+                    "required": False,
+                    "default": "data/incoming",
+                    "description": "Directory scanned recursively for .ifc files.",
+                },
+            },
+        },
+        output_schema={
+            "type": "object",
+            "properties": {
+                "org.infobim.domain.ifc.file.list.content": {
+                    "type": "array",
+                    "description": "One record per distinct file content, with every path holding a copy",
+                },
+                "org.infobim.domain.ifc.file.list.count": {
+                    "type": "integer",
+                    "description": "Number of distinct files found",
+                },
+                "org.infobim.domain.ifc.file.list.duplicates": {
+                    "type": "integer",
+                    "description": "Number of redundant copies merged into other records",
+                },
+            },
+        },
+        raises=[
+            {
+                "code": "org.infobim.domain.ifc.exception.directory_not_found",
+                "python_type": "FileNotFoundError",
+                "description": "Directory not found",
+            },
+        ],
+    )
+
+    def get_default_cli_renderer(self) -> Optional[Any]:
+        from infobim.module.ifc.adapter.renderer.file_scan import IfcFileScanRenderer
+
+        return IfcFileScanRenderer()
+
+    def execute(self, context: CliContextPort) -> Dict[str, Any]:
+        with trace_capability(context, "scan_files") as tracer:
+            return attach_diagnostics(self._execute(context), tracer)
+
+    def _execute(self, context: CliContextPort) -> Dict[str, Any]:
+        directory = context.get_parameter_value("directory") or "data/incoming"
+
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Directory {directory} not found.")
+
+        with span("scan") as attrs:
+            data = scan_directory(directory)
+            attrs["files"] = len(data)
+        duplicates = sum(len(record["Copies"]) - 1 for record in data)
+
+        return {
+            "org.infobim.domain.ifc.file.list.content": data,
+            "org.infobim.domain.ifc.file.list.count": len(data),
+            "org.infobim.domain.ifc.file.list.duplicates": duplicates,
+        }
@@ -0,0 +1,155 @@
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import importlib
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+
+# Static catalog of the capabilities and actions shipped in this package.
+# Discovery (listing tools for agents, resolving an id in the worker) reads
+# manifest.json instead of importing every plugin module; a module is only
+# imported when one of its classes runs. Regenerate it after changing any
+# METADATA:
+#
+#   python -m infobim.module.ifc.plugin.manifest
+#
+# The manifest records a digest of the plugin sources. When they no longer
+# match (e.g. an edited checkout), the catalog is rebuilt in memory from the
+# modules, so it is never stale, only slower.
+
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(PLUGIN_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+# Plugin package -> manifest section
+PLUGIN_KINDS = {"capability": "capabilities", "action": "actions"}
+
+_manifest: Optional[Dict[str, Any]] = None
+
+
+def get_source_digest() -> str:
+    """
+    Hashes the sources of the plugin packages, in a stable order.
+    """
+    digest = hashlib.sha1()
+    for kind in PLUGIN_KINDS:
+        directory = os.path.join(PLUGIN_DIR, kind)
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".py"):
+                continue
+            digest.update(f"{kind}/{name}\0".encode("utf-8"))
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_metadata_dict(metadata: Any) -> Dict[str, Any]:
+    data = dataclasses.asdict(metadata) if dataclasses.is_dataclass(metadata) else dict(vars(metadata))
+    # Values JSON cannot hold (e.g. verification strategy classes) are kept as their names
+    return json.loads(json.dumps(data, default=lambda value: getattr(value, "__name__", str(value))))
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Imports every plugin module and collects the metadata of the classes it defines.
+    """
+    # Only needed to rebuild the catalog; reading the stored manifest does without them
+    import inspect
+    import pkgutil
+    from ontobdc.run.core.action import Action
+    from ontobdc.run.core.capability import Capability
+
+    bases = {"capability": Capability, "action": Action}
+    manifest: Dict[str, Any] = {"version": MANIFEST_VERSION, "source_digest": get_source_digest()}
+    for kind, section in PLUGIN_KINDS.items():
+        package = importlib.import_module(f"{__package__}.{kind}")
+        entries = []
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+            for class_name, obj in inspect.getmembers(module, inspect.isclass):
+                if obj.__module__ != module.__name__ or not issubclass(obj, bases[kind]):
+                    continue
+                metadata = getattr(obj, "METADATA", None)
+                if metadata is None or not getattr(metadata, "id", None):
+                    continue
+                entries.append({"module": module.__name__, "class": class_name, "metadata": get_metadata_dict(metadata)})
+        manifest[section] = sorted(entries, key=lambda entry: entry["metadata"]["id"])
+    return manifest
+
+
+def read_manifest(path: str = MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Returns the manifest stored at `path`, or None when it is missing, unreadable or outdated.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("source_digest") != get_source_digest():
+        return None
+    return manifest
+
+
+def write_manifest(path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    manifest = build_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest
+
+
+def load_manifest() -> Dict[str, Any]:
+    """
+    Returns the catalog: the stored manifest when it matches the sources, otherwise a fresh build.
+    """
+    global _manifest
+    if _manifest is None:
+        _manifest = read_manifest() or build_manifest()
+    return _manifest
+
+
+def get_capability_entries() -> List[Dict[str, Any]]:
+    return load_manifest()["capabilities"]
+
+
+def get_action_entries() -> List[Dict[str, Any]]:
+    return load_manifest()["actions"]
+
+
+def load_class(entry: Dict[str, Any]) -> Any:
+    """
+    Imports the module of a manifest entry and returns its class.
+    """
+    return getattr(importlib.import_module(entry["module"]), entry["class"])
+
+
+def get_capability_class(capability_id: str) -> Optional[Any]:
+    for entry in get_capability_entries():
+        if entry["metadata"]["id"] == capability_id:
+            return load_class(entry)
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate the InfoBIM capability manifest.")
+    parser.add_argument("--check", action="store_true", help="Only check that the stored manifest is up to date.")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if read_manifest() is None:
+            print(f"{MANIFEST_PATH} is outdated; run python -m {__package__}.manifest", file=sys.stderr)
+            return 1
+        return 0
+
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['capabilities'])} capabilities and {len(manifest['actions'])} actions to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+
+import os
+import heapq
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from infobim.module.ifc.util.cache import get_cache_dir, get_content_digest
+
+
+# World-space axis-aligned bounding boxes of the products of a model, computed
+# once with the multi-core ifcopenshell.geom iterator and cached on disk as
+# NumPy arrays keyed by the content hash of the file. Queries go through a
+# sort-tile-recursive (STR) packed R-tree built over the boxes.
+#
+# Boxes are float64 rows (xmin, ymin, zmin, xmax, ymax, zmax).
+
+CACHE_VERSION = 1
+NODE_CAPACITY = 16
+MAX_OPEN_INDEXES = 8
+
+
+def get_bbox_cache_path(ifc_path: str) -> str:
+    return os.path.join(get_cache_dir("bbox"), f"{get_content_digest(ifc_path)}.v{CACHE_VERSION}.npz")
+
+
+def _geom_settings() -> Any:
+    import ifcopenshell.geom
+
+    settings = ifcopenshell.geom.settings()
+    # Constant names were replaced by string keys in newer IfcOpenShell releases
+    for constant, key in (("USE_WORLD_COORDS", "use-world-coords"), ("DISABLE_OPENING_SUBTRACTIONS", "disable-opening-subtractions")):
+        if hasattr(settings, constant):
+            settings.set(getattr(settings, constant), True)
+        else:
+            settings.set(key, True)
+    return settings
+
+
+def compute_bounding_boxes(model: Any, threads: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Tessellates every product with a representation (in parallel) and returns
+    {"ids", "global_ids", "classes", "boxes", "schema"} as NumPy arrays.
+    """
+    import numpy as np
+    import ifcopenshell.geom
+
+    products = [p for p in model.by_type("IfcProduct") if getattr(p, "Representation", None) is not None]
+    ids: List[int] = []
+    global_ids: List[str] = []
+    classes: List[str] = []
+    boxes: List[Tuple[float, ...]] = []
+
+    if products:
+        threads = threads or os.cpu_count() or 1
+        iterator = ifcopenshell.geom.iterator(_geom_settings(), model, threads, include=products)
+        if iterator.initialize():
+            while True:
+                shape = iterator.get()
+                verts = np.asarray(shape.geometry.verts, dtype=np.float64).reshape(-1, 3)
+                if len(verts):
+                    element = model.by_id(shape.id)
+                    ids.append(shape.id)
+                    global_ids.append(element.GlobalId)
+                    classes.append(element.is_a())
+                    boxes.append(tuple(verts.min(axis=0)) + tuple(verts.max(axis=0)))
+                if not iterator.next():
+                    break
+
+    return {
+        "ids": np.array(ids, dtype=np.int64),
+        "global_ids": np.array(global_ids, dtype="U22"),
+        "classes": np.array(classes, dtype=str),
+        "boxes": np.array(boxes, dtype=np.float64).reshape(-1, 6),
+        "schema": np.array(model.schema),
+    }
+
+
+class STRTree:
+    """
+    Static R-tree packed with the sort-tile-recursive algorithm.
+
+    Leaves are the input boxes, tiled along x, then y, then z into groups of
+    `capacity`; each upper level groups the nodes below it the same way. A
+    level is stored as node boxes plus the [start, end) range of its children
+    in the level below, so the whole tree is a handful of NumPy arrays.
+    """
+
+    def __init__(self, boxes: Any, capacity: int = NODE_CAPACITY, levels: Optional[List[Tuple[Any, Any, Any]]] = None,
+                 order: Optional[Any] = None):
+        import numpy as np
+
+        self.boxes = boxes
+        self.capacity = capacity
+        if levels is not None and order is not None:
+            self.order = order
+            self.levels = levels
+            return
+
+        # Leaf order: STR tiling of the box centres
+        self.order = self._tile(boxes, np.arange(len(boxes)))
+        self.levels = []
+        current = boxes[self.order]
+        while len(current) > 1 or not self.levels:
+            starts = np.arange(0, len(current), capacity)
+            ends = np.minimum(starts + capacity, len(current))
+            node_boxes = np.empty((len(starts), 6), dtype=np.float64)
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                node_boxes[i, :3] = current[start:end, :3].min(axis=0)
+                node_boxes[i, 3:] = current[start:end, 3:].max(axis=0)
+            self.levels.append((node_boxes, starts, ends))
+            if len(node_boxes) <= 1:
+                break
+            # Tile the nodes of this level before grouping them into parents
+            tiled = self._tile(node_boxes, np.arange(len(node_boxes)))
+            node_boxes, starts, ends = node_boxes[tiled], starts[tiled], ends[tiled]
+            self.levels[-1] = (node_boxes, starts, ends)
+            current = node_boxes
+        self.levels.reverse()
+
+    def _tile(self, boxes: Any, indexes: Any, axis: int = 0) -> Any:
+        import numpy as np
+
+        if len(indexes) <= self.capacity or axis > 2:
+            return indexes
+        centres = (boxes[indexes, axis] + boxes[indexes, axis + 3]) / 2.0
+        indexes = indexes[np.argsort(centres, kind="stable")]
+        leaves = -(-len(indexes) // self.capacity)
+        slabs = int(np.ceil(leaves ** (1.0 / (3 - axis))))
+        slab_size = self.capacity * int(np.ceil(leaves / slabs))
+        return np.concatenate([
+            self._tile(boxes, indexes[i:i + slab_size], axis + 1)
+            for i in range(0, len(indexes), slab_size)
+        ])
+
+    def query(self, box: Sequence[float]) -> Any:
+        """
+        Returns the indexes of the boxes intersecting the query box.
+        """
+        import numpy as np
+
+        if len(self.boxes) == 0:
+            return np.empty(0, dtype=np.int64)
+        box = np.asarray(box, dtype=np.float64)
+        candidates = np.arange(len(self.levels[0][0]))
+        for node_boxes, starts, ends in self.levels:
+            nodes = node_boxes[candidates]
+            hit = np.all(nodes[:, :3] <= box[3:], axis=1) & np.all(nodes[:, 3:] >= box[:3], axis=1)
+            candidates = candidates[hit]
+            if not len(candidates):
+                return np.empty(0, dtype=np.int64)
+            candidates = np.concatenate([np.arange(starts[c], ends[c]) for c in candidates])
+        leaves = self.order[candidates]
+        items = self.boxes[leaves]
+        hit = np.all(items[:, :3] <= box[3:], axis=1) & np.all(items[:, 3:] >= box[:3], axis=1)
+        return np.sort(leaves[hit])
+
+    def nearest(self, box: Sequence[float], k: int = 10, max_distance: Optional[float] = None) -> List[Tuple[float, int]]:
+        """
+        Returns up to k (distance, index) pairs of the boxes closest to the query box
+        (0 for intersecting boxes), best-first over the tree.
+        """
+        import numpy as np
+
+        if len(self.boxes) == 0 or k <= 0:
+            return []
+        box = np.asarray(box, dtype=np.float64)
+
+        def distances(boxes):
+            gap = np.maximum(np.maximum(boxes[:, :3] - box[3:], box[:3] - boxes[:, 3:]), 0.0)
+            return np.sqrt((gap * gap).sum(axis=1))
+
+        depth_count = len(self.levels)
+        # Heap items: (distance, depth, index); depth == depth_count means a leaf box
+        heap: List[Tuple[float, int, int]] = []
+        root_boxes = self.levels[0][0]
+        for i, d in enumerate(distances(root_boxes)):
+            heap.append((float(d), 0, i))
+        heapq.heapify(heap)
+
+        result: List[Tuple[float, int]] = []
+        while heap and len(result) < k:
+            distance, depth, index = heapq.heappop(heap)
+            if max_distance is not None and distance > max_distance:
+                break
+            if depth == depth_count:
+                result.append((distance, int(index)))
+                continue
+            _, starts, ends = self.levels[depth]
+            children = np.arange(starts[index], ends[index])
+            if depth + 1 == depth_count:
+                leaves = self.order[children]
+                for d, leaf in zip(distances(self.boxes[leaves]), leaves):
+                    heapq.heappush(heap, (float(d), depth_count, int(leaf)))
+            else:
+                for d, child in zip(distances(self.levels[depth + 1][0][children]), children):
+                    heapq.heappush(heap, (float(d), depth + 1, int(child)))
+        return result
+
+    def to_arrays(self) -> Dict[str, Any]:
+        arrays = {"tree_order": self.order}
+        for i, (node_boxes, starts, ends) in enumerate(self.levels):
+            arrays[f"tree_{i}_boxes"] = node_boxes
+            arrays[f"tree_{i}_starts"] = starts
+            arrays[f"tree_{i}_ends"] = ends
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, boxes: Any, arrays: Any) -> "STRTree":
+        levels = []
+        i = 0
+        while f"tree_{i}_boxes" in arrays:
+            levels.append((arrays[f"tree_{i}_boxes"], arrays[f"tree_{i}_starts"], arrays[f"tree_{i}_ends"]))
+            i += 1
+        return cls(boxes, levels=levels, order=arrays["tree_order"])
+
+
+@lru_cache(maxsize=256)
+def get_class_names(schema_name: str, ifc_class: str) -> FrozenSet[str]:
+    """
+    Returns the class and all its subclasses, so stored class names can be filtered without the model.
+    """
+    import ifcopenshell
+
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_name)
+    names = set()
+    stack = [schema.declaration_by_name(ifc_class)]
+    while stack:
+        declaration = stack.pop()
+        names.add(declaration.name())
+        stack.extend(declaration.subtypes())
+    return frozenset(names)
+
+
+class BoundingBoxIndex:
+    """
+    Cached boxes of one model with their R-tree.
+    """
+
+    def __init__(self, data: Dict[str, Any], tree: STRTree):
+        self.ids = data["ids"]
+        self.global_ids = data["global_ids"]
+        self.classes = data["classes"]
+        self.boxes = data["boxes"]
+        self.schema = str(data["schema"])
+        self.tree = tree
+        self._positions: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def find(self, global_id: str) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {str(g): i for i, g in enumerate(self.global_ids)}
+        return self._positions.get(global_id)
+
+    def get_class_mask(self, ifc_class: Optional[str]) -> Optional[Any]:
+        import numpy as np
+
+        if not ifc_class or ifc_class == "IfcProduct":
+            return None
+        return np.isin(self.classes, list(get_class_names(self.schema, ifc_class)))
+
+    def query_region(self, box: Sequence[float], ifc_class: Optional[str] = None) -> Any:
+        hits = self.tree.query(box)
+        mask = self.get_class_mask(ifc_class)
+        return hits if mask is None else hits[mask[hits]]
+
+    def query_nearest(self, box: Sequence[float], k: int = 10, max_distance: Optional[float] = None,
+                      ifc_class: Optional[str] = None, exclude: Optional[int] = None) -> List[Tuple[float, int]]:
+        mask = self.get_class_mask(ifc_class)
+        # Ask for more candidates when some of them will be filtered out
+        wanted = k + (1 if exclude is not None else 0)
+        while True:
+            found = self.tree.nearest(box, wanted, max_distance)
+            kept = [(d, i) for d, i in found if i != exclude and (mask is None or mask[i])]
+            if len(kept) >= k or len(found) < wanted:
+                return kept[:k]
+            wanted *= 2
+
+    def save(self, path: str) -> None:
+        import numpy as np
+
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            ids=self.ids, global_ids=self.global_ids, classes=self.classes,
+            boxes=self.boxes, schema=np.array(self.schema), **self.tree.to_arrays(),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BoundingBoxIndex":
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+        return cls(arrays, STRTree.from_arrays(arrays["boxes"], arrays))
+
+    @classmethod
+    def build(cls, model: Any, threads: Optional[int] = None) -> "BoundingBoxIndex":
+        data = compute_bounding_boxes(model, threads)
+        return cls(data, STRTree(data["boxes"]))
+
+
+_open_indexes: "OrderedDict[str, BoundingBoxIndex]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_bounding_box_index(ifc_path: str, threads: Optional[int] = None) -> Tuple[BoundingBoxIndex, bool]:
+    """
+    Returns (index, built) for the file: from memory, from the disk cache, or
+    computed from the model (parsed through the registry) and cached.
+    """
+    cache_path = get_bbox_cache_path(ifc_path)
+    with _lock:
+        index = _open_indexes.get(cache_path)
+        if index is not None:
+            _open_indexes.move_to_end(cache_path)
+            return index, False
+
+    built = False
+    index = None
+    if os.path.exists(cache_path):
+        try:
+            index = BoundingBoxIndex.load(cache_path)
+        except (OSError, ValueError, KeyError):
+            index = None
+    if index is None:
+        from infobim.module.ifc.util.model import open_model
+
+        index = BoundingBoxIndex.build(open_model(ifc_path), threads)
+        index.save(cache_path)
+        built = True
+
+    with _lock:
+        _open_indexes[cache_path] = index
+        while len(_open_indexes) > MAX_OPEN_INDEXES:
+            _open_indexes.popitem(last=False)
+    return index, built
@@ -0,0 +1,87 @@
+
+import os
+import json
+import hashlib
+import threading
+from typing import Dict, Optional, Tuple
+
+
+CACHE_DIR_ENV = "INFOBIM_CACHE_DIR"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_dir(namespace: Optional[str] = None) -> str:
+    """
+    Returns (and creates) the InfoBIM cache directory, optionally a namespace inside it.
+    Defaults to $XDG_CACHE_HOME/infobim or ~/.cache/infobim.
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(xdg, "infobim")
+
+    path = os.path.join(root, namespace) if namespace else root
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_path_digest(path: str) -> str:
+    """
+    Returns a stable digest of the real path of a file, used to name per-file cache entries.
+    """
+    return hashlib.sha1(os.path.realpath(path).encode("utf-8")).hexdigest()
+
+
+def get_content_hash(path: str) -> str:
+    """
+    Returns the BLAKE2b digest of the whole file content.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+_digests: Dict[str, Tuple[int, int, str]] = {}
+_digests_loaded = False
+_digests_lock = threading.Lock()
+
+
+def _get_digests_path() -> str:
+    return os.path.join(get_cache_dir(), "digests.json")
+
+
+def get_content_digest(path: str) -> str:
+    """
+    Returns the content hash of a file, memoized on disk by (real path, mtime, size)
+    so unchanged files are hashed only once. Used to address content-keyed caches.
+    """
+    global _digests_loaded
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+
+    with _digests_lock:
+        if not _digests_loaded:
+            try:
+                with open(_get_digests_path(), "r", encoding="utf-8") as f:
+                    _digests.update({k: tuple(v) for k, v in json.load(f).items()})
+            except (OSError, ValueError):
+                pass
+            _digests_loaded = True
+        entry = _digests.get(real_path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+    digest = get_content_hash(real_path)
+    with _digests_lock:
+        _digests[real_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        digests_path = _get_digests_path()
+        tmp_path = f"{digests_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_digests, f)
+            os.replace(tmp_path, digests_path)
+        except OSError:
+            pass
+    return digest
@@ -0,0 +1,185 @@
+
+import os
+import json
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+# Columnar export of table rows (lists of dicts) for analytics.
+#
+# Formats, chosen by the path extension:
+#   .npz              NumPy archive, one array per column
+#   .parquet          Apache Parquet (needs pyarrow)
+#   .arrow, .feather  Arrow IPC file, memory-mappable (needs pyarrow)
+#   anything else     a directory with one .npy file per array and a
+#                     columns.json manifest, memory-mappable with NumPy only
+#
+# Columns are typed from their values: bool, int64 (no missing values),
+# float64 (missing values as NaN) or strings. String columns with few
+# distinct values (and Class/Material always) are dictionary encoded: in
+# NumPy formats as "<column>.codes" (int32, -1 for missing) and
+# "<column>.categories"; in Arrow formats as dictionary arrays.
+
+DICTIONARY_COLUMNS = ("Class", "Material", "PredefinedType")
+DICTIONARY_MAX_RATIO = 0.5
+MANIFEST_NAME = "columns.json"
+ARROW_EXTENSIONS = (".parquet", ".arrow", ".feather")
+
+
+def get_columnar_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npz":
+        return "npz"
+    if ext in ARROW_EXTENSIONS:
+        return ext[1:]
+    return "npy"
+
+
+def infer_column_type(values: Sequence[Any]) -> str:
+    """
+    Returns "bool", "int", "float" or "string" for the values of a column.
+    """
+    present = [v for v in values if v is not None]
+    if not present:
+        return "string"
+    if all(isinstance(v, bool) for v in present):
+        return "bool" if len(present) == len(values) else "string"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        if len(present) == len(values) and all(isinstance(v, int) for v in present):
+            return "int"
+        return "float"
+    return "string"
+
+
+def is_dictionary_column(name: str, values: Sequence[Any]) -> bool:
+    if name in DICTIONARY_COLUMNS:
+        return True
+    return len(set(values)) <= max(1, int(len(values) * DICTIONARY_MAX_RATIO))
+
+
+def build_columns(rows: Iterable[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+    """
+    Transposes rows into {column: [values]}. Columns default to the keys of all rows, in first-seen order.
+    """
+    rows = list(rows)
+    if columns is None:
+        seen: Dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                seen.setdefault(key, None)
+        columns = list(seen)
+    return {name: [row.get(name) for row in rows] for name in columns}
+
+
+def _numpy_arrays(columns: Dict[str, List[Any]]) -> Dict[str, Any]:
+    import numpy as np
+
+    arrays: Dict[str, Any] = {}
+    for name, values in columns.items():
+        kind = infer_column_type(values)
+        if kind == "bool":
+            arrays[name] = np.array(values, dtype=np.bool_)
+        elif kind == "int":
+            arrays[name] = np.array(values, dtype=np.int64)
+        elif kind == "float":
+            arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        else:
+            texts = [None if v is None else str(v) for v in values]
+            if is_dictionary_column(name, texts):
+                categories = sorted({t for t in texts if t is not None})
+                lookup = {t: i for i, t in enumerate(categories)}
+                arrays[f"{name}.codes"] = np.array([-1 if t is None else lookup[t] for t in texts], dtype=np.int32)
+                arrays[f"{name}.categories"] = np.array(categories, dtype=str)
+            else:
+                arrays[name] = np.array(["" if t is None else t for t in texts], dtype=str)
+    return arrays
+
+
+def _arrow_table(columns: Dict[str, List[Any]]) -> Any:
+    import pyarrow as pa
+
+    arrays = {}
+    for name, values in columns.items():
+        kind = infer_column_type(values)
+        if kind == "bool":
+            arrays[name] = pa.array(values, type=pa.bool_())
+        elif kind == "int":
+            arrays[name] = pa.array(values, type=pa.int64())
+        elif kind == "float":
+            arrays[name] = pa.array([None if v is None else float(v) for v in values], type=pa.float64())
+        else:
+            texts = [None if v is None else str(v) for v in values]
+            array = pa.array(texts, type=pa.string())
+            arrays[name] = array.dictionary_encode() if is_dictionary_column(name, texts) else array
+    return pa.table(arrays)
+
+
+def write_columns(path: str, rows: Iterable[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Writes rows as typed columns to `path` (format from the extension, see above).
+    Returns {"path", "format", "rows", "columns"}.
+    """
+    data = build_columns(rows, columns)
+    row_count = len(next(iter(data.values()), []))
+    output_format = get_columnar_format(path)
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+
+    if output_format in ("parquet", "arrow", "feather"):
+        try:
+            table = _arrow_table(data)
+        except ImportError:
+            raise RuntimeError(f"Writing .{output_format} files requires pyarrow (pip install pyarrow); use .npz instead.")
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, path)
+        else:
+            import pyarrow.feather as feather
+            # Uncompressed so readers can memory-map it
+            feather.write_feather(table, path, compression="uncompressed")
+    else:
+        import numpy as np
+
+        arrays = _numpy_arrays(data)
+        if output_format == "npz":
+            # Not compressed: members load without inflating
+            np.savez(path, **arrays)
+        else:
+            os.makedirs(path, exist_ok=True)
+            for name, array in arrays.items():
+                np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+            with open(os.path.join(path, MANIFEST_NAME), "w", encoding="utf-8") as f:
+                json.dump({"rows": row_count, "columns": list(data), "arrays": list(arrays)}, f, indent=2)
+
+    return {"path": path, "format": output_format, "rows": row_count, "columns": list(data)}
+
+
+def load_columns(path: str, mmap: bool = True) -> Dict[str, Any]:
+    """
+    Loads columns written by write_columns as {name: array}. NumPy directories
+    and Arrow files are memory-mapped when `mmap` is true. Dictionary encoded
+    NumPy columns are returned as their ".codes" and ".categories" arrays.
+    """
+    output_format = get_columnar_format(path)
+    if output_format in ("parquet", "arrow", "feather"):
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(path, memory_map=mmap)
+        else:
+            import pyarrow.feather as feather
+            table = feather.read_table(path, memory_map=mmap)
+        return {name: table.column(name) for name in table.column_names}
+
+    import numpy as np
+
+    if output_format == "npz":
+        with np.load(path, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    with open(os.path.join(path, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    mode = "r" if mmap else None
+    return {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode, allow_pickle=False)
+        for name in manifest["arrays"]
+    }
@@ -0,0 +1,103 @@
+
+import os
+import gzip
+import shutil
+import zipfile
+import tempfile
+from typing import BinaryIO
+from infobim.module.ifc.util.cache import HASH_CHUNK_SIZE, get_cache_dir, get_content_digest
+
+
+# Compressed models (.ifczip archives and gzipped STEP files) are decompressed
+# once into the InfoBIM cache, under the content hash of the compressed file,
+# and every reader works on that copy. Later runs only stat the compressed
+# file. The copy is never rewritten, so caches keyed by its path and mtime
+# (parsed models, sidecar indexes) stay valid across runs.
+
+COMPRESSED_EXTENSIONS = (".ifczip", ".ifc.gz")
+
+
+def is_compressed(path: str) -> bool:
+    return path.lower().endswith(COMPRESSED_EXTENSIONS)
+
+
+def get_archive_member(archive: zipfile.ZipFile) -> str:
+    """
+    Returns the name of the STEP file inside an .ifczip archive.
+    """
+    for info in archive.infolist():
+        if not info.is_dir() and info.filename.lower().endswith(".ifc"):
+            return info.filename
+    raise ValueError(f"No .ifc file in archive {archive.filename}.")
+
+
+def open_step(path: str) -> BinaryIO:
+    """
+    Opens the STEP text of an IFC file for reading, decompressing it on the fly
+    for .ifczip and .ifc.gz files.
+    """
+    lower = path.lower()
+    if lower.endswith(".ifc.gz"):
+        return gzip.open(path, "rb")
+    if lower.endswith(".ifczip"):
+        # The open member keeps the archive file open after the archive is closed
+        with zipfile.ZipFile(path) as archive:
+            return archive.open(get_archive_member(archive))
+    return open(path, "rb")
+
+
+def get_decompressed_path(ifc_path: str) -> str:
+    """
+    Returns the cached decompressed copy of a compressed IFC file, decompressing it on first use.
+    """
+    directory = get_cache_dir("decompressed")
+    path = os.path.join(directory, f"{get_content_digest(ifc_path)}.ifc")
+    if os.path.exists(path):
+        return path
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out, open_step(ifc_path) as f:
+            shutil.copyfileobj(f, out, HASH_CHUNK_SIZE)
+        # A concurrent run may have finished first; keep its copy (and its mtime)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+    except (zipfile.BadZipFile, gzip.BadGzipFile, EOFError) as e:
+        os.remove(tmp_path)
+        raise ValueError(f"Cannot decompress {ifc_path}: {e}")
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return path
+
+
+def resolve_ifc_path(ifc_path: str) -> str:
+    """
+    Returns the file to read the STEP text of an IFC file from: the file itself,
+    or the decompressed copy of a .ifczip or .ifc.gz file.
+    """
+    if not is_compressed(ifc_path):
+        return ifc_path
+    return get_decompressed_path(ifc_path)
+
+
+def compress_file(step_path: str, ifc_path: str) -> None:
+    """
+    Writes a STEP file to a .ifczip or .ifc.gz path, compressed by its extension.
+    """
+    tmp_path = f"{ifc_path}.{os.getpid()}.tmp"
+    try:
+        if ifc_path.lower().endswith(".ifc.gz"):
+            with open(step_path, "rb") as f, gzip.open(tmp_path, "wb") as out:
+                shutil.copyfileobj(f, out, HASH_CHUNK_SIZE)
+        else:
+            member = os.path.basename(ifc_path)[:-len(".ifczip")] + ".ifc"
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.write(step_path, member)
+        os.replace(tmp_path, ifc_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -1,8 +1,10 @@
 
-import ifcopenshell
-import ifcopenshell.util.element
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from infobim.module.ifc.util.number import round_and_format
+from infobim.module.ifc.util.material import MaterialIndex
+from infobim.module.ifc.util.model import get_model_index
+from infobim.module.ifc.util.spatial import SpatialIndex
 
 
 def get_element_text_value_or_default(key: str, element: Any, default: str = None) -> str:
@@ -46,24 +48,44 @@ def get_basic_properties(element) -> Dict[str, Any]:
 
     return props
 
-def get_material_name(element) -> str:
+def get_material_name(element, model: Any = None) -> str:
     """
-    Retrieves the material name associated with the element.
+    Retrieves the material name associated with the element (or inherited from its type).
+    Resolved through a material index built once per model; pass the opened model when at hand.
     """
-    mat = ifcopenshell.util.element.get_material(element)
-    if not mat:
+    return get_material_index(model if model is not None else element.file).get_material_name(element)
+
+def get_material_index(model) -> MaterialIndex:
+    """
+    Returns the material index of the model, building it on first use.
+    """
+    return get_model_index(model, "material", MaterialIndex)
+
+def get_spatial_index(model) -> SpatialIndex:
+    """
+    Returns the spatial structure index of the model, building it on first use.
+    """
+    return get_model_index(model, "spatial", SpatialIndex)
+
+def get_storey_name(element, model: Any = None) -> str:
+    """
+    Returns the name of the building storey the element is on, or "-".
+    """
+    storey = get_spatial_index(model if model is not None else element.file).get_storey(element)
+    if storey is None:
         return "-"
-    if mat.is_a("IfcMaterial"):
-        return mat.Name
-    if mat.is_a("IfcMaterialList"):
-        return ", ".join([m.Name for m in mat.Materials])
-    if mat.is_a("IfcMaterialLayerSetUsage"):
-        if mat.ForLayerSet and mat.ForLayerSet.MaterialLayers:
-                return ", ".join([l.Material.Name for l in mat.ForLayerSet.MaterialLayers if l.Material])
-    if mat.is_a("IfcMaterialProfileSetUsage"):
-        if mat.ForProfileSet and mat.ForProfileSet.MaterialProfiles:
-                return ", ".join([p.Material.Name for p in mat.ForProfileSet.MaterialProfiles if p.Material])
-    return "-"
+    return get_element_text_value_or_default("Name", storey)
+
+def get_storey_properties(storey, model: Any = None) -> Dict[str, Any]:
+    """
+    Basic properties of a building storey plus its Elevation and Building name.
+    """
+    props = get_basic_properties(storey)
+    elevation = getattr(storey, "Elevation", None)
+    props["Elevation"] = round_and_format(float(elevation)) if elevation is not None else "N/A"
+    building = get_spatial_index(model if model is not None else storey.file).get_ancestor(storey.id(), "IfcBuilding")
+    props["Building"] = get_element_text_value_or_default("Name", building) if building is not None else "-"
+    return props
 
 def get_attribute_value(element, attribute_name: str) -> Optional[Any]:
     """
@@ -71,95 +93,70 @@ def get_attribute_value(element, attribute_name: str) -> Optional[Any]:
     """
     return getattr(element, attribute_name, None)
 
-def get_all_attributes(element) -> Dict[str, Dict[str, Any]]:
+# Attributes left out of get_all_attributes, as (owning class, attribute name)
+EXCLUDED_ATTRIBUTES = {("IfcRoot", "OwnerHistory")}
+
+
+@lru_cache(maxsize=None)
+def get_attribute_layout(schema_name: str, class_name: str) -> Tuple[Tuple[str, Tuple[Tuple[int, str], ...]], ...]:
     """
-    Retrieves all attributes of the element, grouped by their defining class hierarchy up to IfcRoot.
+    Returns the attribute layout of an IFC class, from the top-most supertype down to the class:
+    ((owning class, ((attribute index, attribute name), ...)), ...).
+    The index is the position of the attribute in the instance, so values can be read with element[index].
+    Computed once per (schema, class).
     """
-    result = {}
-    
-    # Get the inheritance hierarchy
-    current_entity = element
+    import ifcopenshell
+
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema_name)
+    entity_def = schema.declaration_by_name(class_name)
+
     hierarchy = []
-    
-    # Using IfcOpenShell entity definition to traverse hierarchy
-    # element.wrapped_data.is_a() returns the class name.
-    # We can inspect the schema to get parent classes.
-    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(element.file.schema)
-    entity_def = schema.declaration_by_name(element.is_a())
-    
     while entity_def:
         hierarchy.append(entity_def)
         entity_def = entity_def.supertype()
-
-    # Reverse hierarchy to start from IfcRoot (or top-most parent)
     hierarchy.reverse()
 
+    layout = []
+    previous_count = 0
     for entity_def in hierarchy:
-        class_name = entity_def.name()
-
-        attribute_count = entity_def.attribute_count()
-        for i in range(attribute_count):
-            attr_def = entity_def.attribute_by_index(i)
-            attr_name = attr_def.name()
-    
-    # Re-build hierarchy list (Specific -> Root)
-    hierarchy_defs = []
-    e_def = schema.declaration_by_name(element.is_a())
-    while e_def:
-        hierarchy_defs.append(e_def)
-        e_def = e_def.supertype()
-        
-    # Now iterate from top (Root) down to Specific
-    hierarchy_defs.reverse() 
-    
-    previous_attrs = set()
-    result = {} # Ordered dict by default in Python 3.7+
-
-    for e_def in hierarchy_defs:
-        class_name = e_def.name()
-        current_attrs = set()
-        
-        count = e_def.attribute_count()
-        for i in range(count):
-            current_attrs.add(e_def.attribute_by_index(i).name())
-            
-        # Attributes defined in THIS class are (Current - Previous)
-        defined_attrs_names = current_attrs - previous_attrs
-        
-        class_data = {}
-        for attr_name in defined_attrs_names:
-            # Retrieve value from the element instance
-            val = getattr(element, attr_name, None)
-
-            # Format value
-            if val is None:
-                val_str = None
-            elif isinstance(val, (tuple, list)):
-                 val_str = str(val)
-            elif isinstance(val, float):
-                 val_str = round_and_format(val)
-            elif attr_name == "ObjectPlacement":
-                 val_str = format_local_placement(val)
-            elif hasattr(val, "is_a"):
-                 val_str = f"#{val.id()} {val.is_a()}"
-            else:
-                 val_str = str(val)
-
-            class_data[attr_name] = val_str
-            
-        if class_data:
-            # Exclude specific attributes as requested
-            if class_name == "IfcRoot" and attr_name == "OwnerHistory":
-                continue
-            if class_name == "IfcProduct" and attr_name == "ObjectPlacement":
-                continue
-
-            result[class_name] = class_data
-        else:
-            result[class_name] = None
-            
-        previous_attrs = current_attrs
-
+        owner = entity_def.name()
+        count = entity_def.attribute_count()
+        # Attributes defined in THIS class follow the ones inherited from the supertype
+        attributes = tuple(
+            (i, entity_def.attribute_by_index(i).name())
+            for i in range(previous_count, count)
+            if (owner, entity_def.attribute_by_index(i).name()) not in EXCLUDED_ATTRIBUTES
+        )
+        layout.append((owner, attributes))
+        previous_count = count
+
+    return tuple(layout)
+
+def format_attribute_value(attr_name: str, val: Any) -> Optional[Any]:
+    """
+    Formats an attribute value for display.
+    """
+    if val is None:
+        return None
+    if isinstance(val, (tuple, list)):
+        return str(val)
+    if isinstance(val, float):
+        return round_and_format(val)
+    if attr_name == "ObjectPlacement":
+        return format_local_placement(val)
+    if hasattr(val, "is_a"):
+        return f"#{val.id()} {val.is_a()}"
+    return str(val)
+
+def get_all_attributes(element) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Retrieves all attributes of the element, grouped by their defining class hierarchy up to IfcRoot.
+    Classes that define no attributes of their own map to None.
+    """
+    result = {}
+    for class_name, attributes in get_attribute_layout(element.file.schema, element.is_a()):
+        class_data = {name: format_attribute_value(name, element[i]) for i, name in attributes}
+        result[class_name] = class_data or None
     return result
 
 def format_local_placement(placement) -> Optional[Any]:
@@ -0,0 +1,64 @@
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_all
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ontobdc.run.core.port.contex import CliContextPort
+from ontobdc.run.core.capability import Capability, CapabilityExecutor
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.trace import propagate_context
+
+
+class ConcurrentCapabilityExecutor(CapabilityExecutor):
+    """
+    Runs several capabilities at the same time on a thread pool, sharing parsed models.
+
+    Only capabilities are accepted: they read the model and never modify it, so one
+    parsed copy from the model registry is shared by every task. Actions write to
+    the file and still run alone through CapabilityExecutor. The model a task reads
+    (its ifc_path) is opened before the task is queued, so concurrent tasks never
+    race to parse the same file.
+
+    Tasks run in a copy of the caller's context: nested capabilities record into the
+    caller's tracer and see its output options.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="infobim-capability")
+
+    def __enter__(self) -> "ConcurrentCapabilityExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def submit(self, capability: Capability, context: CliContextPort) -> Future:
+        """
+        Queues a capability run and returns the future of its result.
+        """
+        if not isinstance(capability, Capability):
+            raise TypeError(f"Only read-only capabilities run concurrently, got {type(capability).__name__}.")
+        self._open_shared_model(context)
+        return self._pool.submit(propagate_context(self.execute), capability, context)
+
+    def execute_all(self, tasks: Sequence[Tuple[Capability, CliContextPort]]) -> List[Dict[str, Any]]:
+        """
+        Runs every (capability, context) pair concurrently and returns their results in order.
+        The first failure is raised once every task has finished.
+        """
+        futures = [self.submit(capability, context) for capability, context in tasks]
+        wait_all(futures)
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _open_shared_model(context: CliContextPort) -> None:
+        ifc_path = context.get_parameter_value("ifc_path")
+        # Runs through the sidecar index or a low-memory scan load only a fragment of the model
+        if not ifc_path or context.get_parameter_value("use_index") or context.get_parameter_value("low_memory"):
+            return
+        try:
+            open_model(ifc_path)
+        except OSError:
+            # The task reports the missing file with its own error
+            pass
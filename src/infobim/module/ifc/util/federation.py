@@ -0,0 +1,138 @@
+
+import os
+import glob
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from infobim.module.ifc.util.pool import create_process_pool
+from infobim.module.ifc.util.scan import find_ifc_files
+
+
+# Federated runs: an ifc_path naming a directory or a glob pattern runs the
+# capability once per IFC file, each in a worker process, and the results are
+# merged with the file recorded in a SourceFile column. A failing file does
+# not fail the run; it is reported with its error under SOURCES_KEY.
+
+SOURCE_COLUMN = "SourceFile"
+SOURCES_KEY = "org.infobim.domain.ifc.source.list.content"
+FAILED_KEY = "org.infobim.domain.ifc.source.list.failed"
+
+GLOB_CHARACTERS = "*?["
+
+# Parameters that only make sense for the merged result, never per file
+PER_RUN_PARAMETERS = ("ifc_path", "diagnostics", "trace_file", "export_path", "stream", "page", "page_size", "pager")
+
+
+def get_federated_paths(ifc_path: Optional[str]) -> Optional[List[str]]:
+    """
+    Returns the IFC files named by a directory (searched recursively) or a glob
+    pattern, in a stable order. Returns None when `ifc_path` names a single file.
+    """
+    if not ifc_path:
+        return None
+    if os.path.isdir(ifc_path):
+        paths = find_ifc_files(ifc_path)
+    elif any(c in ifc_path for c in GLOB_CHARACTERS) and not os.path.exists(ifc_path):
+        paths = sorted(os.path.abspath(p) for p in glob.glob(ifc_path, recursive=True) if os.path.isfile(p))
+    else:
+        return None
+    if not paths:
+        raise FileNotFoundError(f"No IFC files found in {ifc_path}.")
+    return paths
+
+
+class FileContext:
+    """
+    Context of one per-file run: the caller's parameter values with ifc_path set to the file.
+    Plain data, so it can be sent to a worker process.
+    """
+
+    def __init__(self, values: Dict[str, Any]):
+        self.unprocessed_args: List[str] = []
+        self.parameters: Dict[str, Dict[str, Any]] = {name: {"value": value} for name, value in values.items()}
+
+    def get_parameter(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.parameters.get(name)
+
+    def get_parameter_value(self, name: str) -> Optional[Any]:
+        parameter = self.parameters.get(name)
+        if parameter is None:
+            return None
+        return parameter.get("value")
+
+
+def _run_file(capability_class: Any, values: Dict[str, Any], path: str) -> Dict[str, Any]:
+    try:
+        result = capability_class().execute(FileContext(dict(values, ifc_path=path)))
+        return {"Path": path, "Result": result, "Error": None}
+    except Exception as e:
+        return {"Path": path, "Result": None, "Error": f"{type(e).__name__}: {e}"}
+
+
+def run_per_file(
+    capability_class: Any,
+    context: Any,
+    paths: Sequence[str],
+    overrides: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Runs the capability on every file, one worker process per core at most, and
+    returns one outcome per file in `paths` order: {"Path", "Result", "Error"}.
+    `overrides` replaces parameter values of the per-file runs (None removes one).
+    """
+    values = {
+        name: context.get_parameter_value(name)
+        for name in getattr(context, "parameters", {})
+        if name not in PER_RUN_PARAMETERS
+    }
+    for name, value in (overrides or {}).items():
+        if value is None:
+            values.pop(name, None)
+        else:
+            values[name] = value
+
+    max_workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    if max_workers == 1:
+        # One process: run here and keep the parsed models in this registry
+        return [_run_file(capability_class, values, path) for path in paths]
+
+    with create_process_pool(max_workers) as pool:
+        return list(pool.map(_run_file, [capability_class] * len(paths), [values] * len(paths), paths))
+
+
+def get_sources(outcomes: Iterable[Dict[str, Any]], count_key: str) -> List[Dict[str, Any]]:
+    """
+    Summarizes the per-file outcomes: path, number of records and error.
+    Raises when every file failed.
+    """
+    sources = [
+        {
+            "Path": outcome["Path"],
+            "Count": None if outcome["Error"] else outcome["Result"].get(count_key),
+            "Error": outcome["Error"],
+        }
+        for outcome in outcomes
+    ]
+    if sources and all(source["Error"] for source in sources):
+        raise RuntimeError(f"All {len(sources)} files failed; first error in {sources[0]['Path']}: {sources[0]['Error']}")
+    return sources
+
+
+def merge_rows(outcomes: Iterable[Dict[str, Any]], content_key: str) -> List[Dict[str, Any]]:
+    """
+    Concatenates the content rows of the successful outcomes, in file order,
+    each prefixed with its SourceFile.
+    """
+    rows = []
+    for outcome in outcomes:
+        if outcome["Error"]:
+            continue
+        path = outcome["Path"]
+        for row in outcome["Result"].get(content_key) or []:
+            rows.append({SOURCE_COLUMN: path, **row})
+    return rows
+
+
+def attach_sources(result: Dict[str, Any], sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+    result[SOURCES_KEY] = sources
+    result[FAILED_KEY] = sum(1 for source in sources if source["Error"])
+    return result
@@ -0,0 +1,81 @@
+
+from typing import Any, Dict, Optional
+
+
+def format_material_name(material) -> str:
+    """
+    Formats a material definition (material, list, set or set usage) as a display name.
+    """
+    if not material:
+        return "-"
+    if material.is_a("IfcMaterial"):
+        return material.Name
+    if material.is_a("IfcMaterialList"):
+        return ", ".join([m.Name for m in material.Materials])
+    if material.is_a("IfcMaterialLayerSetUsage"):
+        material = material.ForLayerSet
+    if material and material.is_a("IfcMaterialLayerSet"):
+        if material.MaterialLayers:
+            return ", ".join([l.Material.Name for l in material.MaterialLayers if l.Material])
+        return "-"
+    if material and material.is_a("IfcMaterialProfileSetUsage"):
+        material = material.ForProfileSet
+    if material and material.is_a("IfcMaterialProfileSet"):
+        if material.MaterialProfiles:
+            return ", ".join([p.Material.Name for p in material.MaterialProfiles if p.Material])
+        return "-"
+    if material and material.is_a("IfcMaterialConstituentSet"):
+        if material.MaterialConstituents:
+            return ", ".join([c.Material.Name for c in material.MaterialConstituents if c.Material])
+    return "-"
+
+
+class MaterialIndex:
+    """
+    Material associations of a model, built in one pass over IfcRelAssociatesMaterial.
+
+    Occurrences without a material of their own inherit it from their type
+    object (IfcRelDefinesByType). Display names are memoized per material
+    definition, so all instances of a type share one lookup.
+    """
+
+    def __init__(self, model):
+        self._materials: Dict[int, Any] = {}
+        self._types: Dict[int, int] = {}
+        self._names: Dict[int, str] = {}
+
+        for rel in model.by_type("IfcRelAssociatesMaterial"):
+            material = rel.RelatingMaterial
+            for obj in rel.RelatedObjects or []:
+                # The first association wins, as in ifcopenshell.util.element.get_material
+                self._materials.setdefault(obj.id(), material)
+
+        for rel in model.by_type("IfcRelDefinesByType"):
+            if not rel.RelatingType:
+                continue
+            type_id = rel.RelatingType.id()
+            for obj in rel.RelatedObjects or []:
+                self._types[obj.id()] = type_id
+
+    def get_material(self, element) -> Optional[Any]:
+        """
+        Returns the material definition of the element or, failing that, of its type.
+        """
+        element_id = element.id()
+        material = self._materials.get(element_id)
+        if material is None:
+            type_id = self._types.get(element_id)
+            if type_id is not None:
+                material = self._materials.get(type_id)
+        return material
+
+    def get_material_name(self, element) -> str:
+        material = self.get_material(element)
+        if material is None:
+            return "-"
+
+        material_id = material.id()
+        name = self._names.get(material_id)
+        if name is None:
+            name = self._names[material_id] = format_material_name(material)
+        return name
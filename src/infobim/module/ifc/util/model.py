@@ -0,0 +1,217 @@
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from infobim.module.ifc.util.compressed import resolve_ifc_path
+
+
+# Budget for parsed models kept alive by the registry, in megabytes
+DEFAULT_MEMORY_BUDGET_MB = 4096
+MEMORY_BUDGET_ENV = "INFOBIM_MODEL_CACHE_MB"
+
+# A parsed IfcOpenShell model takes several times the size of its STEP text in RAM
+DEFAULT_SIZE_FACTOR = 8.0
+SIZE_FACTOR_ENV = "INFOBIM_MODEL_SIZE_FACTOR"
+
+
+def get_model_key(ifc_path: str) -> Tuple[str, int, int]:
+    """
+    Returns the registry key (real path, mtime in ns, size in bytes) of an IFC file.
+    Compressed files are keyed by their decompressed copy.
+    """
+    real_path = os.path.realpath(resolve_ifc_path(ifc_path))
+    stat = os.stat(real_path)
+    return (real_path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_file_key(model: Any) -> int:
+    """
+    Returns a stable identity of the parsed file behind a model object.
+    IfcOpenShell hands out a new Python wrapper for the same file on every
+    `element.file`, so the object's id() cannot be used.
+    """
+    file_pointer = getattr(model, "file_pointer", None)
+    return file_pointer() if file_pointer is not None else id(model)
+
+
+class _ModelEntry:
+    def __init__(self, key: Tuple[str, int, int], model: Any, cost: int):
+        self.key = key
+        self.model = model
+        self.cost = cost
+        self.file_key = get_file_key(model)
+
+
+class ModelRegistry:
+    """
+    Process-wide LRU cache of parsed IFC models keyed by (path, mtime, size).
+
+    Models are evicted least recently used first once the estimated memory
+    of the cached models exceeds the budget. The estimate is the file size
+    multiplied by a size factor, since IfcOpenShell does not report the
+    memory held by a parsed file.
+    """
+
+    def __init__(self, memory_budget: Optional[int] = None, size_factor: Optional[float] = None):
+        if memory_budget is None:
+            memory_budget = int(float(os.environ.get(MEMORY_BUDGET_ENV, DEFAULT_MEMORY_BUDGET_MB)) * 1024 * 1024)
+        if size_factor is None:
+            size_factor = float(os.environ.get(SIZE_FACTOR_ENV, DEFAULT_SIZE_FACTOR))
+
+        self.memory_budget = memory_budget
+        self.size_factor = size_factor
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], _ModelEntry]" = OrderedDict()
+        # Derived indexes per parsed file (see get_file_key)
+        self._indexes: Dict[int, Dict[str, Any]] = {}
+        self._registered: Dict[int, Tuple[str, int, int]] = {}
+        self.index_builds = 0
+        self._lock = threading.RLock()
+
+    def open(self, ifc_path: str) -> Any:
+        """
+        Returns the parsed model for the file, opening it only if no fresh copy is cached.
+        """
+        key = get_model_key(ifc_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.model
+
+            self.misses += 1
+            # Drop stale revisions of the same path before parsing the new one
+            for stale_key in [k for k in self._entries if k[0] == key[0]]:
+                self._evict(stale_key)
+
+            import ifcopenshell
+
+            model = ifcopenshell.open(key[0])
+            self.add(key, model)
+            return model
+
+    def get_cached(self, ifc_path: str) -> Optional[Any]:
+        """
+        Returns the parsed model when a fresh copy is cached, without opening the file.
+        """
+        key = get_model_key(ifc_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.model
+
+    def add(self, key: Tuple[str, int, int], model: Any) -> None:
+        """
+        Registers an already parsed model under the given key.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+
+            cost = int(key[2] * self.size_factor)
+            entry = self._entries[key] = _ModelEntry(key, model, cost)
+            self._registered[entry.file_key] = key
+            self._enforce_budget(keep=key)
+
+    def get_index(self, model: Any, name: str, builder: Callable[[Any], Any]) -> Any:
+        """
+        Returns a derived index of the model, building it once per parsed file with
+        `builder(model)`. Any wrapper of the file finds it (e.g. `element.file`).
+        Indexes of a registered model live as long as its registry entry; those of
+        other models as long as the wrapper owning the file. A borrowed wrapper of
+        an unregistered file gets a fresh, uncached index.
+        """
+        file_key = get_file_key(model)
+        with self._lock:
+            indexes = self._indexes.get(file_key)
+            if indexes is None:
+                if file_key not in self._registered:
+                    if not getattr(model, "thisown", True):
+                        self.index_builds += 1
+                        return builder(model)
+                    weakref.finalize(model, self._indexes.pop, file_key, None)
+                indexes = self._indexes[file_key] = {}
+            if name in indexes:
+                return indexes[name]
+
+        index = builder(model)
+        with self._lock:
+            self.index_builds += 1
+            return self._indexes.setdefault(file_key, {}).setdefault(name, index)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters and the current memory usage estimate.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "models": len(self._entries),
+                "index_builds": self.index_builds,
+                "estimated_bytes": sum(e.cost for e in self._entries.values()),
+                "memory_budget": self.memory_budget,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+    def _estimated_bytes(self) -> int:
+        return sum(e.cost for e in self._entries.values())
+
+    def _enforce_budget(self, keep: Tuple[str, int, int]) -> None:
+        # The most recent model is always kept, even when it alone exceeds the budget
+        while self._estimated_bytes() > self.memory_budget and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._evict(oldest)
+
+    def _evict(self, key: Tuple[str, int, int]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._registered.pop(entry.file_key, None)
+            self._indexes.pop(entry.file_key, None)
+            self.evictions += 1
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Returns the process-wide model registry.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
+
+
+def open_model(ifc_path: str) -> Any:
+    """
+    Opens an IFC file through the process-wide model registry.
+    """
+    return get_model_registry().open(ifc_path)
+
+
+def get_model_index(model: Any, name: str, builder: Callable[[Any], Any]) -> Any:
+    """
+    Returns a cached index of the model, built once per model by `builder`.
+    """
+    return get_model_registry().get_index(model, name, builder)
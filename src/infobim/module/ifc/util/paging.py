@@ -0,0 +1,30 @@
+
+from typing import Any, Dict, Optional
+
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def get_page_window(total: int, page: Optional[Any] = None, page_size: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Resolves a 1-based page number and page size (CLI strings or ints) against a row count.
+    Returns {"page", "page_size", "pages", "start", "end"}; the page is clamped to the last one.
+    """
+    try:
+        page_size = int(page_size) if page_size not in (None, "") else DEFAULT_PAGE_SIZE
+        page = int(page) if page not in (None, "") else 1
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid page ({page}) or page size ({page_size}).")
+    if page_size < 1 or page < 1:
+        raise ValueError("Page and page size must be positive.")
+
+    pages = max(1, (total + page_size - 1) // page_size)
+    page = min(page, pages)
+    start = (page - 1) * page_size
+    return {
+        "page": page,
+        "page_size": page_size,
+        "pages": pages,
+        "start": start,
+        "end": min(start + page_size, total),
+    }
@@ -0,0 +1,15 @@
+
+from typing import Any, List, Optional
+
+
+def split_list_value(value: Optional[Any]) -> List[str]:
+    """
+    Splits a comma separated CLI value (or passes a list through) into clean items.
+    """
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        items = [str(v) for v in value]
+    else:
+        items = str(value).split(",")
+    return [item.strip() for item in items if item.strip()]
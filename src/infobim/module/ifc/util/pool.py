@@ -0,0 +1,14 @@
+
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns a process pool, started with spawn instead of fork when other threads are running.
+    """
+    # A forked child inherits locks other threads hold (e.g. the model registry's
+    # in the resident worker) and could wait on them forever
+    mp_context = multiprocessing.get_context("spawn") if threading.active_count() > 1 else None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
@@ -0,0 +1,157 @@
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+def get_property_value(prop) -> Optional[Any]:
+    """
+    Returns a plain Python value (None, bool, int, float or str) for an IfcProperty or IfcPhysicalQuantity.
+    """
+    if prop.is_a("IfcPropertySingleValue"):
+        value = prop.NominalValue.wrappedValue if prop.NominalValue else None
+    elif prop.is_a("IfcPropertyEnumeratedValue"):
+        values = prop.EnumerationValues or []
+        value = ", ".join([str(v.wrappedValue) for v in values])
+    elif prop.is_a("IfcPropertyListValue"):
+        values = prop.ListValues or []
+        value = ", ".join([str(v.wrappedValue) for v in values])
+    elif prop.is_a("IfcPhysicalSimpleQuantity"):
+        # LengthValue, AreaValue, VolumeValue, ... are always the fourth attribute
+        value = prop[3]
+    else:
+        return None
+
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return str(value)
+
+
+def get_property_definition_values(definition, property_names: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Returns { PropName: value } for an IfcPropertySet or IfcElementQuantity.
+    """
+    values: Dict[str, Any] = {}
+    if definition.is_a("IfcPropertySet"):
+        props = definition.HasProperties or []
+    elif definition.is_a("IfcElementQuantity"):
+        props = definition.Quantities or []
+    else:
+        return values
+
+    for prop in props:
+        if property_names and prop.Name not in property_names:
+            continue
+        values[prop.Name] = get_property_value(prop)
+    return values
+
+
+class PropertySetTable:
+    """
+    Wide table of property values for all elements of a class.
+
+    Occurrence property sets are collected in one pass over
+    IfcRelDefinesByProperties and type property sets in one pass over
+    IfcRelDefinesByType. Each property set is read once, however many
+    elements share it. Columns are named "<Pset>.<Property>"; occurrence
+    values override values defined on the type.
+    """
+
+    def __init__(
+        self,
+        model,
+        ifc_class: str = "IfcProduct",
+        pset_names: Optional[Sequence[str]] = None,
+        property_names: Optional[Sequence[str]] = None,
+    ):
+        self.elements = model.by_type(ifc_class)
+        self.pset_names = set(pset_names) if pset_names else None
+        self.property_names = set(property_names) if property_names else None
+
+        self._definitions: Dict[int, Dict[str, Any]] = {}
+        self._occurrence_psets: Dict[int, List[int]] = {}
+        self._type_psets: Dict[int, List[int]] = {}
+        self._types: Dict[int, int] = {}
+        self._columns: Dict[str, None] = {}
+
+        element_ids = {el.id() for el in self.elements}
+
+        for rel in model.by_type("IfcRelDefinesByProperties"):
+            definition = rel.RelatingPropertyDefinition
+            # IFC4 allows a set of definitions (IfcPropertySetDefinitionSet)
+            definitions = definition if isinstance(definition, (list, tuple)) else [definition]
+            for d in definitions:
+                if not self._accept_definition(d):
+                    continue
+                related = [obj.id() for obj in rel.RelatedObjects or [] if obj.id() in element_ids]
+                if not related:
+                    continue
+                self._read_definition(d)
+                for obj_id in related:
+                    self._occurrence_psets.setdefault(obj_id, []).append(d.id())
+
+        for rel in model.by_type("IfcRelDefinesByType"):
+            element_type = rel.RelatingType
+            if not element_type:
+                continue
+            related = [obj.id() for obj in rel.RelatedObjects or [] if obj.id() in element_ids]
+            if not related:
+                continue
+            type_id = element_type.id()
+            if type_id not in self._type_psets:
+                self._type_psets[type_id] = []
+                for d in getattr(element_type, "HasPropertySets", None) or []:
+                    if self._accept_definition(d):
+                        self._read_definition(d)
+                        self._type_psets[type_id].append(d.id())
+            for obj_id in related:
+                self._types[obj_id] = type_id
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def get_row(self, element) -> Dict[str, Any]:
+        """
+        Returns the property values of one element, type values merged first.
+        """
+        element_id = element.id()
+        row: Dict[str, Any] = {}
+        type_id = self._types.get(element_id)
+        if type_id is not None:
+            for definition_id in self._type_psets.get(type_id, []):
+                row.update(self._definitions[definition_id])
+        for definition_id in self._occurrence_psets.get(element_id, []):
+            row.update(self._definitions[definition_id])
+        return row
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields one row per element with GlobalId, Name, Class and every selected column.
+        """
+        columns = self.columns
+        for el in self.elements:
+            values = self.get_row(el)
+            row = {
+                "GlobalId": el.GlobalId,
+                "Name": el.Name,
+                "Class": el.is_a(),
+            }
+            for column in columns:
+                row[column] = values.get(column)
+            yield row
+
+    def _accept_definition(self, definition) -> bool:
+        if not definition.is_a("IfcPropertySet") and not definition.is_a("IfcElementQuantity"):
+            return False
+        return not self.pset_names or definition.Name in self.pset_names
+
+    def _read_definition(self, definition) -> None:
+        definition_id = definition.id()
+        if definition_id in self._definitions:
+            return
+        values = {
+            f"{definition.Name}.{name}": value
+            for name, value in get_property_definition_values(definition, self.property_names).items()
+        }
+        for column in values:
+            self._columns.setdefault(column, None)
+        self._definitions[definition_id] = values
@@ -0,0 +1,203 @@
+
+import re
+import heapq
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from infobim.module.ifc.util.element import get_element_text_value_or_default, get_material_name, get_storey_name
+from infobim.module.ifc.util.property import PropertySetTable
+
+
+# Element queries of list_elements: predicates (--where), projection (--columns),
+# ordering (--order-by) and windowing (--offset/--limit) evaluated on the IFC
+# entities themselves, so rows are only built for the elements returned.
+#
+# A field is "Class", "Material", "Storey", a direct attribute (Name, Tag, PredefinedType, ...)
+# or "<Pset>.<Property>". Predicates are separated by ';':
+#   Name~wall                 contains, case-insensitive
+#   PredefinedType=STANDARD   equals (!= for not equal), case-insensitive
+#   Pset_WallCommon.IsExternal=true
+#   Qto_WallBaseQuantities.Length>=5   numeric comparison (>, >=, <, <=)
+#   Pset_WallCommon.FireRating         the field has a value
+
+PREDICATE_RE = re.compile(r"^\s*([^=!<>~]+?)\s*(!=|>=|<=|=|>|<|~)\s*(.*?)\s*$")
+NUMERIC_OPERATORS = (">", ">=", "<", "<=")
+
+
+def is_property_field(field: str) -> bool:
+    return "." in field
+
+
+class Predicate:
+    """
+    One condition of a --where clause.
+    """
+
+    def __init__(self, field: str, operator: Optional[str] = None, value: Optional[str] = None):
+        self.field = field
+        self.operator = operator
+        self.value = value
+        self._text = (value or "").lower()
+        self._number: Optional[float] = None
+        if operator in NUMERIC_OPERATORS:
+            try:
+                self._number = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Predicate {field}{operator}{value} needs a numeric value.")
+
+    def matches(self, value: Any) -> bool:
+        if self.operator is None:
+            return value is not None and value != ""
+        if self.operator in NUMERIC_OPERATORS:
+            if isinstance(value, bool) or value is None:
+                return False
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                return False
+            if self.operator == ">":
+                return number > self._number
+            if self.operator == ">=":
+                return number >= self._number
+            if self.operator == "<":
+                return number < self._number
+            return number <= self._number
+
+        text = "" if value is None else str(value).lower()
+        if self.operator == "~":
+            return self._text in text
+        equal = text == self._text
+        return equal if self.operator == "=" else not equal
+
+
+def parse_predicates(text: Optional[str]) -> List[Predicate]:
+    """
+    Parses a --where clause into predicates, all of which must match.
+    """
+    predicates = []
+    for item in (text or "").split(";"):
+        if not item.strip():
+            continue
+        match = PREDICATE_RE.match(item)
+        if match:
+            predicates.append(Predicate(match.group(1), match.group(2), match.group(3)))
+        else:
+            predicates.append(Predicate(item.strip()))
+    return predicates
+
+
+def parse_order_by(order_by: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Returns (field, descending) for an order-by value; a leading '-' sorts descending.
+    """
+    if not order_by:
+        return None, False
+    order_by = order_by.strip()
+    if order_by.startswith("-"):
+        return order_by[1:], True
+    return order_by, False
+
+
+def get_property_selection(
+    fields: Iterable[str],
+    pset_names: Sequence[str],
+    property_names: Sequence[str],
+) -> Tuple[List[str], Optional[List[str]]]:
+    """
+    Returns the (pset names, property names) a PropertySetTable needs to answer the
+    explicitly requested property sets and every <Pset>.<Property> field.
+    """
+    psets = list(pset_names)
+    props = list(property_names)
+    referenced = [f.split(".", 1) for f in fields if is_property_field(f)]
+    for pset, prop in referenced:
+        if pset not in psets:
+            psets.append(pset)
+        if prop not in props:
+            props.append(prop)
+    # Whole property sets were asked for: do not restrict them to the referenced properties
+    if pset_names and not property_names:
+        return psets, None
+    return psets, props or None
+
+
+class ElementFieldReader:
+    """
+    Reads query fields from IFC entities: raw values for predicates, display values for rows.
+    """
+
+    def __init__(self, table: Optional[PropertySetTable] = None, model: Any = None):
+        self.table = table
+        # The opened model, whose indexes resolve Material and Storey
+        self.model = model
+        self._last_id: Optional[int] = None
+        self._last_row: Dict[str, Any] = {}
+
+    def _get_property(self, element: Any, field: str) -> Any:
+        if self.table is None:
+            return None
+        # Several fields of the same element are read in a row
+        element_id = element.id()
+        if element_id != self._last_id:
+            self._last_row = self.table.get_row(element)
+            self._last_id = element_id
+        return self._last_row.get(field)
+
+    def get_value(self, element: Any, field: str) -> Any:
+        if field == "Class":
+            return element.is_a()
+        if field == "Material":
+            return get_material_name(element, self.model)
+        if field == "Storey":
+            return get_storey_name(element, self.model)
+        if is_property_field(field):
+            return self._get_property(element, field)
+        value = getattr(element, field, None)
+        if hasattr(value, "is_a"):
+            return f"#{value.id()} {value.is_a()}"
+        return value
+
+    def format(self, element: Any, field: str) -> Any:
+        if field == "Class":
+            return element.is_a()
+        if field == "Material":
+            return get_material_name(element, self.model)
+        if field == "Storey":
+            return get_storey_name(element, self.model)
+        if is_property_field(field):
+            return self._get_property(element, field)
+        return get_element_text_value_or_default(field, element)
+
+    def filter(self, elements: Iterable[Any], predicates: Sequence[Predicate]) -> Iterable[Any]:
+        """
+        Lazily yields the elements matching every predicate.
+        """
+        for element in elements:
+            if all(p.matches(self.get_value(element, p.field)) for p in predicates):
+                yield element
+
+    def select(
+        self,
+        elements: Iterable[Any],
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Orders elements by a field and applies offset/limit. With a limit, a bounded
+        heap keeps only offset + limit elements instead of sorting all of them.
+        """
+        if not order_by:
+            stop = None if limit is None else offset + limit
+            return list(islice(elements, offset, stop))
+
+        # Ties keep model order, as a stable sort would
+        sign = -1 if descending else 1
+        keyed = ((str(self.format(el, order_by)), sign * i, el) for i, el in enumerate(elements))
+        if limit is not None:
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            ordered = pick(offset + limit, keyed, key=lambda item: item[:2])
+        else:
+            ordered = sorted(keyed, key=lambda item: item[:2], reverse=descending)
+        stop = None if limit is None else offset + limit
+        return [el for _, _, el in ordered[offset:stop]]
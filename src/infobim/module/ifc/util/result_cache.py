@@ -0,0 +1,212 @@
+
+import os
+import json
+import hashlib
+import functools
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+from infobim.module.ifc.util.cache import get_cache_dir, get_content_digest
+
+
+# Persistent cache of capability results. An entry is keyed by the content hash
+# of the IFC file, the capability id and version, and the capability's declared
+# inputs with defaults dropped. Changing the model or bumping the capability
+# version therefore never serves a stale result. Entries are JSON files; a hit
+# is read back without importing IfcOpenShell. The least recently used entries
+# are evicted once the cache grows past its budget.
+
+RESULT_CACHE_ENV = "INFOBIM_RESULT_CACHE_MB"
+DEFAULT_RESULT_CACHE_MB = 256
+
+# Bumped when the entry layout or key scheme changes
+CACHE_VERSION = 1
+
+# Parameters with side effects or per-run output; runs using them are not cached
+UNCACHED_PARAMETERS = ("diagnostics", "trace_file", "export_path", "stream", "pager")
+
+# Overrides the lookup; the fresh result replaces the cached one
+NO_CACHE_PARAMETER = "no_cache"
+
+
+def get_parameters_digest(metadata: Any, context: Any) -> str:
+    """
+    Digest of the declared inputs of a run other than ifc_path. Inputs left
+    unset or at their default do not change it, however they were passed.
+    """
+    properties = (getattr(metadata, "input_schema", None) or {}).get("properties", {})
+    values = {}
+    for name, schema in properties.items():
+        if name == "ifc_path":
+            continue
+        value = context.get_parameter_value(name)
+        if value is None or value == "" or value == schema.get("default"):
+            continue
+        values[name] = value
+    text = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def get_result_key(metadata: Any, context: Any) -> Optional[str]:
+    """
+    Returns the cache key of a capability run, or None when the run is not cacheable:
+    no single IFC file, or a parameter with side effects.
+    """
+    ifc_path = context.get_parameter_value("ifc_path")
+    if not ifc_path or not isinstance(ifc_path, str) or not os.path.isfile(ifc_path):
+        return None
+    if any(context.get_parameter_value(name) for name in UNCACHED_PARAMETERS):
+        return None
+    try:
+        content = get_content_digest(ifc_path)
+    except OSError:
+        return None
+    text = "\0".join([
+        str(CACHE_VERSION), content, metadata.id, str(metadata.version), get_parameters_digest(metadata, context),
+    ])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class PersistentResultCache:
+    """
+    Disk-backed LRU cache of capability results, one JSON file per entry.
+    An entry's mtime records its last use.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(RESULT_CACHE_ENV, DEFAULT_RESULT_CACHE_MB)) * 1024 * 1024)
+        self.directory = directory or get_cache_dir("results")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if key is None or not self.enabled:
+            return None
+        path = self._get_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry.get("Result")
+
+    def put(self, key: Optional[str], result: Dict[str, Any], capability_id: str = "") -> bool:
+        """
+        Stores a result. Returns False when it cannot be stored faithfully as JSON
+        (streamed content, tuples, IFC entities).
+        """
+        if key is None or not self.enabled:
+            return False
+        if any(isinstance(v, Iterator) for v in result.values()):
+            return False
+        try:
+            text = json.dumps({"Capability": capability_id, "Result": result})
+        except (TypeError, ValueError):
+            return False
+        # Only results that read back identically are kept (e.g. no tuples or int keys)
+        if json.loads(text)["Result"] != result:
+            return False
+
+        path = self._get_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries until the cache fits its budget.
+        Returns the number of removed entries.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+
+_cache: Optional[PersistentResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> PersistentResultCache:
+    """
+    Returns the process-wide persistent result cache.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PersistentResultCache()
+    return _cache
+
+
+def cache_result(execute: Callable[[Any, Any], Dict[str, Any]]) -> Callable[[Any, Any], Dict[str, Any]]:
+    """
+    Decorates a capability's execute to serve and store its results in the
+    persistent result cache. A run with no_cache set is recomputed and refreshes
+    the entry.
+    """
+
+    @functools.wraps(execute)
+    def run(self: Any, context: Any) -> Dict[str, Any]:
+        cache = get_result_cache()
+        key = get_result_key(self.METADATA, context) if cache.enabled else None
+        if key is not None and not context.get_parameter_value(NO_CACHE_PARAMETER):
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        result = execute(self, context)
+        cache.put(key, result, self.METADATA.id)
+        return result
+
+    return run
@@ -0,0 +1,152 @@
+
+import os
+import json
+import zipfile
+from typing import Any, Dict, List, Optional
+from infobim.module.ifc.util.cache import get_cache_dir, get_content_hash
+from infobim.module.ifc.util.compressed import COMPRESSED_EXTENSIONS, open_step
+from infobim.module.ifc.util.pool import create_process_pool
+from infobim.module.ifc.util.step import parse_header, read_header
+
+
+IFC_EXTENSIONS = (".ifc",) + COMPRESSED_EXTENSIONS
+
+
+def scan_file(path: str) -> Dict[str, Any]:
+    """
+    Reads only the STEP header of an IFC file, plus its size and content hash.
+    A file that cannot be read (e.g. a dangling symlink) gets an Error instead.
+    """
+    record: Dict[str, Any] = {
+        "Path": path,
+        "Name": os.path.basename(path),
+        "Size": None,
+        "ModifiedNs": None,
+        "Hash": None,
+        "Schema": None,
+        "Application": None,
+        "TimeStamp": None,
+        "Header": None,
+        "Error": None,
+    }
+
+    try:
+        stat = os.stat(path)
+        record["Size"] = stat.st_size
+        record["ModifiedNs"] = stat.st_mtime_ns
+        # Only the header is decompressed from .ifczip and .ifc.gz files
+        with open_step(path) as f:
+            header, _ = read_header(f)
+        parsed = parse_header(header)
+        record["Header"] = parsed
+        record["Schema"] = ", ".join([s for s in parsed["Schema"] if s]) or None
+        record["Application"] = parsed["OriginatingSystem"] or parsed["PreprocessorVersion"]
+        record["TimeStamp"] = parsed["TimeStamp"]
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile) as e:
+        record["Error"] = str(e)
+
+    try:
+        record["Hash"] = get_content_hash(path)
+    except OSError as e:
+        record["Error"] = record["Error"] or str(e)
+    return record
+
+
+def find_ifc_files(directory: str) -> List[str]:
+    """
+    Lists IFC files under the directory, recursively and in a stable order.
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(IFC_EXTENSIONS):
+                paths.append(os.path.abspath(os.path.join(root, name)))
+    paths.sort()
+    return paths
+
+
+class ScanCache:
+    """
+    JSON cache of scanned file records, valid while the file size and mtime are unchanged.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_cache_dir("scan"), "files.json")
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._records = json.load(f)
+            except (OSError, ValueError):
+                self._records = {}
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(path)
+        if record is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if record.get("Size") != stat.st_size or record.get("ModifiedNs") != stat.st_mtime_ns:
+            return None
+        return record
+
+    def put(self, record: Dict[str, Any]) -> None:
+        self._records[record["Path"]] = record
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._records, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def scan_directory(directory: str, max_workers: Optional[int] = None, use_cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    Scans all IFC files of a directory, header-only, in a process pool.
+    Identical copies (same content hash) are merged into one record listing every path.
+    """
+    paths = find_ifc_files(directory)
+    cache = ScanCache() if use_cache else None
+
+    records: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    for path in paths:
+        record = cache.get(path) if cache else None
+        if record is not None:
+            records[path] = record
+        else:
+            pending.append(path)
+
+    if len(pending) == 1:
+        records[pending[0]] = scan_file(pending[0])
+    elif pending:
+        max_workers = max_workers or min(len(pending), os.cpu_count() or 1)
+        with create_process_pool(max_workers) as pool:
+            for record in pool.map(scan_file, pending, chunksize=4):
+                records[record["Path"]] = record
+
+    if cache:
+        for path in pending:
+            cache.put(records[path])
+        cache.save()
+
+    # Deduplicate by content hash, keeping the first path in sorted order
+    unique: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        record = records[path]
+        # Unreadable files have no hash and are never merged
+        digest = record["Hash"] or path
+        existing = unique.get(digest)
+        if existing is None:
+            unique[digest] = dict(record, Copies=[path])
+        else:
+            existing["Copies"].append(path)
+
+    return list(unique.values())
@@ -0,0 +1,201 @@
+
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+# IFC2X3 has no IfcSpatialElement; IfcSpatialStructureElement covers the same tree there
+SPATIAL_CLASSES = ("IfcProject", "IfcSpatialElement", "IfcSpatialStructureElement")
+
+
+def is_spatial(entity) -> bool:
+    for class_name in SPATIAL_CLASSES:
+        try:
+            if entity.is_a(class_name):
+                return True
+        except RuntimeError:
+            continue
+    return False
+
+
+class SpatialIndex:
+    """
+    Spatial structure of a model (Project -> Site -> Building -> Storey -> Space)
+    with the elements each node contains, built in one pass over IfcRelAggregates
+    and one over IfcRelContainedInSpatialStructure.
+
+    Elements that are parts of an aggregate (e.g. the members of a stair) are
+    placed in the container of the whole.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._nodes: Dict[int, Any] = {}
+        self._parents: Dict[int, int] = {}
+        self._children: Dict[int, List[int]] = {}
+        self._contained: Dict[int, List[int]] = {}
+        self._containers: Dict[int, int] = {}
+        self._wholes: Dict[int, int] = {}
+        self._parts: Dict[int, List[int]] = {}
+
+        for rel in model.by_type("IfcRelAggregates"):
+            whole = rel.RelatingObject
+            if whole is None:
+                continue
+            whole_spatial = is_spatial(whole)
+            for part in rel.RelatedObjects or []:
+                if whole_spatial and is_spatial(part):
+                    self._nodes[whole.id()] = whole
+                    self._nodes[part.id()] = part
+                    self._parents[part.id()] = whole.id()
+                    self._children.setdefault(whole.id(), []).append(part.id())
+                elif not whole_spatial:
+                    self._wholes[part.id()] = whole.id()
+                    self._parts.setdefault(whole.id(), []).append(part.id())
+
+        for rel in model.by_type("IfcRelContainedInSpatialStructure"):
+            structure = rel.RelatingStructure
+            if structure is None:
+                continue
+            self._nodes.setdefault(structure.id(), structure)
+            members = self._contained.setdefault(structure.id(), [])
+            for element in rel.RelatedElements or []:
+                members.append(element.id())
+                self._containers.setdefault(element.id(), structure.id())
+
+        # Spatial elements that are not aggregated anywhere (e.g. a lone storey)
+        for class_name in ("IfcProject", "IfcSite", "IfcBuilding", "IfcBuildingStorey", "IfcSpace"):
+            try:
+                entities = model.by_type(class_name)
+            except RuntimeError:
+                continue
+            for entity in entities:
+                self._nodes.setdefault(entity.id(), entity)
+
+        self._storeys: Dict[int, Optional[int]] = {}
+
+    # --- Tree ---
+
+    def get_node(self, node_id: int) -> Optional[Any]:
+        return self._nodes.get(node_id)
+
+    def get_parent(self, node_id: int) -> Optional[Any]:
+        parent_id = self._parents.get(node_id)
+        return self._nodes.get(parent_id) if parent_id is not None else None
+
+    def get_children(self, node_id: int, ifc_class: Optional[str] = None) -> List[Any]:
+        children = [self._nodes[i] for i in self._children.get(node_id, [])]
+        if ifc_class:
+            children = [c for c in children if c.is_a(ifc_class)]
+        return children
+
+    def get_descendants(self, node_id: int) -> Iterator[int]:
+        """
+        Yields the ids of the node and every spatial node below it.
+        """
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(self._children.get(current, [])))
+
+    def get_ancestor(self, node_id: int, ifc_class: str) -> Optional[Any]:
+        """
+        Returns the nearest node of the class at or above the given node.
+        """
+        current: Optional[int] = node_id
+        while current is not None:
+            node = self._nodes.get(current)
+            if node is not None and node.is_a(ifc_class):
+                return node
+            current = self._parents.get(current)
+        return None
+
+    def get_storeys(self) -> List[Any]:
+        """
+        Returns every building storey, ordered by building and then by elevation (lowest first).
+        """
+        storeys = [n for n in self._nodes.values() if n.is_a("IfcBuildingStorey")]
+
+        def key(storey):
+            building = self.get_ancestor(storey.id(), "IfcBuilding")
+            elevation = getattr(storey, "Elevation", None)
+            return (
+                building.id() if building is not None else 0,
+                float(elevation) if elevation is not None else 0.0,
+                storey.Name or "",
+            )
+
+        return sorted(storeys, key=key)
+
+    def find_storeys(self, names: Sequence[str]) -> List[Any]:
+        """
+        Returns the storeys matching any of the names, by GlobalId or by Name (case-insensitive).
+        """
+        wanted = {n.strip().lower() for n in names if n and n.strip()}
+        return [
+            s for s in self.get_storeys()
+            if s.GlobalId.lower() in wanted or (s.Name or "").strip().lower() in wanted
+        ]
+
+    # --- Containment ---
+
+    def get_container(self, element) -> Optional[Any]:
+        """
+        Returns the spatial node that contains the element (or the aggregate it is part of).
+        """
+        current: Optional[int] = element.id()
+        seen = set()
+        while current is not None and current not in seen:
+            seen.add(current)
+            container_id = self._containers.get(current)
+            if container_id is not None:
+                return self._nodes.get(container_id)
+            current = self._wholes.get(current)
+        return None
+
+    def get_storey(self, element) -> Optional[Any]:
+        """
+        Returns the building storey the element is on, if any.
+        """
+        element_id = element.id()
+        if element_id not in self._storeys:
+            container = self.get_container(element)
+            storey = self.get_ancestor(container.id(), "IfcBuildingStorey") if container is not None else None
+            self._storeys[element_id] = storey.id() if storey is not None else None
+        storey_id = self._storeys[element_id]
+        return self._nodes.get(storey_id) if storey_id is not None else None
+
+    def get_element_ids(self, node_id: int, recursive: bool = True) -> List[int]:
+        """
+        Returns the ids of the elements contained in the node (and its spaces, etc. when recursive),
+        followed by the parts of contained aggregates, as get_container places them.
+        """
+        node_ids = self.get_descendants(node_id) if recursive else [node_id]
+        ids: List[int] = []
+        for current in node_ids:
+            ids.extend(self._contained.get(current, []))
+
+        seen = set(ids)
+        stack = list(reversed(ids))
+        while stack:
+            for part_id in self._parts.get(stack.pop(), []):
+                # A part contained in its own right belongs to that container
+                if part_id in seen or part_id in self._containers:
+                    continue
+                seen.add(part_id)
+                ids.append(part_id)
+                stack.append(part_id)
+        return ids
+
+    def get_elements(self, node_id: int, ifc_class: Optional[str] = None, recursive: bool = True) -> List[Any]:
+        elements = [self.model.by_id(i) for i in self.get_element_ids(node_id, recursive)]
+        if ifc_class:
+            elements = [e for e in elements if e.is_a(ifc_class)]
+        return elements
+
+    def get_class_histogram(self, node_id: int, ifc_class: Optional[str] = None) -> Dict[str, int]:
+        """
+        Counts the contained elements per IFC class, largest first.
+        """
+        counts = Counter(e.is_a() for e in self.get_elements(node_id, ifc_class))
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
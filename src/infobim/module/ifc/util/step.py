@@ -0,0 +1,243 @@
+
+import re
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Building blocks for reading STEP (ISO 10303-21) files without IfcOpenShell.
+# Records are '#<id>=<TYPE>(<args>);' and may span lines; strings are
+# single-quoted with '' as the escaped quote, so a record is complete when
+# it ends with ';' and contains an even number of quotes.
+
+RECORD_RE = re.compile(rb"#(\d+)\s*=\s*([A-Za-z0-9_]+)\s*\((.*)\)\s*;\s*$", re.S)
+STRING_RE = re.compile(rb"'(?:[^']|'')*'")
+REFERENCE_RE = re.compile(rb"#(\d+)")
+GUID_RE = re.compile(rb"\s*'([0-9A-Za-z_$]{22})'")
+TOKEN_RE = re.compile(rb"'(?:[^']|'')*'|#\d+|[(),]|[^'#(),]+")
+SINGLE_REFERENCE_RE = re.compile(rb"\s*#(\d+)\s*$")
+HEADER_RECORD_RE = re.compile(rb"([A-Za-z_]+)\s*\((.*)\)\s*;\s*$", re.S)
+
+
+def read_header(f: BinaryIO) -> Tuple[bytes, int]:
+    """
+    Reads from the start of the file up to and including the 'DATA;' line.
+    Returns (header bytes, offset of the first byte after it).
+    """
+    f.seek(0)
+    chunks = []
+    offset = 0
+    for line in f:
+        chunks.append(line)
+        offset += len(line)
+        if line.strip().upper() == b"DATA;":
+            return b"".join(chunks), offset
+    raise ValueError("STEP file has no DATA section.")
+
+
+def _split_records(chunk: bytes, offset: int) -> Iterator[Tuple[int, bytes]]:
+    # Slow path for lines holding several records: split on ';' outside strings
+    start = 0
+    pos = 0
+    while pos < len(chunk):
+        string = STRING_RE.match(chunk, pos) if chunk[pos:pos + 1] == b"'" else None
+        if string:
+            pos = string.end()
+            continue
+        if chunk[pos:pos + 1] == b";":
+            record = chunk[start:pos + 1]
+            stripped = record.lstrip()
+            if stripped:
+                yield offset + start + (len(record) - len(stripped)), stripped
+            start = pos + 1
+        pos += 1
+    rest = chunk[start:].strip()
+    if rest:
+        yield offset + start + (len(chunk[start:]) - len(chunk[start:].lstrip())), rest
+
+
+def iter_records(f: BinaryIO, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yields (byte offset, record bytes) for each record of the DATA section.
+    Scanning starts after the header (or at `start`, which must be at a record
+    boundary) and stops at ENDSEC or after the record that crosses `end`.
+    """
+    if start is None:
+        _, start = read_header(f)
+    f.seek(start)
+
+    offset = start
+    pending: List[bytes] = []
+    pending_offset = offset
+    quotes = 0
+
+    for line in f:
+        line_offset = offset
+        offset += len(line)
+
+        if not pending:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.upper().startswith(b"ENDSEC"):
+                return
+            pending_offset = line_offset
+
+        pending.append(line)
+        quotes += line.count(b"'")
+        if quotes % 2 or not line.rstrip().endswith(b";"):
+            continue
+
+        chunk = b"".join(pending)
+        pending = []
+        quotes = 0
+
+        if chunk.count(b";") == 1:
+            stripped = chunk.lstrip()
+            yield pending_offset + len(chunk) - len(stripped), stripped.rstrip()
+        else:
+            for record_offset, record in _split_records(chunk, pending_offset):
+                if record.upper().startswith(b"ENDSEC"):
+                    return
+                yield record_offset, record
+
+        if end is not None and offset >= end:
+            return
+
+
+def parse_record(record: bytes) -> Optional[Tuple[int, bytes, bytes]]:
+    """
+    Splits a record into (step id, upper-case type name, raw argument bytes).
+    """
+    match = RECORD_RE.match(record)
+    if not match:
+        return None
+    return int(match.group(1)), match.group(2).upper(), match.group(3)
+
+
+def get_references(args: bytes) -> List[int]:
+    """
+    Returns the step ids referenced by the arguments of a record, in order.
+    """
+    if b"'" in args:
+        args = STRING_RE.sub(b"''", args)
+    return [int(r) for r in REFERENCE_RE.findall(args)]
+
+
+def get_guid(args: bytes) -> Optional[str]:
+    """
+    Returns the GlobalId of an IfcRoot record (its first argument), if any.
+    """
+    match = GUID_RE.match(args)
+    if not match:
+        return None
+    return match.group(1).decode("ascii")
+
+
+def drop_list_references(args: bytes, drop: Callable[[int], bool]) -> bytes:
+    """
+    Removes references for which `drop(step_id)` is true from list arguments.
+    Single-valued attributes are kept untouched, so the record stays valid.
+    """
+    stack: List[List[List[bytes]]] = [[[]]]
+    for token in TOKEN_RE.findall(args):
+        if token == b"(":
+            stack.append([[]])
+        elif token == b")":
+            items = stack.pop()
+            kept = []
+            for item in items:
+                match = SINGLE_REFERENCE_RE.match(b"".join(item))
+                if match and drop(int(match.group(1))):
+                    continue
+                kept.append(b"".join(item))
+            stack[-1][-1].append(b"(" + b",".join(kept) + b")")
+        elif token == b",":
+            stack[-1].append([])
+        else:
+            stack[-1][-1].append(token)
+    return b",".join(b"".join(item) for item in stack[0])
+
+
+def decode_string(token: bytes) -> str:
+    """
+    Decodes a quoted STEP string token, unescaping doubled quotes.
+    """
+    return token[1:-1].replace(b"''", b"'").decode("utf-8", errors="replace")
+
+
+def parse_arguments(args: bytes) -> List[Any]:
+    """
+    Parses record arguments into Python values: strings, nested lists, None for
+    '$', and the raw text of anything else (numbers, enums, references).
+    """
+    stack: List[List[Any]] = [[]]
+    pending: List[bytes] = []
+
+    def flush() -> None:
+        text = b"".join(pending).strip()
+        pending.clear()
+        if text:
+            stack[-1].append(None if text == b"$" else text.decode("utf-8", errors="replace"))
+
+    for token in TOKEN_RE.findall(args):
+        if token == b"(":
+            # A typed value such as IFCLABEL('x') keeps its type name in front of the list
+            prefix = b"".join(pending).strip()
+            pending.clear()
+            stack.append([prefix.decode("ascii", errors="replace")] if prefix else [])
+        elif token == b")":
+            flush()
+            values = stack.pop()
+            stack[-1].append(values)
+        elif token == b",":
+            flush()
+        elif token.startswith(b"'"):
+            stack[-1].append(decode_string(token))
+        else:
+            pending.append(token)
+    flush()
+    return stack[0]
+
+
+def parse_header(header: bytes) -> Dict[str, Any]:
+    """
+    Extracts FILE_DESCRIPTION, FILE_NAME and FILE_SCHEMA from the header section.
+    """
+    result: Dict[str, Any] = {
+        "Description": [],
+        "ImplementationLevel": None,
+        "FileName": None,
+        "TimeStamp": None,
+        "Author": [],
+        "Organization": [],
+        "PreprocessorVersion": None,
+        "OriginatingSystem": None,
+        "Authorization": None,
+        "Schema": [],
+    }
+
+    for _, record in _split_records(header, 0):
+        match = HEADER_RECORD_RE.match(record)
+        if not match:
+            continue
+        name = match.group(1).upper()
+        args = parse_arguments(match.group(2))
+        if name == b"FILE_DESCRIPTION" and args:
+            result["Description"] = args[0] if isinstance(args[0], list) else [args[0]]
+            result["ImplementationLevel"] = args[1] if len(args) > 1 else None
+        elif name == b"FILE_NAME":
+            keys = ["FileName", "TimeStamp", "Author", "Organization",
+                    "PreprocessorVersion", "OriginatingSystem", "Authorization"]
+            for key, value in zip(keys, args):
+                result[key] = value
+        elif name == b"FILE_SCHEMA" and args:
+            result["Schema"] = args[0] if isinstance(args[0], list) else [args[0]]
+
+    return result
+
+
+def build_step_text(header: bytes, records: List[bytes]) -> str:
+    """
+    Assembles a complete STEP file from a header (up to 'DATA;') and data records.
+    """
+    body = b"\n".join(records)
+    return (header + body + b"\nENDSEC;\nEND-ISO-10303-21;\n").decode("utf-8", errors="replace")
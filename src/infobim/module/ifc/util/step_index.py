@@ -0,0 +1,387 @@
+
+import os
+import mmap
+import struct
+import threading
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Iterable, List, Optional, Set, Tuple
+from infobim.module.ifc.util.cache import get_cache_dir, get_content_digest, get_path_digest
+from infobim.module.ifc.util.compressed import resolve_ifc_path
+from infobim.module.ifc.util.step import (
+    build_step_text, drop_list_references, get_guid, get_references, iter_records, parse_record, read_header,
+)
+
+
+# Sidecar layout (little endian):
+#   header   magic, source size, source mtime (ns), source content digest (first 16 bytes),
+#            entity/guid/reference/inverse counts, STEP header length
+#   header   the STEP header bytes up to 'DATA;'
+#   entities (id, offset, length, ref start, ref count, inverse start, inverse count, is root) sorted by id
+#   guids    (GlobalId, id) sorted by GlobalId
+#   refs     uint32 step ids referenced by each entity
+#   inverses uint32 step ids referencing each entity
+MAGIC = b"IBSTEPX2"
+HEADER = struct.Struct("<8sQq16sQQQQQ")
+ENTITY = struct.Struct("<IQIQIQIB")
+GUID = struct.Struct("<22sI")
+REF = struct.Struct("<I")
+
+
+def get_index_path(ifc_path: str) -> str:
+    """
+    Returns the sidecar index path of an IFC file inside the InfoBIM cache.
+    """
+    return os.path.join(get_cache_dir("step_index"), get_path_digest(ifc_path) + ".idx")
+
+
+def get_source_digest(ifc_path: str) -> bytes:
+    """
+    Returns the 16 byte digest of the whole content of the file stored in its index.
+    """
+    return bytes.fromhex(get_content_digest(ifc_path))[:16]
+
+
+def build_step_index(ifc_path: str, index_path: Optional[str] = None) -> str:
+    """
+    Scans the STEP file once and writes its sidecar index. Returns the index path.
+    """
+    index_path = index_path or get_index_path(ifc_path)
+    stat = os.stat(ifc_path)
+    digest = get_source_digest(ifc_path)
+
+    ids = array("I")
+    offsets = array("Q")
+    lengths = array("I")
+    ref_starts = array("Q")
+    ref_counts = array("I")
+    roots = array("B")
+    refs = array("I")
+    guids: List[Tuple[bytes, int]] = []
+
+    with open(ifc_path, "rb") as f:
+        step_header, data_offset = read_header(f)
+        for offset, record in iter_records(f, data_offset):
+            parsed = parse_record(record)
+            if parsed is None:
+                continue
+            step_id, _, args = parsed
+            record_refs = get_references(args)
+
+            ids.append(step_id)
+            offsets.append(offset)
+            lengths.append(len(record))
+            ref_starts.append(len(refs))
+            ref_counts.append(len(record_refs))
+            refs.extend(record_refs)
+
+            guid = get_guid(args)
+            roots.append(1 if guid else 0)
+            if guid:
+                guids.append((guid.encode("ascii"), step_id))
+
+    count = len(ids)
+    order = list(range(count))
+    if any(ids[i] > ids[i + 1] for i in range(count - 1)):
+        order.sort(key=ids.__getitem__)
+
+    # Position of each step id in the sorted entity table, for inverse counting
+    max_id = max(ids) if count else 0
+    position = array("i", [-1]) * (max_id + 1)
+    for pos, i in enumerate(order):
+        position[ids[i]] = pos
+
+    inverse_counts = array("I", [0]) * count
+    for target in refs:
+        if target <= max_id and position[target] >= 0:
+            inverse_counts[position[target]] += 1
+
+    inverse_starts = array("Q", [0]) * count
+    total = 0
+    for pos in range(count):
+        inverse_starts[pos] = total
+        total += inverse_counts[pos]
+
+    inverses = array("I", [0]) * total
+    filled = array("I", [0]) * count
+    for i in order:
+        source = ids[i]
+        start = ref_starts[i]
+        for target in refs[start:start + ref_counts[i]]:
+            if target <= max_id and position[target] >= 0:
+                pos = position[target]
+                inverses[inverse_starts[pos] + filled[pos]] = source
+                filled[pos] += 1
+
+    guids.sort()
+
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(HEADER.pack(
+            MAGIC, stat.st_size, stat.st_mtime_ns, digest,
+            count, len(guids), len(refs), total, len(step_header),
+        ))
+        out.write(step_header)
+        for pos, i in enumerate(order):
+            out.write(ENTITY.pack(
+                ids[i], offsets[i], lengths[i],
+                ref_starts[i], ref_counts[i],
+                inverse_starts[pos], inverse_counts[pos], roots[i],
+            ))
+        for guid, step_id in guids:
+            out.write(GUID.pack(guid, step_id))
+        refs.tofile(out)
+        inverses.tofile(out)
+    os.replace(tmp_path, index_path)
+
+    return index_path
+
+
+class StepIndex:
+    """
+    Memory-mapped sidecar index mapping GlobalIds and step ids to byte offsets,
+    with the forward and inverse references of every entity.
+    """
+
+    def __init__(self, ifc_path: str, index_path: str):
+        self.ifc_path = ifc_path
+        self.index_path = index_path
+
+        with open(index_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, self.source_size, self.source_mtime, self.source_digest,
+         self.entity_count, self.guid_count, self.ref_count, self.inverse_count,
+         header_length) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid STEP index file: {index_path}")
+
+        self._header_offset = HEADER.size
+        self._entities_offset = self._header_offset + header_length
+        self._guids_offset = self._entities_offset + self.entity_count * ENTITY.size
+        self._refs_offset = self._guids_offset + self.guid_count * GUID.size
+        self._inverses_offset = self._refs_offset + self.ref_count * REF.size
+
+    @property
+    def step_header(self) -> bytes:
+        return self._mm[self._header_offset:self._entities_offset]
+
+    def is_fresh(self) -> bool:
+        """
+        Checks the index against the size, mtime and content digest of the source file.
+        """
+        try:
+            stat = os.stat(self.ifc_path)
+        except OSError:
+            return False
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime:
+            return True
+        # Touched but possibly unchanged: compare the whole content, since an edit in the
+        # middle of the file can keep its size and still move records or change GlobalIds
+        try:
+            return get_source_digest(self.ifc_path) == self.source_digest
+        except OSError:
+            return False
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def find_guid(self, global_id: str) -> Optional[int]:
+        key = global_id.encode("ascii", errors="replace")
+        lo, hi = 0, self.guid_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            guid, step_id = GUID.unpack_from(self._mm, self._guids_offset + mid * GUID.size)
+            if guid < key:
+                lo = mid + 1
+            elif guid > key:
+                hi = mid
+            else:
+                return step_id
+        return None
+
+    def find_entity(self, step_id: int) -> Optional[Tuple[int, int, int, int, int, int, int, int]]:
+        lo, hi = 0, self.entity_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = ENTITY.unpack_from(self._mm, self._entities_offset + mid * ENTITY.size)
+            if entry[0] < step_id:
+                lo = mid + 1
+            elif entry[0] > step_id:
+                hi = mid
+            else:
+                return entry
+        return None
+
+    def get_references(self, step_id: int) -> List[int]:
+        entry = self.find_entity(step_id)
+        if entry is None:
+            return []
+        return self._read_ids(self._refs_offset, entry[3], entry[4])
+
+    def get_inverses(self, step_id: int) -> List[int]:
+        entry = self.find_entity(step_id)
+        if entry is None:
+            return []
+        return self._read_ids(self._inverses_offset, entry[5], entry[6])
+
+    def get_closure(self, seeds: Iterable[int]) -> Set[int]:
+        """
+        Returns the seeds and every entity reachable from them through forward references.
+        """
+        closure: Set[int] = set()
+        queue = deque(seeds)
+        while queue:
+            step_id = queue.popleft()
+            if step_id in closure:
+                continue
+            closure.add(step_id)
+            queue.extend(r for r in self.get_references(step_id) if r not in closure)
+        return closure
+
+    def is_root(self, step_id: int) -> bool:
+        """
+        Checks whether an entity carries a GlobalId (IfcRoot and subtypes).
+        """
+        entry = self.find_entity(step_id)
+        return entry is not None and bool(entry[7])
+
+    def extract_element(self, element_id: Any) -> Optional[str]:
+        """
+        Returns a self-contained STEP text with the element, its forward closure and
+        the relationships that reference it. References from those relationships to
+        other objects are pruned from their lists, so unrelated parts of the model
+        are not pulled in.
+        """
+        step_id = self.resolve(element_id)
+        if step_id is None:
+            return None
+
+        keep = self.get_closure([step_id])
+        relationships = [r for r in self.get_inverses(step_id) if r not in keep]
+
+        with open(self.ifc_path, "rb") as f:
+            rewritten = {}
+            for rel_id in relationships:
+                args_prefix, args = self._read_args(f, rel_id)
+                pruned = drop_list_references(args, lambda r: r != step_id and r not in keep and self.is_root(r))
+                rewritten[rel_id] = args_prefix + b"(" + pruned + b");"
+                keep.add(rel_id)
+                keep |= self.get_closure(get_references(pruned))
+
+            records = []
+            for entity_id in sorted(keep):
+                if entity_id in rewritten:
+                    records.append(rewritten[entity_id])
+                    continue
+                entry = self.find_entity(entity_id)
+                if entry is None:
+                    continue
+                f.seek(entry[1])
+                records.append(f.read(entry[2]))
+
+        return build_step_text(self.step_header, records)
+
+    def resolve(self, element_id: Any) -> Optional[int]:
+        """
+        Resolves a GlobalId (22 chars) or step id to a step id present in the index.
+        """
+        element_id = str(element_id)
+        if len(element_id) == 22:
+            step_id = self.find_guid(element_id)
+            if step_id is not None:
+                return step_id
+        if element_id.isdigit() and self.find_entity(int(element_id)) is not None:
+            return int(element_id)
+        return None
+
+    def _read_ids(self, base: int, start: int, count: int) -> List[int]:
+        offset = base + start * REF.size
+        return list(struct.unpack_from(f"<{count}I", self._mm, offset))
+
+    def _read_args(self, f, step_id: int) -> Tuple[bytes, bytes]:
+        entry = self.find_entity(step_id)
+        f.seek(entry[1])
+        record = f.read(entry[2])
+        parsed = parse_record(record)
+        prefix = f"#{parsed[0]}={parsed[1].decode('ascii')}".encode("ascii")
+        return prefix, parsed[2]
+
+
+_open_indexes: "OrderedDict[str, StepIndex]" = OrderedDict()
+_element_models: "OrderedDict[Tuple[str, int, str], Any]" = OrderedDict()
+_lock = threading.Lock()
+MAX_OPEN_INDEXES = 16
+MAX_ELEMENT_MODELS = 64
+
+
+def get_step_index(ifc_path: str) -> StepIndex:
+    """
+    Returns the memory-mapped index of the file, building or rebuilding it when stale.
+    """
+    real_path = os.path.realpath(resolve_ifc_path(ifc_path))
+    with _lock:
+        index = _open_indexes.get(real_path)
+        if index is not None and index.is_fresh():
+            _open_indexes.move_to_end(real_path)
+            return index
+
+        if index is not None:
+            index.close()
+            del _open_indexes[real_path]
+
+        index_path = get_index_path(real_path)
+        index = None
+        if os.path.exists(index_path):
+            try:
+                index = StepIndex(real_path, index_path)
+            except (ValueError, struct.error):
+                index = None
+            if index is not None and not index.is_fresh():
+                index.close()
+                index = None
+
+        if index is None:
+            build_step_index(real_path, index_path)
+            index = StepIndex(real_path, index_path)
+
+        _open_indexes[real_path] = index
+        while len(_open_indexes) > MAX_OPEN_INDEXES:
+            _, oldest = _open_indexes.popitem(last=False)
+            oldest.close()
+        return index
+
+
+def open_element_model(ifc_path: str, element_id: Any) -> Optional[Any]:
+    """
+    Loads only the part of the model needed to inspect one element, using the sidecar index.
+    Returns None when the element is not in the file.
+    """
+    import ifcopenshell
+    from infobim.module.ifc.util.model import get_model_registry
+
+    # A fully parsed model already in memory answers just as fast
+    model = get_model_registry().get_cached(ifc_path)
+    if model is not None:
+        return model
+
+    index = get_step_index(ifc_path)
+    key = (index.ifc_path, index.source_mtime, str(element_id))
+    with _lock:
+        model = _element_models.get(key)
+        if model is not None:
+            _element_models.move_to_end(key)
+            return model
+
+    text = index.extract_element(element_id)
+    if text is None:
+        return None
+    model = ifcopenshell.file.from_string(text)
+
+    with _lock:
+        _element_models[key] = model
+        while len(_element_models) > MAX_ELEMENT_MODELS:
+            _element_models.popitem(last=False)
+    return model
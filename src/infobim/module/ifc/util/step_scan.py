@@ -0,0 +1,446 @@
+
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from concurrent.futures import Future
+from collections import Counter, OrderedDict, deque
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from infobim.module.ifc.util.compressed import resolve_ifc_path
+from infobim.module.ifc.util.pool import create_process_pool
+from infobim.module.ifc.util.step import (
+    build_step_text, drop_list_references, get_references, iter_records, parse_header, parse_record, read_header,
+)
+
+
+# Low-memory reading of STEP files larger than RAM. The DATA section is cut
+# into chunks at record boundaries and scanned line by line, in worker
+# processes when there are several chunks. A scan keeps only the per-class
+# counts, the records of the requested classes and, while it fits the memory
+# budget, a table of record offsets. Each worker may hold its share of the
+# budget, and results are taken one at a time, each checked against the budget. The closure of the requested records is
+# then read back by offset, or collected by further scans when the table did
+# not fit.
+
+MEMORY_BUDGET_ENV = "INFOBIM_SCAN_MEMORY_MB"
+DEFAULT_MEMORY_BUDGET_MB = 512
+CHUNK_SIZE = 64 * 1024 * 1024
+BOUNDARY_WINDOW = 1024 * 1024
+
+# Bytes per entry of the offset table: uint32 step id and uint64 offset
+OFFSET_ENTRY_SIZE = 12
+
+# A chunk starts on the line after a record ends, if that line opens a record.
+# Only a multi-line string holding this exact text could fool it.
+BOUNDARY_RE = re.compile(rb";[ \t\r]*\n(?=[ \t]*#\d+[ \t]*=)")
+RECORD_HEAD_RE = re.compile(rb"#(\d+)\s*=\s*([A-Za-z0-9_]+)")
+
+
+def get_memory_budget(memory_budget: Optional[Any] = None) -> int:
+    """
+    Returns the scan memory budget in bytes: `memory_budget` in MB, else
+    $INFOBIM_SCAN_MEMORY_MB, else 512 MB.
+    """
+    value = memory_budget if memory_budget not in (None, "") else os.environ.get(MEMORY_BUDGET_ENV)
+    if value in (None, ""):
+        value = DEFAULT_MEMORY_BUDGET_MB
+    try:
+        megabytes = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid memory budget: {value} (expected megabytes).")
+    if megabytes <= 0:
+        raise ValueError(f"Invalid memory budget: {value} (expected megabytes).")
+    return int(megabytes * 1024 * 1024)
+
+
+def get_schema(header: bytes) -> Optional[Any]:
+    """
+    Returns the IfcOpenShell schema declared in the STEP header, or None when
+    it is unknown or IfcOpenShell is not installed.
+    """
+    schemas = parse_header(header)["Schema"]
+    if not schemas or not schemas[0]:
+        return None
+    try:
+        import ifcopenshell.ifcopenshell_wrapper as wrapper
+        return wrapper.schema_by_name(schemas[0])
+    except (ImportError, RuntimeError):
+        return None
+
+
+def get_type_names(schema: Optional[Any], classes: Iterable[str]) -> Set[bytes]:
+    """
+    Returns the upper-case STEP names of the classes and, when the schema is known, of all their subtypes.
+    """
+    names: Set[bytes] = set()
+    pending = list(classes)
+    while pending:
+        name = pending.pop()
+        declaration = None
+        if schema is not None:
+            try:
+                declaration = schema.declaration_by_name(name)
+            except RuntimeError:
+                declaration = None
+        if declaration is None:
+            names.add(name.upper().encode("ascii"))
+            continue
+        names.add(declaration.name().upper().encode("ascii"))
+        pending.extend(subtype.name() for subtype in getattr(declaration, "subtypes", list)())
+    return names
+
+
+def find_chunks(f: BinaryIO, start: int, size: int, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, Optional[int]]]:
+    """
+    Cuts the DATA section into (start, end) byte ranges of about `chunk_size`
+    that begin on record boundaries. The last range is open ended.
+    """
+    bounds = [start]
+    pos = start + chunk_size
+    while pos < size:
+        f.seek(pos)
+        window = f.read(BOUNDARY_WINDOW)
+        match = BOUNDARY_RE.search(window)
+        if match is None:
+            if len(window) < BOUNDARY_WINDOW:
+                break
+            # Overlap the windows so a boundary across them is not missed
+            pos += len(window) - 64
+            continue
+        bounds.append(pos + match.end())
+        pos = bounds[-1] + chunk_size
+    return list(zip(bounds, bounds[1:] + [None]))
+
+
+def _scan_chunk(
+    ifc_path: str, start: int, end: Optional[int], wanted: Set[bytes], table_budget: int, record_budget: int,
+) -> Dict[str, Any]:
+    counts: Counter = Counter()
+    records: Dict[int, bytes] = {}
+    record_bytes = 0
+    ids: Optional[array] = array("I")
+    offsets: Optional[array] = array("Q")
+
+    with open(ifc_path, "rb") as f:
+        for offset, record in iter_records(f, start, end):
+            match = RECORD_HEAD_RE.match(record)
+            if match is None:
+                continue
+            step_id = int(match.group(1))
+            name = match.group(2).upper()
+            counts[name] += 1
+
+            if name in wanted:
+                records[step_id] = record
+                record_bytes += len(record)
+                if record_bytes > record_budget:
+                    raise RuntimeError(
+                        f"The selected records exceed the scan memory budget ({record_budget // (1024 * 1024)} MB per worker)."
+                    )
+
+            if ids is not None:
+                # The table is given up when over budget, or when ids are out of
+                # order and could not be bisected
+                if (len(ids) + 1) * OFFSET_ENTRY_SIZE + record_bytes > table_budget or (ids and step_id <= ids[-1]):
+                    ids = offsets = None
+                else:
+                    ids.append(step_id)
+                    offsets.append(offset)
+
+    return {"Counts": counts, "Records": records, "Ids": ids, "Offsets": offsets}
+
+
+def _collect_chunk(ifc_path: str, start: int, end: Optional[int], step_ids: Set[int]) -> Dict[int, bytes]:
+    found: Dict[int, bytes] = {}
+    with open(ifc_path, "rb") as f:
+        for _, record in iter_records(f, start, end):
+            match = RECORD_HEAD_RE.match(record)
+            if match is not None and int(match.group(1)) in step_ids:
+                found[int(match.group(1))] = record
+    return found
+
+
+def get_worker_count(chunks: Sequence[Tuple[int, Optional[int]]], max_workers: Optional[int] = None) -> int:
+    return min(len(chunks), max_workers or os.cpu_count() or 1)
+
+
+def _iter_chunks(
+    function: Callable[..., Any], ifc_path: str, chunks: Sequence[Tuple[int, Optional[int]]],
+    args: Sequence[Any], max_workers: Optional[int],
+) -> Iterator[Any]:
+    """
+    Yields function(ifc_path, start, end, *args) for every chunk, in order. At most
+    one chunk per worker is in progress, so results do not pile up while the caller
+    checks them; chunks not started yet are dropped when the caller stops early.
+    """
+    max_workers = get_worker_count(chunks, max_workers)
+    if max_workers == 1:
+        for start, end in chunks:
+            yield function(ifc_path, start, end, *args)
+        return
+
+    remaining = iter(chunks)
+    pending: Deque[Future] = deque()
+    with create_process_pool(max_workers) as pool:
+        try:
+            for start, end in islice(remaining, max_workers):
+                pending.append(pool.submit(function, ifc_path, start, end, *args))
+            while pending:
+                outcome = pending.popleft().result()
+                for start, end in islice(remaining, 1):
+                    pending.append(pool.submit(function, ifc_path, start, end, *args))
+                yield outcome
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class StepScan:
+    """
+    Result of scanning a STEP file: its header, the number of records of every
+    class and the records of the requested classes, plus their closure once resolved.
+    """
+
+    def __init__(
+        self, ifc_path: str, header: bytes, chunks: List[Tuple[int, Optional[int]]],
+        memory_budget: int, max_workers: Optional[int],
+    ):
+        self.ifc_path = ifc_path
+        self.header = header
+        self.memory_budget = memory_budget
+        self.max_workers = max_workers
+        self.counts: Counter = Counter()
+        self.records: Dict[int, bytes] = {}
+        self.passes = 1
+        self.chunks = chunks
+        self._tables: Optional[List[Tuple[array, array]]] = []
+        self._record_bytes = 0
+        self._schema: Any = False
+
+    @property
+    def schema(self) -> Optional[Any]:
+        if self._schema is False:
+            self._schema = get_schema(self.header)
+        return self._schema
+
+    @property
+    def is_indexed(self) -> bool:
+        """
+        True when the offset table fit the memory budget, so the closure is read by seeking.
+        """
+        return self._tables is not None
+
+    def add_chunk(self, outcome: Dict[str, Any]) -> None:
+        self.counts.update(outcome["Counts"])
+        for record in outcome["Records"].values():
+            self._add_bytes(len(record))
+        self.records.update(outcome["Records"])
+        if self._tables is not None:
+            if outcome["Ids"] is None:
+                self._tables = None
+            else:
+                self._tables.append((outcome["Ids"], outcome["Offsets"]))
+
+    def get_class_counts(self, classes: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Returns {class name: number of records}, most frequent first, optionally
+        limited to the given classes and their subtypes.
+        """
+        counts = self.counts
+        if classes:
+            names = get_type_names(self.schema, classes)
+            counts = Counter({name: count for name, count in counts.items() if name in names})
+
+        result: Dict[str, int] = {}
+        for name, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            result[self._get_class_name(name)] = count
+        return result
+
+    def resolve_closure(self) -> Dict[int, bytes]:
+        """
+        Adds every record the selected records reference, directly or not.
+        Relationships keep only the related objects that were selected, so
+        IfcRelAggregates does not pull in every aggregated element.
+        """
+        self._prune_relationships()
+        frontier = self._get_new_references(self.records.values())
+        while frontier:
+            found = self._read_by_offset(frontier) if self.is_indexed else self._read_by_scan(frontier)
+            for record in found.values():
+                self._add_bytes(len(record))
+            self.records.update(found)
+            frontier = self._get_new_references(found.values())
+        return self.records
+
+    def get_step_text(self) -> str:
+        """
+        Returns the selected records as a complete STEP file.
+        """
+        return build_step_text(self.header, [self.records[step_id] for step_id in sorted(self.records)])
+
+    def _get_class_name(self, name: bytes) -> str:
+        text = name.decode("ascii")
+        if self.schema is not None:
+            try:
+                return self.schema.declaration_by_name(text).name()
+            except RuntimeError:
+                pass
+        return text
+
+    def _add_bytes(self, size: int) -> None:
+        self._record_bytes += size
+        if self._record_bytes > self.memory_budget:
+            raise RuntimeError(
+                f"The selected records exceed the scan memory budget of {self.memory_budget // (1024 * 1024)} MB."
+            )
+
+    def _prune_relationships(self) -> None:
+        selected: Set[int] = set()
+        relationships: List[int] = []
+        for step_id, record in self.records.items():
+            name = RECORD_HEAD_RE.match(record).group(2).upper()
+            if name.startswith(b"IFCREL"):
+                relationships.append(step_id)
+            else:
+                selected.add(step_id)
+        if not selected:
+            return
+
+        for step_id in relationships:
+            parsed = parse_record(self.records[step_id])
+            if parsed is None:
+                continue
+            _, name, args = parsed
+            related: List[int] = []
+
+            def drop(ref: int) -> bool:
+                if ref in selected:
+                    related.append(ref)
+                    return False
+                return True
+
+            args = drop_list_references(args, drop)
+            if related:
+                self.records[step_id] = b"#%d=%s(%s);" % (step_id, name, args)
+            else:
+                del self.records[step_id]
+
+    def _get_new_references(self, records: Iterable[bytes]) -> Set[int]:
+        references: Set[int] = set()
+        for record in records:
+            parsed = parse_record(record)
+            if parsed is not None:
+                references.update(get_references(parsed[2]))
+        return references - self.records.keys()
+
+    def _find_offset(self, step_id: int) -> Optional[int]:
+        for ids, offsets in self._tables:
+            if ids and ids[0] <= step_id <= ids[-1]:
+                i = bisect_left(ids, step_id)
+                if ids[i] == step_id:
+                    return offsets[i]
+        return None
+
+    def _read_by_offset(self, step_ids: Set[int]) -> Dict[int, bytes]:
+        located = sorted(
+            (offset, step_id)
+            for step_id, offset in ((step_id, self._find_offset(step_id)) for step_id in step_ids)
+            if offset is not None
+        )
+        found: Dict[int, bytes] = {}
+        with open(self.ifc_path, "rb") as f:
+            for offset, step_id in located:
+                for _, record in iter_records(f, offset, offset + 1):
+                    found[step_id] = record
+                    break
+        return found
+
+    def _read_by_scan(self, step_ids: Set[int]) -> Dict[int, bytes]:
+        self.passes += 1
+        found: Dict[int, bytes] = {}
+        for outcome in _iter_chunks(_collect_chunk, self.ifc_path, self.chunks, [frozenset(step_ids)], self.max_workers):
+            found.update(outcome)
+        return found
+
+
+def scan_step(
+    ifc_path: str,
+    classes: Iterable[str] = (),
+    memory_budget: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> StepScan:
+    """
+    Counts the records of every class and keeps those of the given classes
+    (with their subtypes), in one pass over the file.
+    `memory_budget` is in MB (see get_memory_budget).
+    """
+    budget = get_memory_budget(memory_budget)
+    # Chunks are read at random offsets, so compressed files are scanned from their decompressed copy
+    ifc_path = resolve_ifc_path(ifc_path)
+    size = os.path.getsize(ifc_path)
+    with open(ifc_path, "rb") as f:
+        header, data_offset = read_header(f)
+        chunks = find_chunks(f, data_offset, size, chunk_size)
+
+    scan = StepScan(ifc_path, header, chunks, budget, max_workers)
+    wanted = frozenset(get_type_names(scan.schema, classes)) if classes else frozenset()
+    table_budget = budget // len(chunks)
+    # Chunks in progress share the budget; the scan adds up their results as they arrive
+    record_budget = budget // get_worker_count(chunks, max_workers)
+    for outcome in _iter_chunks(_scan_chunk, ifc_path, chunks, [wanted, table_budget, record_budget], max_workers):
+        scan.add_chunk(outcome)
+    return scan
+
+
+# Scanned models kept for reuse, least recently used first, as (model, estimated
+# bytes). Together they stay within the scan memory budget.
+_scanned_models: "OrderedDict[Tuple[str, int, int, Tuple[str, ...]], Tuple[Any, int]]" = OrderedDict()
+_scanned_bytes = 0
+_lock = threading.Lock()
+
+
+def open_scanned_model(ifc_path: str, classes: Iterable[str], memory_budget: Optional[Any] = None) -> Any:
+    """
+    Loads only the records of the given classes (with their subtypes) and what
+    they reference, without parsing the rest of the file. The models are kept
+    for reuse within the scan memory budget.
+    """
+    global _scanned_bytes
+    import ifcopenshell
+    from infobim.module.ifc.util.model import get_model_registry
+
+    # A fully parsed model already in memory answers just as well
+    model = get_model_registry().get_cached(ifc_path)
+    if model is not None:
+        return model
+
+    stat = os.stat(ifc_path)
+    key = (os.path.realpath(ifc_path), stat.st_size, stat.st_mtime_ns, tuple(sorted(classes)))
+    with _lock:
+        entry = _scanned_models.get(key)
+        if entry is not None:
+            _scanned_models.move_to_end(key)
+            return entry[0]
+
+    budget = get_memory_budget(memory_budget)
+    scan = scan_step(ifc_path, key[3], memory_budget)
+    scan.resolve_closure()
+    text = scan.get_step_text()
+    model = ifcopenshell.file.from_string(text)
+    # Estimated as the model registry does for fully parsed models
+    cost = int(len(text) * get_model_registry().size_factor)
+
+    with _lock:
+        previous = _scanned_models.pop(key, None)
+        if previous is not None:
+            _scanned_bytes -= previous[1]
+        if cost <= budget:
+            _scanned_models[key] = (model, cost)
+            _scanned_bytes += cost
+        while _scanned_bytes > budget:
+            _, (_, evicted_cost) = _scanned_models.popitem(last=False)
+            _scanned_bytes -= evicted_cost
+    return model
@@ -0,0 +1,135 @@
+
+import os
+import re
+import mmap
+import time
+import shutil
+from typing import Any, Dict, Iterable, List, Tuple
+from infobim.module.ifc.util.cache import HASH_CHUNK_SIZE
+from infobim.module.ifc.util.step import iter_records, read_header
+
+
+# Incremental saves: instead of reserializing every entity of the model, the
+# source file is copied (no parsing) and patched. The FILE_NAME time stamp is
+# refreshed, entities created since the model was opened are appended before
+# the closing ENDSEC, and modified entities are blanked out where they were and
+# appended in their new form; STEP does not require records to be in id order.
+# The appended tail is re-read with the STEP scanner, and the patched copy is
+# then renamed over the output, so readers never see a partial file.
+
+TRAILER = b"ENDSEC;\nEND-ISO-10303-21;\n"
+TAIL_WINDOW = 64 * 1024
+DATA_END_RE = re.compile(rb"(?m)^[ \t]*ENDSEC[ \t]*;[ \t\r]*\n?[ \t\r\n]*END-ISO-10303-21[ \t]*;")
+# FILE_NAME(name, time_stamp, ...): group 1 is the time stamp
+TIME_STAMP_RE = re.compile(rb"FILE_NAME\s*\(\s*(?:'(?:[^']|'')*'|\$)\s*,\s*('(?:[^']|'')*'|\$)", re.I)
+
+
+def find_data_end(f: Any, size: int) -> int:
+    """
+    Returns the offset of the ENDSEC line that closes the DATA section.
+    """
+    start = max(0, size - TAIL_WINDOW)
+    f.seek(start)
+    tail = f.read()
+    matches = list(DATA_END_RE.finditer(tail))
+    if not matches:
+        raise ValueError("STEP file has no closing ENDSEC; END-ISO-10303-21;.")
+    return start + matches[-1].start()
+
+
+def find_records(f: Any, step_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+    """
+    Returns {step id: (offset, length)} of the given records of a STEP file.
+    """
+    spans: Dict[int, Tuple[int, int]] = {}
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+        for step_id in step_ids:
+            # The literal prefix keeps the search fast; a match must also start its line
+            for match in re.finditer(rb"#%d[ \t]*=" % step_id, source):
+                line_start = source.rfind(b"\n", 0, match.start()) + 1
+                if not source[line_start:match.start()].strip():
+                    break
+            else:
+                raise ValueError(f"Record #{step_id} not found in the source file.")
+            for _, record in iter_records(f, match.start(), match.start() + 1):
+                spans[step_id] = (match.start(), len(record))
+                break
+    return spans
+
+
+def get_step_record(entity: Any) -> bytes:
+    """
+    Serializes one IfcOpenShell entity as a terminated STEP record.
+    """
+    # to_string() leaves out the closing ';'
+    return entity.to_string().encode("ascii") + b";"
+
+
+def stamp_header(header: bytes) -> bytes:
+    """
+    Returns the header with the FILE_NAME time stamp set to the current time.
+    """
+    match = TIME_STAMP_RE.search(header)
+    if not match:
+        return header
+    stamp = time.strftime("'%Y-%m-%dT%H:%M:%S'").encode("ascii")
+    return header[:match.start(1)] + stamp + header[match.end(1):]
+
+
+def write_incremental(
+    model: Any, source_path: str, output_path: str, base_id: int, modified: Iterable[Any] = (),
+) -> Dict[str, int]:
+    """
+    Saves the changes made to a model parsed from `source_path` into `output_path`
+    without reserializing it. Entities with ids above `base_id` (the model's max
+    id when it was opened) are appended; entities in `modified` that already
+    existed are superseded. Returns {"Appended": n, "Replaced": n}.
+    """
+    replaced = sorted({entity.id() for entity in modified if entity.id() <= base_id})
+    records: List[bytes] = [get_step_record(model.by_id(step_id)) for step_id in replaced]
+    appended = 0
+    for step_id in range(base_id + 1, model.get_max_id() + 1):
+        try:
+            entity = model.by_id(step_id)
+        except RuntimeError:
+            # Created and removed again
+            continue
+        records.append(get_step_record(entity))
+        appended += 1
+
+    size = os.path.getsize(source_path)
+    with open(source_path, "rb") as f:
+        header, data_start = read_header(f)
+        data_end = find_data_end(f, size)
+        spans = find_records(f, replaced)
+
+    header = stamp_header(header)
+    # Offsets in the copy move with the length of the new header
+    shift = len(header) - data_start
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(source_path, "rb") as source, open(tmp_path, "w+b") as f:
+            f.write(header)
+            source.seek(data_start)
+            shutil.copyfileobj(source, f, HASH_CHUNK_SIZE)
+            for offset, length in spans.values():
+                f.seek(offset + shift)
+                f.write(b" " * length)
+            tail = data_end + shift
+            f.seek(tail)
+            f.truncate()
+            for record in records:
+                f.write(record + b"\n")
+            f.write(TRAILER)
+            f.flush()
+            written = sum(1 for _ in iter_records(f, tail))
+            if written != len(records):
+                raise ValueError(f"Appended {written} STEP records instead of {len(records)}.")
+        shutil.copymode(source_path, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return {"Appended": appended, "Replaced": len(replaced)}
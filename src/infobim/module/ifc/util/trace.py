@@ -0,0 +1,181 @@
+
+import os
+import json
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+DIAGNOSTICS_KEY = "org.infobim.domain.ifc.diagnostics"
+
+
+class Tracer:
+    """
+    Collects timed spans of one capability run (including nested capabilities and rendering).
+
+    `diagnostics` is a live dict updated as spans close, so a result holding it
+    also reflects spans that finish after the capability returned.
+    """
+
+    def __init__(self, trace_file: Optional[str] = None, include_diagnostics: bool = True):
+        self.trace_file = trace_file
+        self.include_diagnostics = include_diagnostics
+        self.active = False
+        self.origin = time.perf_counter()
+        self.events: List[Dict[str, Any]] = []
+        self.diagnostics: Dict[str, Any] = {"total_ms": 0.0, "spans": []}
+        self._span_starts: List[float] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Times the enclosed block. The yielded dict can be filled with counts
+        (e.g. attrs["elements"] = n) that are reported with the span.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        depth = len(stack)
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            self._record(name, start, end, depth, attrs)
+
+    def get_open_spans(self) -> List[str]:
+        """
+        Returns the names of the spans open in the calling thread, outermost first.
+        """
+        return list(getattr(self._local, "stack", None) or [])
+
+    def set_open_spans(self, names: List[str]) -> None:
+        # Spans opened next in this thread are nested under `names`
+        self._local.stack = list(names)
+
+    def _record(self, name: str, start: float, end: float, depth: int, attrs: Dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append({
+                "name": name,
+                "cat": "infobim",
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": dict(attrs),
+            })
+            span = {"name": name, "ms": round((end - start) * 1000.0, 3), "depth": depth}
+            span.update(attrs)
+            # Spans close children first; keep the report in start order
+            position = bisect.bisect_right(self._span_starts, start)
+            self._span_starts.insert(position, start)
+            self.diagnostics["spans"].insert(position, span)
+            if depth == 0:
+                self.diagnostics["total_ms"] = round(self.diagnostics["total_ms"] + (end - start) * 1000.0, 3)
+
+    def write_chrome_trace(self, path: Optional[str] = None) -> None:
+        """
+        Writes the spans in Chrome trace event format (chrome://tracing, Perfetto).
+        """
+        path = path or self.trace_file
+        if not path:
+            return
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+
+_current: ContextVar[Optional[Tracer]] = ContextVar("infobim_tracer", default=None)
+
+
+def get_current_tracer() -> Optional[Tracer]:
+    return _current.get()
+
+
+def set_current_tracer(tracer: Optional[Tracer]) -> None:
+    _current.set(tracer)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Times the enclosed block in the current tracer; a no-op when tracing is off.
+    """
+    tracer = _current.get()
+    if tracer is None:
+        yield attrs
+        return
+    with tracer.span(name, **attrs) as span_attrs:
+        yield span_attrs
+
+
+def propagate_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps `fn` to run on another thread in a copy of the caller's context, so it
+    records into the current tracer, nested under the spans open here, and sees
+    the same output options.
+    """
+    context = copy_context()
+    tracer = _current.get()
+    parents = tracer.get_open_spans() if tracer is not None else []
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        if tracer is not None:
+            tracer.set_open_spans(parents)
+        return context.run(fn, *args, **kwargs)
+
+    return run
+
+
+@contextmanager
+def trace_capability(context: Any, name: str) -> Iterator[Optional[Tracer]]:
+    """
+    Opens the top-level span of a capability run.
+
+    Yields the tracer when this is the outermost capability and the caller asked
+    for diagnostics (--diagnostics) or a Chrome trace (--trace-file); nested
+    capabilities record into the outer tracer and get None. The tracer stays
+    current after the capability returns so rendering is traced too.
+    """
+    tracer = _current.get()
+    if tracer is not None and tracer.active:
+        with tracer.span(name):
+            yield None
+        return
+
+    diagnostics = bool(context.get_parameter_value("diagnostics"))
+    trace_file = context.get_parameter_value("trace_file")
+    if not diagnostics and not trace_file:
+        _current.set(None)
+        yield None
+        return
+
+    tracer = Tracer(trace_file, include_diagnostics=diagnostics)
+    tracer.active = True
+    _current.set(tracer)
+    try:
+        with tracer.span(name):
+            yield tracer
+    finally:
+        tracer.active = False
+        if trace_file:
+            tracer.write_chrome_trace()
+
+
+def attach_diagnostics(result: Dict[str, Any], tracer: Optional[Tracer]) -> Dict[str, Any]:
+    """
+    Adds the live diagnostics of the tracer to a capability result.
+    """
+    if tracer is not None and tracer.include_diagnostics:
+        result[DIAGNOSTICS_KEY] = tracer.diagnostics
+    return result
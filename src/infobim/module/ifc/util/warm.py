@@ -0,0 +1,46 @@
+
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from infobim.module.ifc.util.element import get_material_index, get_spatial_index
+from infobim.module.ifc.util.model import open_model
+from infobim.module.ifc.util.step_index import get_step_index
+
+
+def _warm_step_index(ifc_path: str, model: Any) -> None:
+    get_step_index(ifc_path)
+
+
+def _warm_material_index(ifc_path: str, model: Any) -> None:
+    get_material_index(model)
+
+
+def _warm_spatial_index(ifc_path: str, model: Any) -> None:
+    get_spatial_index(model)
+
+
+# (name, warmer(ifc_path, model)) run in order after the model is parsed.
+# IfcOpenShell keeps its own GlobalId and class maps once a file is parsed.
+# Indexes are kept per parsed file (see get_file_key), so the capabilities reach
+# them through the registry's model or any element's file.
+WARMERS: List[Tuple[str, Callable[[str, Any], None]]] = [
+    ("step_index", _warm_step_index),
+    ("material_index", _warm_material_index),
+    ("spatial_index", _warm_spatial_index),
+]
+
+
+def warm_model(ifc_path: str) -> Dict[str, float]:
+    """
+    Parses the model into the registry and builds the indexes used by the capabilities.
+    Returns the time spent on each step, in milliseconds.
+    """
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    model = open_model(ifc_path)
+    timings["open"] = round((time.perf_counter() - start) * 1000.0, 3)
+
+    for name, warmer in WARMERS:
+        start = time.perf_counter()
+        warmer(ifc_path, model)
+        timings[name] = round((time.perf_counter() - start) * 1000.0, 3)
+    return timings
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class ColumnsStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--columns" in unprocessed_args:
+            idx = unprocessed_args.index("--columns")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("columns", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.columns",
+                    "param_uri": "org.infobim.domain.ifc.input.query.columns"
+                })
+                context.clear_parameters(["--columns", val])
+            else:
+                raise ValueError("Missing value for --columns.")
+            
+        return context
+
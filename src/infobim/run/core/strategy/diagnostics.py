@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class DiagnosticsStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--diagnostics" in unprocessed_args:
+            context.add_parameter("diagnostics", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.diagnostics",
+                "param_uri": "org.infobim.domain.ifc.input.diagnostics"
+            })
+            context.clear_parameters(["--diagnostics"])
+
+        return context
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class DirectoryStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--directory" in unprocessed_args:
+            idx = unprocessed_args.index("--directory")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("directory", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.directory",
+                    "param_uri": "org.infobim.domain.ifc.input.directory"
+                })
+                context.clear_parameters(["--directory", val])
+            else:
+                raise ValueError("Missing value for --directory.")
+            
+        return context
+
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class DistanceStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--distance" in unprocessed_args:
+            idx = unprocessed_args.index("--distance")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("distance", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.distance",
+                    "param_uri": "org.infobim.domain.ifc.input.bbox.distance"
+                })
+                context.clear_parameters(["--distance", val])
+            else:
+                raise ValueError("Missing value for --distance.")
+            
+        return context
+
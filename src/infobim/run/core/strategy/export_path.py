@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class ExportPathStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--export-columns" in unprocessed_args:
+            idx = unprocessed_args.index("--export-columns")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("export_path", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.export_path",
+                    "param_uri": "org.infobim.domain.ifc.input.output.export_path"
+                })
+                context.clear_parameters(["--export-columns", val])
+            else:
+                raise ValueError("Missing value for --export-columns.")
+            
+        return context
+
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class GroupByStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--group-by" in unprocessed_args:
+            idx = unprocessed_args.index("--group-by")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("group_by", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.group_by",
+                    "param_uri": "org.infobim.domain.ifc.input.output.group_by"
+                })
+                context.clear_parameters(["--group-by", val])
+            else:
+                raise ValueError("Missing value for --group-by.")
+            
+        return context
+
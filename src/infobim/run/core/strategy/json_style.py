@@ -0,0 +1,26 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+from infobim.module.ifc.adapter.renderer.output import set_output_options
+
+
+class JsonStyleStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--json-style" in unprocessed_args:
+            idx = unprocessed_args.index("--json-style")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                # Read by the renderers' JSON output
+                set_output_options(style=val)
+                context.add_parameter("json_style", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.json_style",
+                    "param_uri": "org.infobim.domain.ifc.input.output.json_style"
+                })
+                context.clear_parameters(["--json-style", val])
+            else:
+                raise ValueError("Missing value for --json-style.")
+            
+        return context
+
@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class LowMemoryStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--low-memory" in unprocessed_args:
+            context.add_parameter("low_memory", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.low_memory",
+                "param_uri": "org.infobim.domain.ifc.input.scan.low_memory"
+            })
+            context.clear_parameters(["--low-memory"])
+
+        return context
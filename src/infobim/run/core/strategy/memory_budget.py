@@ -0,0 +1,22 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class MemoryBudgetStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--memory-budget" in unprocessed_args:
+            idx = unprocessed_args.index("--memory-budget")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("memory_budget", {
+                    "value": val,
+                    "uri": "org.infobim.domain.context.strategy.parameter.memory_budget",
+                    "param_uri": "org.infobim.domain.ifc.input.scan.memory_budget"
+                })
+                context.clear_parameters(["--memory-budget", val])
+            else:
+                raise ValueError("Missing value for --memory-budget.")
+
+        return context
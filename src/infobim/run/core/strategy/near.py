@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class NearStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--near" in unprocessed_args:
+            idx = unprocessed_args.index("--near")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("near", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.near",
+                    "param_uri": "org.infobim.domain.ifc.input.bbox.near"
+                })
+                context.clear_parameters(["--near", val])
+            else:
+                raise ValueError("Missing value for --near.")
+            
+        return context
+
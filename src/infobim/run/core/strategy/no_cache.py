@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class NoCacheStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--no-cache" in unprocessed_args:
+            context.add_parameter("no_cache", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.no_cache",
+                "param_uri": "org.infobim.domain.ifc.input.cache.no_cache"
+            })
+            context.clear_parameters(["--no-cache"])
+
+        return context
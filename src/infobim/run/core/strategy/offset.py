@@ -0,0 +1,27 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class OffsetStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--offset" in unprocessed_args:
+            idx = unprocessed_args.index("--offset")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                try:
+                    int_val = int(val)
+                except ValueError:
+                    raise ValueError(f"Invalid value for --offset: '{val}'. Must be an integer.")
+                context.add_parameter("offset", {
+                    "value": int_val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.offset",
+                    "param_uri": "org.infobim.domain.ifc.input.query.offset"
+                })
+                context.clear_parameters(["--offset", val])
+            else:
+                raise ValueError("Missing value for --offset. Must be an integer.")
+            
+        return context
+
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class OrderByStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--order-by" in unprocessed_args:
+            idx = unprocessed_args.index("--order-by")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("order_by", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.order_by",
+                    "param_uri": "org.infobim.domain.ifc.input.order_by"
+                })
+                context.clear_parameters(["--order-by", val])
+            else:
+                raise ValueError("Missing value for --order-by.")
+            
+        return context
+
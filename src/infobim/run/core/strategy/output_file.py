@@ -0,0 +1,26 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+from infobim.module.ifc.adapter.renderer.output import set_output_options
+
+
+class OutputFileStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--output-file" in unprocessed_args:
+            idx = unprocessed_args.index("--output-file")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                # Read by the renderers' JSON output
+                set_output_options(path=val)
+                context.add_parameter("output_file", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.output_file",
+                    "param_uri": "org.infobim.domain.ifc.input.output.output_file"
+                })
+                context.clear_parameters(["--output-file", val])
+            else:
+                raise ValueError("Missing value for --output-file.")
+            
+        return context
+
@@ -0,0 +1,27 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class PageStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--page" in unprocessed_args:
+            idx = unprocessed_args.index("--page")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                try:
+                    int_val = int(val)
+                except ValueError:
+                    raise ValueError(f"Invalid value for --page: '{val}'. Must be an integer.")
+                context.add_parameter("page", {
+                    "value": int_val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.page",
+                    "param_uri": "org.infobim.domain.ifc.input.output.page"
+                })
+                context.clear_parameters(["--page", val])
+            else:
+                raise ValueError("Missing value for --page. Must be an integer.")
+            
+        return context
+
@@ -0,0 +1,27 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class PageSizeStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--page-size" in unprocessed_args:
+            idx = unprocessed_args.index("--page-size")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                try:
+                    int_val = int(val)
+                except ValueError:
+                    raise ValueError(f"Invalid value for --page-size: '{val}'. Must be an integer.")
+                context.add_parameter("page_size", {
+                    "value": int_val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.page_size",
+                    "param_uri": "org.infobim.domain.ifc.input.output.page_size"
+                })
+                context.clear_parameters(["--page-size", val])
+            else:
+                raise ValueError("Missing value for --page-size. Must be an integer.")
+            
+        return context
+
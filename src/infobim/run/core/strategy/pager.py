@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class PagerStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--pager" in unprocessed_args:
+            context.add_parameter("pager", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.pager",
+                "param_uri": "org.infobim.domain.ifc.input.output.pager"
+            })
+            context.clear_parameters(["--pager"])
+
+        return context
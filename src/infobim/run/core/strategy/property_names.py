@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class PropertyNameStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--property" in unprocessed_args:
+            idx = unprocessed_args.index("--property")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("property_names", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.property_names",
+                    "param_uri": "org.infobim.domain.ifc.input.property.name"
+                })
+                context.clear_parameters(["--property", val])
+            else:
+                raise ValueError("Missing value for --property.")
+            
+        return context
+
@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class PsetNameStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--pset" in unprocessed_args:
+            idx = unprocessed_args.index("--pset")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("pset_names", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.pset_names",
+                    "param_uri": "org.infobim.domain.ifc.input.pset.name"
+                })
+                context.clear_parameters(["--pset", val])
+            else:
+                raise ValueError("Missing value for --pset.")
+            
+        return context
+
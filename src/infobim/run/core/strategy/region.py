@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class RegionStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--region" in unprocessed_args:
+            idx = unprocessed_args.index("--region")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("region", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.region",
+                    "param_uri": "org.infobim.domain.ifc.input.bbox.region"
+                })
+                context.clear_parameters(["--region", val])
+            else:
+                raise ValueError("Missing value for --region.")
+            
+        return context
+
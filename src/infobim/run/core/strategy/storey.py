@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class StoreyStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--storey" in unprocessed_args:
+            idx = unprocessed_args.index("--storey")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("storey", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.storey",
+                    "param_uri": "org.infobim.domain.ifc.input.storey"
+                })
+                context.clear_parameters(["--storey", val])
+            else:
+                raise ValueError("Missing value for --storey.")
+            
+        return context
+
@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class StreamStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--stream" in unprocessed_args:
+            context.add_parameter("stream", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.stream",
+                "param_uri": "org.infobim.domain.ifc.input.output.stream"
+            })
+            context.clear_parameters(["--stream"])
+
+        return context
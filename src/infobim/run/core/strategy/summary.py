@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class SummaryStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--summary" in unprocessed_args:
+            context.add_parameter("summary", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.summary",
+                "param_uri": "org.infobim.domain.ifc.input.output.summary"
+            })
+            context.clear_parameters(["--summary"])
+
+        return context
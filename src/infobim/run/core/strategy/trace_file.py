@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class TraceFileStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--trace-file" in unprocessed_args:
+            idx = unprocessed_args.index("--trace-file")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("trace_file", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.trace_file",
+                    "param_uri": "org.infobim.domain.ifc.input.trace_file"
+                })
+                context.clear_parameters(["--trace-file", val])
+            else:
+                raise ValueError("Missing value for --trace-file.")
+            
+        return context
+
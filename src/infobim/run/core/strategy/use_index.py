@@ -0,0 +1,17 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class UseIndexStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--use-index" in unprocessed_args:
+            context.add_parameter("use_index", {
+                "value": True,
+                "uri": "org.infobim.domain.context.strategy.parameter.use_index",
+                "param_uri": "org.infobim.domain.ifc.input.step_index"
+            })
+            context.clear_parameters(["--use-index"])
+
+        return context
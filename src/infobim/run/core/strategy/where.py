@@ -0,0 +1,23 @@
+
+from ontobdc.run.core.port.contex import CliContextStrategyPort, CliContextPort
+
+
+class WhereStrategy(CliContextStrategyPort):
+    def execute(self, context: CliContextPort) -> CliContextPort:
+        unprocessed_args = context.unprocessed_args
+
+        if "--where" in unprocessed_args:
+            idx = unprocessed_args.index("--where")
+            if idx + 1 < len(unprocessed_args):
+                val = unprocessed_args[idx + 1]
+                context.add_parameter("where", {
+                    "value": val, 
+                    "uri": "org.infobim.domain.context.strategy.parameter.where",
+                    "param_uri": "org.infobim.domain.ifc.input.query.where"
+                })
+                context.clear_parameters(["--where", val])
+            else:
+                raise ValueError("Missing value for --where.")
+            
+        return context
+
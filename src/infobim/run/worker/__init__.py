@@ -0,0 +1,58 @@
+import os
+import stat
+import tempfile
+
+
+SOCKET_ENV = "INFOBIM_WORKER_SOCKET"
+DISABLE_ENV = "INFOBIM_NO_WORKER"
+
+
+def get_private_dir() -> str:
+    """
+    Returns the per-user directory holding the worker socket when $XDG_RUNTIME_DIR is not set.
+    """
+    return os.path.join(tempfile.gettempdir(), f"infobim-{os.getuid()}")
+
+
+def get_socket_path() -> str:
+    """
+    Returns the Unix socket path used by the resident worker: $INFOBIM_WORKER_SOCKET,
+    else a socket in $XDG_RUNTIME_DIR, else one in the private directory.
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "infobim-worker.sock")
+    return os.path.join(get_private_dir(), "worker.sock")
+
+
+def ensure_private_dir() -> str:
+    """
+    Creates the private directory (mode 0700) if missing. Raises RuntimeError when the
+    path is not a directory owned by the current user and closed to everyone else.
+    """
+    path = get_private_dir()
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f"{path} must be a directory owned by the current user with mode 0700.")
+    return path
+
+
+def is_own_socket(path: str) -> bool:
+    """
+    Checks that the path is a Unix socket owned by the current user.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+__all__ = ["get_socket_path", "get_private_dir", "ensure_private_dir", "is_own_socket", "SOCKET_ENV", "DISABLE_ENV"]
@@ -0,0 +1,114 @@
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+# Capabilities whose results the worker keeps, refreshed by the watcher
+CACHEABLE_CAPABILITIES = (
+    "org.infobim.domain.ifc.capability.list_elements",
+    "org.infobim.domain.ifc.capability.list_buildings",
+)
+
+# Budget for the results kept in memory, in megabytes (measured as their JSON size)
+DEFAULT_RESULTS_BUDGET_MB = 256
+RESULTS_BUDGET_ENV = "INFOBIM_WORKER_RESULTS_MB"
+
+# Parameters with side effects or per-run output; runs using them are not cached
+# (--no-cache also bypasses the persistent result cache, see util/result_cache.py)
+UNCACHED_PARAMETERS = ("diagnostics", "trace_file", "export_path", "stream", "pager", "no_cache")
+
+
+# Parameters left out of the key: the file itself is keyed by its real path, however it
+# was spelled, and ontobdc's repository (always the working directory) is not an IFC input
+UNKEYED_PARAMETERS = ("ifc_path", "repository")
+
+
+def get_parameters_key(context: Any) -> Tuple[Tuple[str, str], ...]:
+    parameters = getattr(context, "parameters", {})
+    return tuple(sorted((name, repr(p.get("value"))) for name, p in parameters.items() if name not in UNKEYED_PARAMETERS))
+
+
+class ResultCache:
+    """
+    In-memory cache of capability results, keyed by the capability, its parameters
+    and the (path, mtime, size) of the IFC file, so a changed file is never served stale.
+    Results are evicted least recently used first once their total JSON size exceeds
+    the budget.
+    """
+
+    def __init__(self, budget: Optional[int] = None):
+        if budget is None:
+            budget = int(float(os.environ.get(RESULTS_BUDGET_ENV, DEFAULT_RESULTS_BUDGET_MB)) * 1024 * 1024)
+        self.budget = budget
+        self._results: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_key(self, capability_id: str, context: Any) -> Optional[Tuple[Any, ...]]:
+        if capability_id not in CACHEABLE_CAPABILITIES:
+            return None
+        if any(context.get_parameter_value(name) for name in UNCACHED_PARAMETERS):
+            return None
+        ifc_path = context.get_parameter_value("ifc_path")
+        # Directory and glob runs depend on many files; they are not cached
+        if not ifc_path or not os.path.isfile(ifc_path):
+            return None
+        try:
+            stat = os.stat(ifc_path)
+        except OSError:
+            return None
+        return (capability_id, os.path.realpath(ifc_path), stat.st_mtime_ns, stat.st_size, get_parameters_key(context))
+
+    def get(self, key: Optional[Tuple[Any, ...]]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Optional[Tuple[Any, ...]], result: Dict[str, Any]) -> None:
+        if key is None:
+            return
+        # Streamed content can only be consumed once
+        if any(isinstance(v, Iterator) for v in result.values()):
+            return
+        cost = len(json.dumps(result, default=str))
+        if cost > self.budget:
+            return
+        with self._lock:
+            # Results of older revisions of the file are never served again
+            for stale_key in [k for k in self._results if k[1] == key[1] and k[2:4] != key[2:4]]:
+                self._remove(stale_key)
+            if key in self._results:
+                self._remove(key)
+            self._results[key] = (result, cost)
+            self._size += cost
+            while self._size > self.budget:
+                self._remove(next(iter(self._results)))
+                self.evictions += 1
+
+    def invalidate(self, ifc_path: str) -> int:
+        """
+        Drops every result computed from the file. Returns the number of dropped results.
+        """
+        real_path = os.path.realpath(ifc_path)
+        with self._lock:
+            stale = [key for key in self._results if key[1] == real_path]
+            for key in stale:
+                self._remove(key)
+        return len(stale)
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        _, cost = self._results.pop(key)
+        self._size -= cost
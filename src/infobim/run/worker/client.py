@@ -0,0 +1,97 @@
+
+import os
+import sys
+import json
+import socket
+from typing import Any, Dict, List, Optional
+from infobim.run.worker import get_socket_path, is_own_socket, DISABLE_ENV
+
+
+# Flags whose values are file system paths, made absolute before forwarding
+PATH_FLAGS = ["--ifc-path", "--directory", "--trace-file", "--output-file", "--export-columns"]
+
+
+def is_worker_running(socket_path: Optional[str] = None) -> bool:
+    """
+    Checks whether a worker of the current user accepts connections on the socket.
+    """
+    socket_path = socket_path or get_socket_path()
+    if not is_own_socket(socket_path):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def _absolute_paths(argv: List[str]) -> List[str]:
+    argv = list(argv)
+    for i, arg in enumerate(argv[:-1]):
+        if arg in PATH_FLAGS:
+            argv[i + 1] = os.path.abspath(argv[i + 1])
+    return argv
+
+
+def _request(payload: Dict[str, Any], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Sends one request to the resident worker and relays its output.
+    Returns the exit code, or None when no worker could handle the request.
+    """
+    socket_path = socket_path or get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+    # Requests carry file paths and receive output: only talk to our own worker
+    if not is_own_socket(socket_path):
+        print(f"Ignoring {socket_path}: not a socket owned by the current user.", file=sys.stderr)
+        return None
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    except OSError:
+        return None
+
+    with sock:
+        request = json.dumps(payload) + "\n"
+        sock.sendall(request.encode("utf-8"))
+
+        with sock.makefile("rb") as rfile:
+            for line in rfile:
+                frame = json.loads(line.decode("utf-8"))
+                if "out" in frame:
+                    sys.stdout.write(frame["out"])
+                    sys.stdout.flush()
+                elif "err" in frame:
+                    sys.stderr.write(frame["err"])
+                    sys.stderr.flush()
+                elif "fallback" in frame:
+                    return None
+                elif "exit" in frame:
+                    return int(frame["exit"])
+
+    # Connection dropped before the worker reported an exit code
+    return 1
+
+
+def forward(argv: List[str], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Forwards a CLI invocation to the resident worker and relays its output.
+    Returns the exit code, or None when no worker could handle the request.
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    if not argv or argv[0] != "run" or "--id" not in argv:
+        return None
+    return _request({"argv": _absolute_paths(argv)}, socket_path)
+
+
+def forward_batch(requests: List[List[str]], socket_path: Optional[str] = None) -> Optional[int]:
+    """
+    Forwards several capability runs to the resident worker, which runs them concurrently.
+    Returns the exit code, or None when no worker is available.
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    return _request({"batch": [_absolute_paths(args) for args in requests]}, socket_path)
@@ -0,0 +1,39 @@
+
+from typing import Any, Dict, List, Optional
+
+
+class WorkerContext:
+    """
+    Minimal CLI context used by the resident worker.
+
+    It offers the subset of the ontobdc CliContextPort interface used by the
+    InfoBIM strategies and capabilities, so the same strategies parse the
+    forwarded arguments inside the worker.
+    """
+
+    def __init__(self, args: List[str]):
+        self.unprocessed_args: List[str] = list(args)
+        self.parameters: Dict[str, Dict[str, Any]] = {}
+
+    def add_parameter(self, name: str, parameter: Dict[str, Any]) -> None:
+        self.parameters[name] = parameter
+
+    def get_parameter(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.parameters.get(name)
+
+    def get_parameter_value(self, name: str) -> Optional[Any]:
+        parameter = self.parameters.get(name)
+        if parameter is None:
+            return None
+        return parameter.get("value")
+
+    def clear_parameters(self, args: List[str]) -> None:
+        # Remove the first occurrence of the consumed flag/value sequence
+        n = len(args)
+        for i in range(len(self.unprocessed_args) - n + 1):
+            if self.unprocessed_args[i:i + n] == list(args):
+                del self.unprocessed_args[i:i + n]
+                return
+        for arg in args:
+            if arg in self.unprocessed_args:
+                self.unprocessed_args.remove(arg)
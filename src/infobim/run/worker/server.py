@@ -0,0 +1,390 @@
+
+import io
+import os
+import sys
+import json
+import signal
+import inspect
+import pkgutil
+import importlib
+import threading
+import socketserver
+from concurrent.futures import Future
+from contextvars import copy_context
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from infobim.run.worker import ensure_private_dir, get_private_dir, get_socket_path
+from infobim.module.ifc.util.executor import ConcurrentCapabilityExecutor
+from infobim.module.ifc.util.result_cache import NO_CACHE_PARAMETER, get_result_cache, get_result_key
+from infobim.run.worker.cache import ResultCache
+from infobim.run.worker.context import WorkerContext
+
+
+class _ThreadStream(io.TextIOBase):
+    """
+    Stand-in for sys.stdout/sys.stderr that routes writes to the stream bound
+    to the current thread, so concurrent requests do not mix their output.
+    """
+
+    def __init__(self, fallback: Any):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def bind(self, stream: Optional[Any]) -> None:
+        self._local.stream = stream
+
+    def _target(self) -> Any:
+        return getattr(self._local, "stream", None) or self._fallback
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _FrameWriter(io.TextIOBase):
+    """
+    Text stream that forwards every write to the client as a JSON frame.
+    """
+
+    def __init__(self, wfile: Any, channel: str):
+        self._wfile = wfile
+        self._channel = channel
+
+    def write(self, s: str) -> int:
+        if s:
+            send_frame(self._wfile, {self._channel: s})
+        return len(s)
+
+    def flush(self) -> None:
+        self._wfile.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+
+def send_frame(wfile: Any, frame: Dict[str, Any]) -> None:
+    wfile.write((json.dumps(frame) + "\n").encode("utf-8"))
+
+
+def load_strategies() -> List[Any]:
+    """
+    Instantiates the CLI context strategies in the order the regular CLI runs them:
+    ontobdc's built-in strategies (--export, --json, --limit, ...), then those
+    shipped in infobim.run.core.strategy.
+    """
+    from ontobdc.run.core.port.contex import CliContextStrategyPort
+    import ontobdc.run.core.strategy as builtin_package
+    import infobim.run.core.strategy as strategy_package
+
+    strategies = []
+    for package in (builtin_package, strategy_package):
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+            for _, obj in inspect.getmembers(module, inspect.isclass):
+                if issubclass(obj, CliContextStrategyPort) and obj is not CliContextStrategyPort and obj.__module__ == module.__name__:
+                    strategies.append(obj())
+    return strategies
+
+
+def get_output_format(context: Any) -> str:
+    # As in ontobdc's run: --export json|rich picks the renderer format
+    return context.get_parameter_value("export") or "rich"
+
+
+def load_capabilities() -> Dict[str, Any]:
+    """
+    Returns the manifest entries of the InfoBIM capabilities indexed by their metadata id.
+    Capability modules are only imported when a request runs them.
+    """
+    from infobim.module.ifc.plugin.manifest import get_capability_entries
+
+    return {entry["metadata"]["id"]: entry for entry in get_capability_entries()}
+
+
+class CapabilityWorker:
+    """
+    Executes forwarded `run` requests with capabilities and models kept warm.
+    """
+
+    def __init__(self):
+        self.capabilities = load_capabilities()
+        self._capability_classes: Dict[str, Any] = {}
+        self.strategies = load_strategies()
+        self.results = ResultCache()
+        # Single and batched requests go through the same executor, which checks
+        # their inputs as the CLI does
+        self.executor = ConcurrentCapabilityExecutor()
+
+    def can_handle(self, argv: List[str]) -> bool:
+        return len(argv) > 2 and argv[0] == "run" and "--id" in argv
+
+    def handle(self, argv: List[str], stdout: Any, stderr: Any) -> Optional[int]:
+        """
+        Runs a forwarded command. Returns the exit code, or None when the request
+        must be handled by the regular CLI instead.
+        """
+        if not self.can_handle(argv):
+            return None
+
+        prepared = self.prepare(argv[1:])
+        if prepared is None:
+            return None
+        capability, result = self.run_prepared(*prepared)
+
+        from rich.console import Console
+
+        console = Console(file=stdout, force_terminal=False, width=160)
+        self.render(console, capability, result, get_output_format(prepared[2]))
+        return 0
+
+    def handle_cached(self, argv: List[str]) -> Optional[int]:
+        """
+        Prints the result of a `run` request from the persistent result cache, without
+        loading the model. Returns None when the request has no cached result.
+        """
+        if not self.can_handle(argv):
+            return None
+
+        prepared = self.prepare(argv[1:])
+        if prepared is None:
+            return None
+        _, capability_class, context = prepared
+        if context.get_parameter_value(NO_CACHE_PARAMETER):
+            return None
+        result = get_result_cache().get(get_result_key(capability_class.METADATA, context))
+        if result is None:
+            return None
+
+        from rich.console import Console
+
+        self.render(Console(), capability_class(), result, get_output_format(context))
+        return 0
+
+    def render(self, console: Any, capability: Any, result: Dict[str, Any], output_format: str) -> None:
+        renderer = capability.get_default_cli_renderer()
+        if renderer is not None:
+            renderer.render(console, result, output_format)
+        else:
+            console.print(result)
+
+    def get_capability_class(self, capability_id: str) -> Optional[Any]:
+        capability_class = self._capability_classes.get(capability_id)
+        if capability_class is None:
+            entry = self.capabilities.get(capability_id)
+            if entry is None:
+                return None
+            from infobim.module.ifc.plugin.manifest import load_class
+
+            capability_class = self._capability_classes[capability_id] = load_class(entry)
+        return capability_class
+
+    def prepare(self, args: List[str]) -> Optional[Tuple[str, Any, Any]]:
+        """
+        Resolves --id and parses the remaining arguments with the CLI strategies.
+        Returns (capability id, capability class, context), or None when the
+        arguments are not understood here.
+        """
+        if "--id" not in args:
+            return None
+        args = list(args)
+        idx = args.index("--id")
+        if idx + 1 >= len(args):
+            return None
+        capability_id = args[idx + 1]
+        del args[idx:idx + 2]
+
+        capability_class = self.get_capability_class(capability_id)
+        if capability_class is None:
+            return None
+
+        context = WorkerContext(args)
+        for strategy in self.strategies:
+            context = strategy.execute(context)
+
+        if context.unprocessed_args or context.get_parameter_value("help"):
+            # Unknown flags and help are left for the full CLI to interpret
+            return None
+        return capability_id, capability_class, context
+
+    def execute(self, args: List[str]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Runs the capability selected by --id with the remaining arguments, serving
+        cached results when possible. Returns (capability, result), or None when the
+        arguments are not understood here.
+        """
+        prepared = self.prepare(args)
+        if prepared is None:
+            return None
+        return self.run_prepared(*prepared)
+
+    def run_prepared(self, capability_id: str, capability_class: Any, context: Any) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Runs a prepared request, serving cached results when possible. Returns (capability, result).
+        """
+        capability = capability_class()
+        key = self.results.get_key(capability_id, context)
+        result = self.results.get(key)
+        if result is None:
+            result = self.executor.execute(capability, context)
+            self.results.put(key, result)
+        return capability, result
+
+    def execute_batch(self, requests: List[List[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Runs several capability requests concurrently over shared models and yields
+        one record per request, in request order: {"id", "result"} or {"id", "error"}.
+        """
+        pending = []
+        for args in requests:
+            args = list(args[1:] if args and args[0] == "run" else args)
+            try:
+                # Strategies set per-run output options; keep them out of this thread
+                prepared = copy_context().run(self.prepare, args)
+            except Exception as e:
+                pending.append((None, None, e))
+                continue
+            if prepared is None:
+                pending.append((None, None, ValueError(f"Unsupported request: {' '.join(args)}")))
+                continue
+
+            capability_id, capability_class, context = prepared
+            key = self.results.get_key(capability_id, context)
+            result = self.results.get(key)
+            if result is not None:
+                pending.append((capability_id, None, result))
+            else:
+                pending.append((capability_id, key, self.executor.submit(capability_class(), context)))
+
+        for capability_id, key, outcome in pending:
+            record: Dict[str, Any] = {"id": capability_id}
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                if isinstance(outcome, Future):
+                    outcome = outcome.result()
+                    self.results.put(key, outcome)
+                record["result"] = outcome
+            except Exception as e:
+                record["error"] = str(e)
+            yield record
+
+    def handle_batch(self, requests: List[List[str]], stdout: Any) -> int:
+        """
+        Runs a batch request and writes one compact JSON record per line.
+        Returns 1 when any request failed.
+        """
+        from infobim.module.ifc.adapter.renderer.output import write_ndjson
+
+        failed = []
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for record in self.execute_batch(requests):
+                if "error" in record:
+                    failed.append(record)
+                yield record
+
+        write_ndjson(records(), stdout)
+        return 1 if failed else 0
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line.decode("utf-8"))
+            argv = [str(a) for a in request.get("argv", [])]
+            batch = [[str(a) for a in args] for args in request.get("batch") or []]
+        except (ValueError, AttributeError, TypeError):
+            send_frame(self.wfile, {"err": "Invalid worker request.\n"})
+            send_frame(self.wfile, {"exit": 2})
+            return
+
+        stdout = _FrameWriter(self.wfile, "out")
+        stderr = _FrameWriter(self.wfile, "err")
+        sys.stdout.bind(stdout)
+        sys.stderr.bind(stderr)
+        try:
+            if batch:
+                code = self.server.worker.handle_batch(batch, stdout)
+            else:
+                code = self.server.worker.handle(argv, stdout, stderr)
+            if code is None:
+                send_frame(self.wfile, {"fallback": True})
+                return
+        except Exception as e:
+            stderr.write(f"Error: {e}\n")
+            code = 1
+        finally:
+            sys.stdout.bind(None)
+            sys.stderr.bind(None)
+
+        send_frame(self.wfile, {"exit": code})
+
+
+class WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, worker: CapabilityWorker):
+        self.worker = worker
+        super().__init__(socket_path, _RequestHandler)
+
+
+def serve(socket_path: Optional[str] = None, watch_directory: Optional[str] = None,
+          watch_interval: Optional[float] = None) -> None:
+    """
+    Runs the resident worker in the foreground until interrupted.
+    With `watch_directory`, new or changed IFC files there are parsed and indexed ahead of queries.
+    """
+    socket_path = socket_path or get_socket_path()
+    if os.path.dirname(socket_path) == get_private_dir():
+        ensure_private_dir()
+
+    if os.path.exists(socket_path):
+        from infobim.run.worker.client import is_worker_running
+        if is_worker_running(socket_path):
+            raise RuntimeError(f"A worker is already listening on {socket_path}.")
+        os.unlink(socket_path)
+
+    worker = CapabilityWorker()
+
+    sys.stdout = _ThreadStream(sys.stdout)
+    sys.stderr = _ThreadStream(sys.stderr)
+
+    # The socket is created 0600: no window where other users can connect
+    umask = os.umask(0o177)
+    try:
+        server = WorkerServer(socket_path, worker)
+    finally:
+        os.umask(umask)
+
+    def _shutdown(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    watcher = None
+    if watch_directory:
+        from infobim.run.worker.watch import DEFAULT_WATCH_INTERVAL, DirectoryWatcher
+        watcher = DirectoryWatcher(watch_directory, worker, watch_interval or DEFAULT_WATCH_INTERVAL)
+        watcher.start()
+        print(f"Watching {watcher.directory} for IFC files", file=sys.stderr)
+
+    print(f"InfoBIM worker listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        server.server_close()
+        worker.executor.shutdown(wait=False)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -0,0 +1,89 @@
+
+import os
+import sys
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_WATCH_DIRECTORY = os.path.join("data", "incoming")
+DEFAULT_WATCH_INTERVAL = 2.0
+
+# Requests recomputed for every new or changed model, so the first query is warm
+WARM_REQUESTS = [
+    ["--id", "org.infobim.domain.ifc.capability.list_elements"],
+    ["--id", "org.infobim.domain.ifc.capability.list_buildings"],
+]
+
+
+class DirectoryWatcher(threading.Thread):
+    """
+    Polls a directory for new or changed IFC files (by mtime and size) and warms them
+    in the worker: cached results are dropped, the model is parsed, its indexes are
+    built and the default listings are recomputed.
+
+    A file is picked up once its size and mtime are unchanged across two polls,
+    so uploads still being written are not parsed half-way.
+    """
+
+    def __init__(self, directory: str, worker: Any, interval: float = DEFAULT_WATCH_INTERVAL):
+        super().__init__(name="infobim-watch", daemon=True)
+        self.directory = os.path.abspath(directory)
+        self.worker = worker
+        self.interval = interval
+        self._known: Dict[str, Tuple[int, int]] = {}
+        self._pending: Dict[str, Tuple[int, int]] = {}
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Watch error: {e}", file=sys.stderr)
+            self._stop.wait(self.interval)
+
+    def poll(self) -> None:
+        from infobim.module.ifc.util.scan import find_ifc_files
+
+        current: Dict[str, Tuple[int, int]] = {}
+        if os.path.isdir(self.directory):
+            for path in find_ifc_files(self.directory):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                current[path] = (stat.st_mtime_ns, stat.st_size)
+
+        for path in [p for p in self._known if p not in current]:
+            del self._known[path]
+            self.worker.results.invalidate(path)
+
+        for path, signature in current.items():
+            if self._known.get(path) == signature:
+                continue
+            if self._pending.get(path) != signature:
+                # Seen for the first time (or still changing): wait for the next poll
+                self._pending[path] = signature
+                continue
+            del self._pending[path]
+            self._known[path] = signature
+            self.warm(path)
+
+    def warm(self, path: str) -> Optional[Dict[str, float]]:
+        from infobim.module.ifc.util.warm import warm_model
+
+        self.worker.results.invalidate(path)
+        try:
+            timings = warm_model(path)
+            for request in WARM_REQUESTS:
+                self.worker.execute(list(request) + ["--ifc-path", path])
+        except Exception as e:
+            print(f"Could not warm {path}: {e}", file=sys.stderr)
+            return None
+
+        total = sum(timings.values())
+        print(f"Warmed {path} in {total / 1000.0:.1f} s", file=sys.stderr)
+        return timings